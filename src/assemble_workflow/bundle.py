@@ -7,8 +7,6 @@
 import errno
 import logging
 import os
-import shutil
-import subprocess
 from abc import ABC, abstractmethod
 from typing import Any, List
 
@@ -17,7 +15,10 @@ from assemble_workflow.dist import Dist
 from assemble_workflow.dists import Dists
 from manifests.build_manifest import BuildComponent, BuildComponents, BuildManifest
 from paths.script_finder import ScriptFinder
+from system import subprocess_runner
+from system.file_materializer import FileMaterializer
 from system.temporary_directory import TemporaryDirectory
+from system.tracer import Tracer
 
 """
 This class is responsible for executing the build of the full bundle and passing results to a bundle recorder.
@@ -45,6 +46,7 @@ class Bundle(ABC):
         self.artifacts_dir = artifacts_dir
         self.bundle_recorder = bundle_recorder
         self.tmp_dir = TemporaryDirectory(keep=keep)
+        self.materializer = FileMaterializer()
         self.min_bundle = self.__get_min_bundle(build_manifest.components)
         self.min_dist = self.__get_min_dist(build_manifest.components)
         self.installed_plugins: List[str] = []
@@ -66,22 +68,30 @@ class Bundle(ABC):
                 ]
             )
         )
-        self._execute(install_command)
+        with Tracer.default().span("install min", dist=self.min_dist.name):
+            self._execute(install_command)
 
     def install_components(self) -> None:
+        plugins: List[BuildComponent] = []
         for c in self.components.values():
             if self.min_bundle == c:
                 pass
             elif "plugins" in c.artifacts:
-                logging.info(f"Installing {c.name}")
-                self.install_plugin(c)
+                plugins.append(c)
             else:
                 logging.info(f"Recording {c.name}")
                 self.bundle_recorder.record_component(c)
+        with Tracer.default().span("install plugins", plugins=len(plugins)):
+            self.install_plugins(plugins)
         plugins_path = os.path.join(self.min_dist.archive_path, "plugins")
         if os.path.isdir(plugins_path):
             self.installed_plugins = os.listdir(plugins_path)
 
+    def install_plugins(self, plugins: List[BuildComponent]) -> None:
+        for plugin in plugins:
+            logging.info(f"Installing {plugin.name}")
+            self.install_plugin(plugin)
+
     @abstractmethod
     def install_plugin(self, plugin: BuildComponent) -> None:
         install_script = ScriptFinder.find_install_script(plugin.name)
@@ -99,11 +109,12 @@ class Bundle(ABC):
         self._execute(install_command)
 
     def package(self, dest: str) -> None:
-        self.min_dist.build(self.bundle_recorder.package_name, dest)
+        with Tracer.default().span("package", package=self.bundle_recorder.package_name):
+            self.min_dist.build(self.bundle_recorder.package_name, dest)
 
     def _execute(self, command: str) -> None:
         logging.info(f'Executing "{command}" in {self.min_dist.archive_path}')
-        subprocess.check_call(command, cwd=self.min_dist.archive_path, shell=True)
+        subprocess_runner.check_call(command, cwd=self.min_dist.archive_path, shell=True)
 
     def _copy_component(self, component: BuildComponent, component_type: str) -> str:
         rel_path = self.__get_rel_path(component, component_type)
@@ -111,19 +122,31 @@ class Bundle(ABC):
         self.bundle_recorder.record_component(component, rel_path)
         return tmp_path
 
+    def _find_component(self, component: BuildComponent, component_type: str) -> str:
+        rel_path = self.__get_rel_path(component, component_type)
+        local_path = self.__get_local_path(rel_path)
+        self.bundle_recorder.record_component(component, rel_path)
+        return local_path
+
     def __get_rel_path(self, component: BuildComponent, component_type: str) -> str:
         return next(iter(component.artifacts.get(component_type, [])), None)
 
-    def __copy_component_files(self, rel_path: str, dest: str) -> str:
+    def __get_local_path(self, rel_path: str) -> str:
         local_path = os.path.join(self.artifacts_dir, rel_path)
-        dest_path = os.path.join(dest, os.path.basename(local_path))
         if os.path.isfile(local_path):
-            # rel path provided, in this case we copy it into dest
-            shutil.copyfile(local_path, dest_path)
-            return os.path.join(dest, os.path.basename(local_path))
+            return local_path
         else:
             raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), local_path)
 
+    def __copy_component_files(self, rel_path: str, dest: str) -> str:
+        local_path = self.__get_local_path(rel_path)
+        dest_path = os.path.join(dest, os.path.basename(local_path))
+        # rel path provided, in this case we link or copy it into dest
+        with Tracer.default().span("copy", path=rel_path) as span:
+            self.materializer.materialize(local_path, dest_path)
+            span.add_file(dest_path)
+        return dest_path
+
     def __get_min_bundle(self, build_components: BuildComponents) -> BuildComponent:
         min_bundle = next(iter([c for c in build_components.values() if "dist" in c.artifacts]), None)
         if min_bundle is None:
@@ -131,8 +154,9 @@ class Bundle(ABC):
         return min_bundle
 
     def __get_min_dist(self, build_components: BuildComponents) -> Dist:
-        min_dist_path = self._copy_component(self.min_bundle, "dist")
-        logging.info(f"Copied min bundle to {min_dist_path}.")
+        # the min bundle is extracted straight from the artifacts directory, without copying it first
+        min_dist_path = self._find_component(self.min_bundle, "dist")
+        logging.info(f"Found min bundle in {min_dist_path}.")
         min_path = f"{self.build.filename}-{self.build.version}".replace("-SNAPSHOT", "")
         logging.info(f"Start creating distribution {self.build.distribution} for {self.min_bundle.name}.")
         min_dist = Dists.create_dist(self.min_bundle.name, min_dist_path, min_path, self.build)
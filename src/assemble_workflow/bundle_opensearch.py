@@ -4,7 +4,9 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import logging
 import os
+from typing import List
 
 from assemble_workflow.bundle import Bundle
 from manifests.build_manifest import BuildComponent
@@ -16,6 +18,20 @@ class BundleOpenSearch(Bundle):
     def install_plugin_script(self) -> str:
         return "opensearch-plugin.bat" if current_platform() == "windows" else "opensearch-plugin"
 
+    def install_plugins(self, plugins: List[BuildComponent]) -> None:
+        '''
+        Install all plugins with a single invocation of the plugin CLI, which starts a JVM only once,
+        then run the install script of each plugin in order.
+        '''
+        if not plugins:
+            return
+        logging.info(f"Installing {', '.join(plugin.name for plugin in plugins)}")
+        local_paths = [self._find_component(plugin, "plugins") for plugin in plugins]
+        cli_path = os.path.join(self.min_dist.archive_path, "bin", self.install_plugin_script)
+        self._execute(" ".join([f"{cli_path} install --batch"] + [f"file:{local_path}" for local_path in local_paths]))
+        for plugin in plugins:
+            super().install_plugin(plugin)
+
     def install_plugin(self, plugin: BuildComponent) -> None:
         tmp_path = self._copy_component(plugin, "plugins")
         cli_path = os.path.join(self.min_dist.archive_path, "bin", self.install_plugin_script)
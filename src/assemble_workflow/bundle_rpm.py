@@ -10,6 +10,7 @@ import shutil
 import subprocess
 
 from manifests.build_manifest import BuildManifest
+from system import subprocess_runner
 from system.os import rpm_architecture
 
 
@@ -30,7 +31,7 @@ class BundleRpm:
         # Convert rpm to cpio so we can extract the content
         logging.info(f"Convert rpm to cpio for extraction: {self.package_path} to {cpio_path}")
         with open(cpio_path, 'wb') as fp:
-            subprocess.check_call(
+            subprocess_runner.check_call(
                 [
                     'rpm2cpio',
                     self.package_path,
@@ -42,7 +43,7 @@ class BundleRpm:
         # Extract cpio archive based on the rpm package
         logging.info(f"Extract cpio {cpio_path} content to {dest}")
         with open(cpio_path, 'rb') as fp:
-            subprocess.check_call(
+            subprocess_runner.check_call(
                 [
                     'cpio',
                     '-imdv',
@@ -91,12 +92,12 @@ class BundleRpm:
         )
 
         logging.info(f"Execute {bundle_cmd} in {ext_dest}")
-        subprocess.check_call(bundle_cmd, cwd=ext_dest, shell=True)
+        subprocess_runner.check_call(bundle_cmd, cwd=ext_dest, shell=True)
 
-        # Move artifact to repo root before being published to {dest}
+        # Move artifact to {dest}
         for dirpath, dirnames, filenames in os.walk(os.path.join(ext_dest, 'RPMS')):
             for filename in [file for file in filenames if file.endswith('.rpm')]:
                 bundle_artifact_path = os.path.join(dirpath, filename)
                 break
 
-        shutil.move(bundle_artifact_path, name)
+        shutil.move(bundle_artifact_path, os.path.join(dest, name))
@@ -9,11 +9,15 @@ import logging
 import os
 import shutil
 import tarfile
+import time
 import zipfile
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from assemble_workflow.bundle_rpm import BundleRpm
 from manifests.build_manifest import BuildManifest
+from system.parallel_gzip import ParallelGzipFile
+from system.tracer import Tracer
 from system.zip_file import ZipFile
 
 
@@ -72,27 +76,59 @@ class Dist(ABC):
             return path
 
     def extract(self, dest: str) -> str:
-        self.__extract__(dest)
+        with Tracer.default().span("extract", path=self.path) as span:
+            span.add_file(self.path)
+            self.__extract__(dest)
         self.archive_path = self.rename_archive_path(
             self.find_min_archive_path(dest)
         )
         return self.archive_path
 
+    @property
+    def source_date_epoch(self) -> Optional[int]:
+        '''
+        When SOURCE_DATE_EPOCH is set, all entries are timestamped with it, so that assembling identical inputs
+        produces byte-identical archives, see https://reproducible-builds.org/docs/source-date-epoch/.
+        '''
+        value = os.getenv("SOURCE_DATE_EPOCH")
+        return int(value) if value else None
+
     def build(self, name: str, dest: str) -> None:
-        self.__build__(name, dest)
         path = os.path.join(dest, name)
-        shutil.copyfile(name, path)
+        with Tracer.default().span("archive", archive=name) as span:
+            self.__build__(name, dest)
+            span.add_file(path)
         logging.info(f"Published {path}.")
 
 
 class DistTar(Dist):
     def __extract__(self, dest: str) -> None:
-        with tarfile.open(self.path, "r:gz") as tar:
+        # read the archive as a stream, in a single sequential pass
+        with tarfile.open(self.path, "r|gz") as tar:
             tar.extractall(dest)
 
+    def __normalize__(self, info: tarfile.TarInfo) -> tarfile.TarInfo:
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        if self.source_date_epoch is not None:
+            info.mtime = self.source_date_epoch
+        return info
+
     def __build__(self, name: str, dest: str) -> None:
-        with tarfile.open(name, "w:gz") as tar:
-            tar.add(self.archive_path, arcname=os.path.basename(self.archive_path))
+        # stream the tar through a multi-threaded gzip compressor into a .part file next to its destination,
+        # and only rename it once both the tar and the gzip stream are complete, so that a failed build leaves no truncated archive
+        # tarfile adds directory entries in sorted order, ownership is normalized by __normalize__
+        path = os.path.join(dest, name)
+        part_path = f"{path}.part"
+        try:
+            with ParallelGzipFile(part_path, compresslevel=9) as gz:
+                with tarfile.open(fileobj=gz, mode="w|", format=tarfile.GNU_FORMAT) as tar:
+                    tar.add(self.archive_path, arcname=os.path.basename(self.archive_path), filter=self.__normalize__)
+            os.replace(part_path, path)
+        except:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
 
 
 class DistZip(Dist):
@@ -101,12 +137,23 @@ class DistZip(Dist):
             zip.extractall(dest)
 
     def __build__(self, name: str, dest: str) -> None:
-        with ZipFile(name, "w", zipfile.ZIP_DEFLATED) as zip:
+        date_time = None
+        if self.source_date_epoch is not None:
+            # zip timestamps cannot predate 1980
+            date_time = max(time.gmtime(self.source_date_epoch)[0:6], (1980, 1, 1, 0, 0, 0))
+        with ZipFile(os.path.join(dest, name), "w", zipfile.ZIP_DEFLATED) as zip:
             rootlen = len(self.archive_path) + 1
-            for base, _, files in os.walk(self.archive_path):
-                for file in files:
+            for base, dirs, files in os.walk(self.archive_path):
+                dirs.sort()
+                for file in sorted(files):
                     fn = os.path.join(base, file)
-                    zip.write(fn, fn[rootlen:])
+                    info = zipfile.ZipInfo.from_file(fn, fn[rootlen:])
+                    if date_time:
+                        info.date_time = date_time
+                    # entries are deflated with the default zlib level
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with open(fn, "rb") as src, zip.open(info, "w") as dst:
+                        shutil.copyfileobj(src, dst)
 
 
 class DistRpm(Dist):
@@ -9,6 +9,8 @@ import logging
 import sys
 from typing import IO, List
 
+from build_workflow.build_cache import BuildCache
+
 
 class BuildArgs:
     SUPPORTED_PLATFORMS = ["linux", "darwin", "windows"]
@@ -25,6 +27,9 @@ class BuildArgs:
     platform: str
     architecture: str
     distribution: str
+    parallel: int
+    cache: bool
+    cache_dir: str
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Build an OpenSearch Distribution")
@@ -94,6 +99,27 @@ class BuildArgs:
             default="tar",
             dest="distribution"
         )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            default=False,
+            help="Restore components from, and store components in the build cache.",
+            dest="cache"
+        )
+        parser.add_argument(
+            "--cache-dir",
+            type=str,
+            help=f"Build cache directory, default is {BuildCache.default_path()}.",
+            default=BuildCache.default_path(),
+            dest="cache_dir"
+        )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=1,
+            help="Number of components to build concurrently, components wait for the core, for common-utils and job-scheduler, and for components listed in their depends_on.",
+            dest="parallel"
+        )
 
         args = parser.parse_args()
         self.logging_level = args.logging_level
@@ -105,6 +131,9 @@ class BuildArgs:
         self.platform = args.platform
         self.architecture = args.architecture
         self.distribution = args.distribution
+        self.parallel = args.parallel
+        self.cache = args.cache
+        self.cache_dir = args.cache_dir
         self.script_path = sys.argv[0].replace("/src/run_build.py", "/build.sh")
 
     def component_command(self, name: str) -> str:
@@ -7,6 +7,7 @@
 import os
 from abc import ABC, abstractmethod
 
+from build_workflow.build_artifact_index import BuildArtifactIndex
 from build_workflow.build_target import BuildTarget
 
 
@@ -16,8 +17,9 @@ class BuildArtifactCheck(ABC):
             self.path = path
             super().__init__(f"Artifact {os.path.basename(path)} is invalid. {message}")
 
-    def __init__(self, target: BuildTarget) -> None:
+    def __init__(self, target: BuildTarget, index: BuildArtifactIndex = None) -> None:
         self.target = target
+        self.index = index or BuildArtifactIndex.default()
 
     @abstractmethod
     def check(self, path: str) -> None:
@@ -4,12 +4,13 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from build_workflow.build_target import BuildTarget
 from build_workflow.opensearch.build_artifact_check_maven import BuildArtifactOpenSearchCheckMaven
 from build_workflow.opensearch.build_artifact_check_plugin import BuildArtifactOpenSearchCheckPlugin
 from build_workflow.opensearch_dashboards.build_artifact_check_plugin import BuildArtifactOpenSearchDashboardsCheckPlugin
+from system import thread_pool
 
 
 class BuildArtifactChecks:
@@ -40,3 +41,14 @@ class BuildArtifactChecks:
         instance = cls.create(target, artifact_type)
         if instance:
             instance.check(path)
+
+    @classmethod
+    def check_many(cls, target: BuildTarget, artifact_type: str, paths: List[str]) -> None:
+        """
+        Check artifacts of the same type on a thread pool, sharing one check and its metadata index.
+        Raises the error of the first artifact found to be invalid.
+        """
+        instance = cls.create(target, artifact_type)
+        if not instance or not paths:
+            return
+        thread_pool.run(instance.check, [(path,) for path in paths])
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from system.default_instance import DefaultInstance
+from system.file_digest import file_digest
+
+"""
+This class keeps the metadata that artifact checks extract from archives, e.g. the properties in a jar's META-INF/MANIFEST.MF
+or in a plugin's plugin-descriptor.properties, so that checking the same file again does not open and parse the archive again.
+Entries are keyed by the contents of the archive, i.e. its size and the digest of the name, CRC and size of every member listed in its
+zip central directory, and the name of the member that was read. Archives that are not zips are keyed by the digest of the whole file.
+When a path is given, or set in the BUILD_ARTIFACT_INDEX environment variable, entries are appended to that JSON lines file
+and reused by later builds on the same host, wherever they write the same archive. The file is compacted when it is loaded,
+keeping the last MAX_ENTRIES entries.
+"""
+
+
+class BuildArtifactIndex(DefaultInstance):
+    MAX_ENTRIES = 100000
+
+    # the end of central directory record of a zip, and the most it can be followed by, a comment
+    END_OF_CENTRAL_DIRECTORY = b"PK\x05\x06"
+    END_OF_CENTRAL_DIRECTORY_SIZE = 22
+    MAX_COMMENT_SIZE = 65535
+    CENTRAL_DIRECTORY_HEADER = b"PK\x01\x02"
+    CENTRAL_DIRECTORY_HEADER_SIZE = 46
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path
+        self.entries: Dict[Tuple[int, str, str], Any] = {}
+        # digests of the archives already seen by this process, by real path, size and modification time
+        self.digests: Dict[Tuple[str, int, int], str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if path and os.path.isfile(path):
+            self.__load()
+
+    @classmethod
+    def __create_default__(cls) -> 'BuildArtifactIndex':
+        return cls(os.getenv("BUILD_ARTIFACT_INDEX"))
+
+    def __load(self) -> None:
+        lines = 0
+        with open(self.path, "r") as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    key = (entry["size"], entry["digest"], entry["member"])
+                except (ValueError, KeyError):
+                    # a build may have been interrupted while appending, or the entry was written by an older version
+                    logging.warning(f"Ignoring invalid entry in {self.path}")
+                    continue
+                # entries appended last are kept
+                self.entries.pop(key, None)
+                self.entries[key] = entry["data"]
+        for key in list(self.entries)[:-self.MAX_ENTRIES]:
+            del self.entries[key]
+        if lines > len(self.entries):
+            self.__compact()
+        logging.info(f"Loaded {len(self.entries)} artifact metadata entries from {self.path}")
+
+    def __compact(self) -> None:
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            for key, data in self.entries.items():
+                f.write(self.__line(key, data))
+        os.replace(temp_path, self.path)
+
+    @classmethod
+    def __line(cls, key: Tuple[int, str, str], data: Any) -> str:
+        return json.dumps({"size": key[0], "digest": key[1], "member": key[2], "data": data}, sort_keys=True) + "\n"
+
+    @classmethod
+    def digest(cls, path: str) -> str:
+        """
+        The digest of the contents of the archive at path. For a zip, that of the name, CRC and size of its members,
+        which does not change when the same archive is written again at another time.
+        """
+        with open(path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            tail_size = min(size, cls.END_OF_CENTRAL_DIRECTORY_SIZE + cls.MAX_COMMENT_SIZE)
+            f.seek(size - tail_size)
+            tail = f.read(tail_size)
+            end = tail.rfind(cls.END_OF_CENTRAL_DIRECTORY)
+            if end >= 0 and end + cls.END_OF_CENTRAL_DIRECTORY_SIZE <= len(tail):
+                central_directory_size, central_directory_offset = struct.unpack("<II", tail[end + 12:end + 20])
+                # zip64 archives store the offset elsewhere
+                if central_directory_offset != 0xFFFFFFFF and central_directory_offset + central_directory_size <= size:
+                    f.seek(central_directory_offset)
+                    digest = cls.__members_digest(f.read(central_directory_size))
+                    if digest:
+                        return digest
+        return file_digest(path, "sha256")
+
+    @classmethod
+    def __members_digest(cls, central_directory: bytes) -> Optional[str]:
+        sha = hashlib.sha256()
+        offset = 0
+        while offset < len(central_directory):
+            header = central_directory[offset:offset + cls.CENTRAL_DIRECTORY_HEADER_SIZE]
+            if len(header) < cls.CENTRAL_DIRECTORY_HEADER_SIZE or not header.startswith(cls.CENTRAL_DIRECTORY_HEADER):
+                # not a central directory after all, digest the whole file
+                return None
+            crc, compressed_size, uncompressed_size, name_length, extra_length, comment_length = struct.unpack("<IIIHHH", header[16:34])
+            name = central_directory[offset + cls.CENTRAL_DIRECTORY_HEADER_SIZE:offset + cls.CENTRAL_DIRECTORY_HEADER_SIZE + name_length]
+            sha.update(struct.pack("<IIIH", crc, compressed_size, uncompressed_size, name_length) + name)
+            offset += cls.CENTRAL_DIRECTORY_HEADER_SIZE + name_length + extra_length + comment_length
+        return sha.hexdigest()
+
+    def get(self, path: str, member: str, load: Callable[[], Any]) -> Any:
+        """
+        Return the metadata extracted from member of the archive at path, calling load to extract it when the archive is not indexed.
+        The result of load must be serializable to JSON.
+        """
+        try:
+            stat = os.stat(path)
+            seen = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+            with self.lock:
+                digest = self.digests.get(seen)
+            if digest is None:
+                digest = self.digest(path)
+        except OSError:
+            # let load report a missing file
+            return load()
+        key = (stat.st_size, digest, member)
+        with self.lock:
+            self.digests[seen] = digest
+            if key in self.entries:
+                self.hits += 1
+                return self.entries[key]
+        data = load()
+        with self.lock:
+            self.misses += 1
+            self.entries[key] = data
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(self.__line(key, data))
+        return data
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from typing import Dict, Optional
+
+from build_workflow.build_target import BuildTarget
+from manifests.input_manifest import InputComponentFromSource
+from system.cache_directory import CacheDirectory
+from system.file_digest import file_digest
+
+"""
+This class is a local content-addressed cache of component build outputs.
+Entries are keyed by everything that determines the output of a component build: the component, its repository and resolved commit,
+the resolved commits of the core and of the other components it builds against, the build target, and the contents of the build script.
+Least recently used entries are evicted when the cache grows beyond `max_size` bytes, and entries not used for `max_age` seconds are removed.
+Outputs larger than `max_size` are not cached.
+"""
+
+
+class BuildCache(CacheDirectory):
+    MAX_SIZE = 20 * 1024 * 1024 * 1024
+    MAX_AGE = 14 * 24 * 60 * 60
+
+    def __init__(self, path: str, max_size: int = MAX_SIZE, max_age: int = MAX_AGE) -> None:
+        super().__init__(path, max_size, max_age)
+
+    @classmethod
+    def default_path(cls) -> str:
+        return os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "builds")
+
+    @classmethod
+    def key(cls, component: InputComponentFromSource, commit_id: str, target: BuildTarget, build_script: str, dependencies: Dict[str, str]) -> str:
+        data = {
+            "name": component.name,
+            "repository": component.repository,
+            "working_directory": component.working_directory,
+            "commit_id": commit_id,
+            "dependencies": dependencies,
+            "version": target.version,
+            "qualifier": target.qualifier,
+            "platform": target.platform,
+            "architecture": target.architecture,
+            "distribution": target.distribution,
+            "snapshot": target.snapshot,
+            "build_script": file_digest(build_script, "sha256"),
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.entry_path(key)
+        if not os.path.isdir(path):
+            logging.info(f"Build cache miss for {key}")
+            return None
+        # mark as recently used
+        os.utime(path)
+        logging.info(f"Build cache hit for {key} in {path}")
+        return path
+
+    def put(self, key: str, artifacts_path: str) -> Optional[str]:
+        path = self.entry_path(key)
+        size = self.size(artifacts_path)
+        if size > self.max_size:
+            logging.info(f"Not storing {artifacts_path} in build cache, its {size} bytes exceed the size of the cache")
+            return None
+        temp_path = os.path.join(self.path, f".{key}.{uuid.uuid4().hex}")
+        logging.info(f"Storing {artifacts_path} in build cache as {key}")
+        os.makedirs(self.path, exist_ok=True)
+        shutil.copytree(artifacts_path, temp_path)
+        try:
+            os.rename(temp_path, path)
+        except OSError:
+            # another build stored the same entry first
+            shutil.rmtree(temp_path, ignore_errors=True)
+        self.evict(keep=path)
+        return path
@@ -6,53 +6,99 @@
 
 import logging
 import os
-import shutil
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from build_workflow.build_artifact_checks import BuildArtifactChecks
 from build_workflow.build_target import BuildTarget
 from git.git_repository import GitRepository
 from manifests.build_manifest import BuildManifest
+from system import thread_pool
+from system.file_materializer import FileMaterializer
+from system.tracer import Tracer
 
 
 class BuildRecorder:
-    def __init__(self, target: BuildTarget) -> None:
-        self.build_manifest = self.BuildManifestBuilder(target)
+    """
+    Records components and artifacts into a build manifest. Recording is thread-safe, components built concurrently
+    are written in the order given by `components` (or in the order in which they were recorded).
+    Artifacts are reflinked or hard-linked into the output directory when its filesystem allows it, and copied otherwise.
+    """
+
+    def __init__(self, target: BuildTarget, components: List[str] = None) -> None:
+        self.build_manifest = self.BuildManifestBuilder(target, components)
         self.target = target
         self.name = target.name
+        self.lock = threading.Lock()
+        self.materializer = FileMaterializer()
 
     def record_component(self, component_name: str, git_repo: GitRepository) -> None:
-        self.build_manifest.append_component(
-            component_name,
-            self.target.component_version,
-            git_repo.url,
-            git_repo.ref,
-            git_repo.sha,
-        )
+        with self.lock:
+            self.build_manifest.append_component(
+                component_name,
+                self.target.component_version,
+                git_repo.url,
+                git_repo.ref,
+                git_repo.sha,
+            )
+
+    def commit_id(self, component_name: str) -> Optional[str]:
+        """
+        The commit ID of a component recorded so far, if any.
+        """
+        with self.lock:
+            component = self.build_manifest.components_hash.get(component_name)
+            commit_id: Optional[str] = component["commit_id"] if component else None
+            return commit_id
 
     def record_artifact(self, component_name: str, artifact_type: str, artifact_path: str, artifact_file: str) -> None:
+        self.__export_artifact(component_name, artifact_type, artifact_path, artifact_file)
+        # Notify the recorder
+        with self.lock:
+            self.build_manifest.append_artifact(component_name, artifact_type, artifact_path)
+
+    def record_artifacts(self, component_name: str, artifacts: List[Tuple[str, str, str]], link: bool = True) -> None:
+        """
+        Check and export (artifact type, artifact path, artifact file) tuples of a component on thread pools.
+        Artifacts are added to the manifest in the given order, once all of them have been exported.
+        Unset link to copy or reflink, but never hard-link, artifact files that must not change with the output, e.g. those in the build cache.
+        """
+        with Tracer.default().span("check artifacts", component=component_name, artifacts=len(artifacts)) as span:
+            for artifact in artifacts:
+                span.add_file(artifact[2])
+            for artifact_type in sorted(set(artifact[0] for artifact in artifacts)):
+                BuildArtifactChecks.check_many(self.target, artifact_type, [artifact[2] for artifact in artifacts if artifact[0] == artifact_type])
+        with Tracer.default().span("export artifacts", component=component_name, artifacts=len(artifacts)) as span:
+            span.add_bytes(sum(os.path.getsize(artifact[2]) for artifact in artifacts if os.path.isfile(artifact[2])))
+            thread_pool.run(self.__export_artifact, [(component_name, artifact[0], artifact[1], artifact[2], False, link) for artifact in artifacts])
+        with self.lock:
+            for artifact_type, artifact_path, _ in artifacts:
+                self.build_manifest.append_artifact(component_name, artifact_type, artifact_path)
+
+    def __export_artifact(self, component_name: str, artifact_type: str, artifact_path: str, artifact_file: str, check: bool = True, link: bool = True) -> None:
         logging.info(f"Recording {artifact_type} artifact for {component_name}: {artifact_path} (from {artifact_file})")
         # Ensure the target directory exists
         dest_file = os.path.join(self.target.output_dir, artifact_path)
         dest_dir = os.path.dirname(dest_file)
         os.makedirs(dest_dir, exist_ok=True)
         # Check artifact
-        BuildArtifactChecks.check(self.target, artifact_type, artifact_file)
-        # Copy the file
-        shutil.copyfile(artifact_file, dest_file)
-        # Notify the recorder
-        self.build_manifest.append_artifact(component_name, artifact_type, artifact_path)
+        if check:
+            BuildArtifactChecks.check(self.target, artifact_type, artifact_file)
+        # Link or copy the file
+        self.materializer.materialize(artifact_file, dest_file, link)
 
     def get_manifest(self) -> BuildManifest:
-        return self.build_manifest.to_manifest()
+        with self.lock:
+            return self.build_manifest.to_manifest()
 
     def write_manifest(self) -> None:
         manifest_path = os.path.join(self.target.output_dir, "manifest.yml")
         self.get_manifest().to_file(manifest_path)
+        self.materializer.log_summary()
         logging.info(f"Created build manifest {manifest_path}")
 
     class BuildManifestBuilder:
-        def __init__(self, target: BuildTarget) -> None:
+        def __init__(self, target: BuildTarget, components: List[str] = None) -> None:
             self.data: Dict[str, Any] = {}
             self.data["build"] = {}
             self.data["build"]["id"] = target.build_id
@@ -63,6 +109,7 @@ class BuildRecorder:
             self.data["build"]["distribution"] = target.distribution if target.distribution else "tar"
             self.data["schema-version"] = "1.2"
             self.components_hash: Dict[str, Dict[str, Any]] = {}
+            self.components_order = components
 
         def append_component(self, name: str, version: str, repository_url: str, ref: str, commit_id: str) -> None:
             component = {
@@ -84,7 +131,9 @@ class BuildRecorder:
 
         def to_manifest(self) -> 'BuildManifest':
             # The build manifest expects `components` to be a list, not a hash, so we need to munge things a bit
-            components = self.components_hash.values()
+            components = list(self.components_hash.values())
+            if self.components_order:
+                components.sort(key=lambda component: self.components_order.index(component["name"]))
             if len(components):
-                self.data["components"] = list(components)
+                self.data["components"] = components
             return BuildManifest(self.data)
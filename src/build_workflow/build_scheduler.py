@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import contextvars
+import logging
+import os
+from typing import IO, Callable, Dict, List
+
+from manifests.input_manifest import InputComponent
+
+"""
+This class is responsible for scheduling component builds on a bounded pool of workers.
+A component is started once all of its prerequisites have been built. Prerequisites are the components listed in
+`depends_on`, the core component (e.g. OpenSearch or OpenSearch-Dashboards) that every other component builds against,
+and the LIBRARIES that plugins consume from maven local, in the order in which they are listed in the manifest.
+Prerequisites that are not part of the selected components are assumed to have been built already.
+With a single worker, components are built one after another in manifest order.
+The output of each build is logged to its own file, including what it logs from thread pools that run work in a copy of its context.
+"""
+
+
+class BuildScheduler:
+    # components published to maven local and consumed by other plugins
+    LIBRARIES = ["common-utils", "job-scheduler"]
+
+    # the component being built, on the thread that builds it and in the contexts that it copies
+    component: contextvars.ContextVar = contextvars.ContextVar("component", default=None)
+
+    def __init__(self, components: List[InputComponent], core: str = None, workers: int = 1, log_dir: str = None) -> None:
+        self.components = components
+        self.core = core
+        self.workers = workers
+        self.log_dir = log_dir
+
+    def dependencies(self, component: InputComponent) -> List[str]:
+        """
+        The components that component builds against, whether they are part of the selected components or not.
+        """
+        names = [c.name for c in self.components]
+        depends_on = []
+        if self.core and component.name != self.core:
+            depends_on.append(self.core)
+            libraries = [name for name in names if name in self.LIBRARIES] + [name for name in self.LIBRARIES if name not in names]
+            if component.name in libraries:
+                libraries = libraries[:libraries.index(component.name)]
+            depends_on.extend(libraries)
+        depends_on.extend(name for name in component.depends_on or [] if name not in depends_on)
+        return [name for name in depends_on if name != component.name]
+
+    def prerequisites(self, component: InputComponent) -> List[str]:
+        names = [c.name for c in self.components]
+        return [name for name in self.dependencies(component) if name in names]
+
+    def log_path(self, component: InputComponent) -> str:
+        return os.path.join(self.log_dir, f"{component.name}.log")
+
+    def run(self, build: Callable[[InputComponent, IO], None]) -> None:
+        if self.workers <= 1:
+            for component in self.components:
+                build(component, None)
+            return
+
+        pending = list(self.components)
+        done: List[str] = []
+        running: Dict[concurrent.futures.Future, InputComponent] = {}
+
+        logging.info(f"Building {len(pending)} component(s) with {self.workers} worker(s)")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while pending or running:
+                for component in list(pending):
+                    if len(running) >= self.workers:
+                        break
+                    if all(name in done for name in self.prerequisites(component)):
+                        pending.remove(component)
+                        running[executor.submit(self.__build, build, component)] = component
+
+                if not running:
+                    raise ValueError(f"Circular dependency between components: {', '.join(c.name for c in pending)}")
+
+                completed, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in completed:
+                    component = running.pop(future)
+                    error = future.exception()
+                    if error:
+                        # do not start anything new, let builds already in progress finish
+                        concurrent.futures.wait(running)
+                        raise error
+                    done.append(component.name)
+
+    def __build(self, build: Callable[[InputComponent, IO], None], component: InputComponent) -> None:
+        log_path = self.log_path(component)
+        logging.info(f"Building {component.name}, logging to {log_path}")
+        try:
+            with open(log_path, "w") as log:
+                handler = logging.StreamHandler(log)
+                handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+                # handlers run on the thread that logs, where the context tells which component it works for
+                handler.addFilter(lambda record: self.component.get() is component)
+                token = self.component.set(component)
+                logging.getLogger().addHandler(handler)
+                try:
+                    build(component, log)
+                finally:
+                    logging.getLogger().removeHandler(handler)
+                    self.component.reset(token)
+        except:
+            with open(log_path, "r") as f:
+                logging.error(f"Error building {component.name}, output follows.\n{f.read()}")
+            raise
+        logging.info(f"Built {component.name}")
@@ -5,7 +5,7 @@
 # compatible open source license.
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import IO, Any
 
 from build_workflow.build_recorder import BuildRecorder
 from build_workflow.build_target import BuildTarget
@@ -15,11 +15,13 @@ class Builder(ABC):
     component: Any
     target: BuildTarget
     output_path: str
+    log: IO
 
-    def __init__(self, component: Any, target: BuildTarget) -> None:
+    def __init__(self, component: Any, target: BuildTarget, log: IO = None) -> None:
         self.output_path = "builds"
         self.component = component
         self.target = target
+        self.log = log
 
     @abstractmethod
     def checkout(self, work_dir: str) -> None:
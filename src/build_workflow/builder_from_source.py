@@ -4,21 +4,36 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import logging
 import os
+from typing import IO, Any, List, Optional, Tuple
 
+from build_workflow.build_cache import BuildCache
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_target import BuildTarget
 from build_workflow.builder import Builder
 from git.git_repository import GitRepository
 from paths.script_finder import ScriptFinder
+from system.file_materializer import FileMaterializer
 
 """
 This class is responsible for executing the build for a component and passing the results to a build recorder.
 It will notify the build recorder of build information such as repository and git ref, and any artifacts generated by the build.
 Artifacts found in "<build root>/artifacts/<maven|plugins|libs|dist|core-plugins>" will be recognized and recorded.
+When a build cache is given, artifacts previously built from the same commit for the same target, against the same commits of its dependencies,
+are restored from the cache instead. The cache is not used when a dependency has not been built before the component.
 """
 
 
 class BuilderFromSource(Builder):
+    def __init__(self, component: Any, target: BuildTarget, log: IO = None, cache: BuildCache = None, dependencies: List[str] = None) -> None:
+        super().__init__(component, target, log)
+        self.cache = cache
+        self.dependencies = dependencies or []
+        self.cached_artifacts_path: str = None
+        # files restored into maven local may be modified, never share them with the cache
+        self.materializer = FileMaterializer(link=False)
+
     def checkout(self, work_dir: str) -> None:
         self.git_repo = GitRepository(
             self.component.repository,
@@ -35,6 +50,15 @@ class BuilderFromSource(Builder):
 
         build_script = ScriptFinder.find_build_script(self.target.name, self.component.name, self.git_repo.working_directory)
 
+        cache_key = self.__cache_key(build_recorder, build_script) if self.cache else None
+        if cache_key:
+            self.cached_artifacts_path = self.cache.get(cache_key)
+            if self.cached_artifacts_path:
+                logging.info(f"Skipping build of {self.component.name}, restoring artifacts from {self.cached_artifacts_path}")
+                self.__restore_maven_local()
+                build_recorder.record_component(self.component.name, self.git_repo)
+                return
+
         build_command = " ".join(
             filter(
                 None,
@@ -52,14 +76,46 @@ class BuilderFromSource(Builder):
             )
         )
 
-        self.git_repo.execute(build_command)
+        self.git_repo.execute(build_command, stdout=self.log)
+        if cache_key and os.path.isdir(self.artifacts_path):
+            self.cache.put(cache_key, self.artifacts_path)
         build_recorder.record_component(self.component.name, self.git_repo)
 
+    def __cache_key(self, build_recorder: BuildRecorder, build_script: str) -> Optional[str]:
+        commit_ids = {name: build_recorder.commit_id(name) for name in self.dependencies}
+        missing = [name for name, commit_id in commit_ids.items() if not commit_id]
+        if missing:
+            logging.info(f"Not using the build cache for {self.component.name}, {', '.join(missing)} not built before it")
+            return None
+        return BuildCache.key(self.component, self.git_repo.sha, self.target, build_script, commit_ids)
+
+    @property
+    def artifacts_path(self) -> str:
+        return self.cached_artifacts_path or os.path.join(self.git_repo.working_directory, self.output_path)
+
+    @property
+    def maven_local_path(self) -> str:
+        return os.path.join(os.path.expanduser("~"), ".m2", "repository")
+
+    def __restore_maven_local(self) -> None:
+        # components built later expect maven publications of this component in maven local
+        maven_path = os.path.join(self.cached_artifacts_path, "maven")
+        logging.info(f"Restoring {maven_path} into {self.maven_local_path}")
+        for dir, _, files in os.walk(maven_path):
+            dest_dir = os.path.join(self.maven_local_path, os.path.relpath(dir, maven_path))
+            os.makedirs(dest_dir, exist_ok=True)
+            for file_name in files:
+                self.materializer.materialize(os.path.join(dir, file_name), os.path.join(dest_dir, file_name))
+
     def export_artifacts(self, build_recorder: BuildRecorder) -> None:
-        artifacts_path = os.path.join(self.git_repo.working_directory, self.output_path)
+        artifacts_path = self.artifacts_path
+        artifacts: List[Tuple[str, str, str]] = []
         for artifact_type in ["maven", "dist", "plugins", "libs", "core-plugins"]:
-            for dir, _, files in os.walk(os.path.join(artifacts_path, artifact_type)):
-                for file_name in files:
+            for dir, dirs, files in os.walk(os.path.join(artifacts_path, artifact_type)):
+                dirs.sort()
+                for file_name in sorted(files):
                     absolute_path = os.path.join(dir, file_name)
                     relative_path = os.path.relpath(absolute_path, artifacts_path)
-                    build_recorder.record_artifact(self.component.name, artifact_type, relative_path, absolute_path)
+                    artifacts.append((artifact_type, relative_path, absolute_path))
+        # artifacts restored from the build cache are never hard-linked, so that changes to the output do not corrupt the cache
+        build_recorder.record_artifacts(self.component.name, artifacts, link=not self.cached_artifacts_path)
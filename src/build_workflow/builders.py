@@ -5,7 +5,9 @@
 # compatible open source license.
 
 from abc import ABC
+from typing import IO, List
 
+from build_workflow.build_cache import BuildCache
 from build_workflow.build_target import BuildTarget
 from build_workflow.builder import Builder
 from build_workflow.builder_from_dist import BuilderFromDist
@@ -15,10 +17,10 @@ from manifests.input_manifest import InputComponent, InputComponentFromDist, Inp
 
 class Builders(ABC):
     @classmethod
-    def builder_from(self, component: InputComponent, target: BuildTarget) -> Builder:
+    def builder_from(self, component: InputComponent, target: BuildTarget, log: IO = None, cache: BuildCache = None, dependencies: List[str] = None) -> Builder:
         if type(component) is InputComponentFromDist:
-            return BuilderFromDist(component, target)
+            return BuilderFromDist(component, target, log)
         elif type(component) is InputComponentFromSource:
-            return BuilderFromSource(component, target)
+            return BuilderFromSource(component, target, log, cache, dependencies)
         else:
             raise ValueError(f"Invalid component type: {type(component)}")
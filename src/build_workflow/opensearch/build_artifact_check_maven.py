@@ -6,7 +6,7 @@
 
 import logging
 import os
-from typing import Any, List
+from typing import Any, Dict, List
 from zipfile import ZipFile
 
 from build_workflow.build_artifact_check import BuildArtifactCheck
@@ -31,14 +31,17 @@ class BuildArtifactOpenSearchCheckMaven(BuildArtifactCheck):
         ]:
             raise BuildArtifactCheck.BuildArtifactInvalidError(path, f"{ext} is not a valid extension for a maven file")
         if os.path.splitext(path)[1] == ".jar":
-            with ZipFile(path, "r") as zip:
-                data = zip.read("META-INF/MANIFEST.MF").decode("UTF-8")
-                properties = PropertiesFile(data)
-                try:
-                    versions: List[Any] = [None]
-                    versions.extend(self.target.compatible_component_versions)
-                    versions.extend(self.target.compatible_min_versions)
-                    properties.check_value_in("Implementation-Version", versions)
-                except PropertiesFile.CheckError as e:
-                    raise BuildArtifactCheck.BuildArtifactInvalidError(path, str(e))
-                logging.info(f'Checked {path} ({properties.get_value("Implementation-Version", "N/A")})')
+            properties = PropertiesFile(self.index.get(path, "META-INF/MANIFEST.MF", lambda: self.__read_manifest(path)))
+            try:
+                versions: List[Any] = [None]
+                versions.extend(self.target.compatible_component_versions)
+                versions.extend(self.target.compatible_min_versions)
+                properties.check_value_in("Implementation-Version", versions)
+            except PropertiesFile.CheckError as e:
+                raise BuildArtifactCheck.BuildArtifactInvalidError(path, str(e))
+            logging.info(f'Checked {path} ({properties.get_value("Implementation-Version", "N/A")})')
+
+    def __read_manifest(self, path: str) -> Dict[str, str]:
+        with ZipFile(path, "r") as zip:
+            data = zip.read("META-INF/MANIFEST.MF").decode("UTF-8")
+            return dict(PropertiesFile(data).properties)
@@ -6,6 +6,7 @@
 
 import logging
 import os
+from typing import Dict
 from zipfile import ZipFile
 
 from build_workflow.build_artifact_check import BuildArtifactCheck
@@ -18,15 +19,18 @@ class BuildArtifactOpenSearchCheckPlugin(BuildArtifactCheck):
             raise BuildArtifactCheck.BuildArtifactInvalidError(path, "Not a zip file.")
         if not self.valid_path(path):
             raise BuildArtifactCheck.BuildArtifactInvalidError(path, f"Expected filename to include one of {self.target.compatible_component_versions}.")
+        properties = PropertiesFile(self.index.get(path, "plugin-descriptor.properties", lambda: self.__read_properties(path)))
+        try:
+            properties.check_value_in("version", self.target.compatible_component_versions)
+            properties.check_value_in("opensearch.version", self.target.compatible_versions)
+        except PropertiesFile.CheckError as e:
+            raise BuildArtifactCheck.BuildArtifactInvalidError(path, e.__str__())
+        logging.info(f'Checked {path} ({properties.get_value("version", "N/A")})')
+
+    def __read_properties(self, path: str) -> Dict[str, str]:
         with ZipFile(path, "r") as zip:
             data = zip.read("plugin-descriptor.properties").decode("UTF-8")
-            properties = PropertiesFile(data)
-            try:
-                properties.check_value_in("version", self.target.compatible_component_versions)
-                properties.check_value_in("opensearch.version", self.target.compatible_versions)
-            except PropertiesFile.CheckError as e:
-                raise BuildArtifactCheck.BuildArtifactInvalidError(path, e.__str__())
-            logging.info(f'Checked {path} ({properties.get_value("version", "N/A")})')
+            return dict(PropertiesFile(data).properties)
 
     def valid_path(self, path: str) -> bool:
         return any(map(lambda version: path.endswith(f"-{version}.zip"), self.target.compatible_component_versions))
@@ -7,7 +7,7 @@
 import logging
 import os
 import re
-from typing import List
+from typing import Any, List
 from zipfile import ZipFile
 
 from build_workflow.build_artifact_check import BuildArtifactCheck
@@ -28,15 +28,18 @@ class BuildArtifactOpenSearchDashboardsCheckPlugin(BuildArtifactCheck):
         if not os.path.basename(path) in valid_filenames:
             raise BuildArtifactCheck.BuildArtifactInvalidError(path, f"Expected filename to to be one of {valid_filenames}.")
 
+        member = f"opensearch-dashboards/{plugin_name}/opensearch_dashboards.json"
+        config = ConfigFile(self.index.get(path, member, lambda: self.__read_config(path, member)))
+        try:
+            config.check_value_in("version", self.target.compatible_component_versions)
+            config.check_value_in("opensearchDashboardsVersion", self.target.compatible_min_versions)
+        except ConfigFile.CheckError as e:
+            raise BuildArtifactCheck.BuildArtifactInvalidError(path, e.__str__())
+        logging.info(f'Checked {path} ({config.get_value("version", "N/A")})')
+
+    def __read_config(self, path: str, member: str) -> Any:
         with ZipFile(path, "r") as zip:
-            data = zip.read(f"opensearch-dashboards/{plugin_name}/opensearch_dashboards.json").decode("UTF-8")
-            config = ConfigFile(data)
-            try:
-                config.check_value_in("version", self.target.compatible_component_versions)
-                config.check_value_in("opensearchDashboardsVersion", self.target.compatible_min_versions)
-            except ConfigFile.CheckError as e:
-                raise BuildArtifactCheck.BuildArtifactInvalidError(path, e.__str__())
-            logging.info(f'Checked {path} ({config.get_value("version", "N/A")})')
+            return ConfigFile(zip.read(member).decode("UTF-8")).data
 
     def __valid_paths(self, pluginName: str) -> List[str]:
         return list(map(lambda version: f"{pluginName}-{version}.zip", self.target.compatible_min_versions))
@@ -11,10 +11,19 @@ from typing import IO
 
 class CheckoutArgs:
     manifest: IO
+    jobs: int
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Checkout an OpenSearch Bundle")
         parser.add_argument("manifest", type=argparse.FileType("r"), help="Manifest file.")
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of components to check out concurrently.",
+            dest="jobs",
+        )
         parser.add_argument(
             "-v",
             "--verbose",
@@ -28,3 +37,4 @@ class CheckoutArgs:
         args = parser.parse_args()
         self.logging_level = args.logging_level
         self.manifest = args.manifest
+        self.jobs = args.jobs
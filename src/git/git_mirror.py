@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+from system import subprocess_runner
+from system.file_lock import FileLock
+
+
+class GitMirror:
+    """
+    This class maintains a local bare mirror of a remote Git repository inside a shared mirrors directory.
+    Refs are fetched into the mirror once, checkouts then borrow objects from the mirror instead of downloading them again.
+    Each mirror is guarded by a file lock, so that concurrent jobs on the same host can share a mirrors directory.
+    Like checkouts without a mirror, fetches are shallow. The MAX_REFS most recently fetched commits are kept reachable, in the order of a fetch log.
+    """
+
+    MAX_REFS = 100
+    # commits fetched into the mirror, one per line, most recent last
+    FETCH_LOG = "mirror-fetch-log"
+
+    def __init__(self, mirrors_dir: str, url: str) -> None:
+        self.url = url
+        name = re.sub(r"\.git$", "", os.path.basename(url.rstrip("/"))) or "repository"
+        self.dir = os.path.join(os.path.realpath(mirrors_dir), f"{name}-{hashlib.sha1(url.encode()).hexdigest()[:12]}.git")
+
+    @property
+    def lock_path(self) -> str:
+        return f"{self.dir}.lock"
+
+    @property
+    def objects_path(self) -> str:
+        return os.path.join(self.dir, "objects")
+
+    def fetch(self, ref: str) -> str:
+        """
+        Fetch a ref into the mirror, unless it is a commit ID that the mirror already has.
+        :returns the commit ID of the ref.
+        """
+        with FileLock(self.lock_path):
+            if not os.path.isdir(self.dir):
+                self.__create()
+
+            if re.fullmatch(r"[0-9a-f]{40}", ref) and self.has_commit(ref):
+                logging.info(f"Found {ref} in mirror {self.dir}")
+                return ref
+
+            self.execute_silent(f"git fetch --depth 1 origin {ref}")
+            sha = self.output("git rev-parse FETCH_HEAD^{commit}")
+            # keep fetched commits reachable so that they are not pruned by git gc
+            self.execute_silent(f"git update-ref refs/mirror/{sha} {sha}")
+            self.__prune_refs(sha)
+            return sha
+
+    def __create(self) -> None:
+        logging.info(f"Creating mirror of {self.url} in {self.dir}")
+        os.makedirs(os.path.dirname(self.dir), exist_ok=True)
+        # a mirror that failed to initialize is never left in place to be reused
+        temp_dir = tempfile.mkdtemp(prefix=f".{os.path.basename(self.dir)}.", dir=os.path.dirname(self.dir))
+        try:
+            self.execute_silent("git init --bare", temp_dir)
+            self.execute_silent(f"git remote add origin {self.url}", temp_dir)
+            os.rename(temp_dir, self.dir)
+        except:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+    def __prune_refs(self, sha: str) -> None:
+        """
+        Record that sha was fetched last, and drop the refs of all but the MAX_REFS most recently fetched commits.
+        """
+        fetch_log = os.path.join(self.dir, self.FETCH_LOG)
+        fetched = []
+        if os.path.isfile(fetch_log):
+            with open(fetch_log) as f:
+                fetched = f.read().split()
+        # refs that were not logged, e.g. created before the log was, count as fetched before any logged one
+        refs = self.output("git for-each-ref --sort=committerdate --format='%(refname:lstrip=2)' refs/mirror/").split()
+        order = [ref for ref in refs if ref not in fetched and ref != sha] + [ref for ref in fetched if ref in refs and ref != sha] + [sha]
+        # unreachable objects are then removed by git gc, once they expire
+        for ref in order[:-self.MAX_REFS]:
+            self.execute_silent(f"git update-ref -d refs/mirror/{ref}")
+        with open(f"{fetch_log}.tmp", "w") as f:
+            f.write("".join(f"{ref}\n" for ref in order[-self.MAX_REFS:]))
+        os.replace(f"{fetch_log}.tmp", fetch_log)
+
+    def has_commit(self, sha: str) -> bool:
+        result = subprocess_runner.run(f"git cat-file -e {sha}^{{commit}}", cwd=self.dir, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+
+    def reference(self, dir: str) -> None:
+        """
+        Make objects in the mirror available to a repository initialized in dir, same as `git clone --reference`.
+        The repository is shallow where the mirror is.
+        """
+        alternates = os.path.join(dir, ".git", "objects", "info", "alternates")
+        os.makedirs(os.path.dirname(alternates), exist_ok=True)
+        with open(alternates, "a") as f:
+            f.write(f"{self.objects_path}\n")
+        if os.path.isfile(os.path.join(self.dir, "shallow")):
+            with open(os.path.join(self.dir, "shallow")) as shallow, open(os.path.join(dir, ".git", "shallow"), "a") as f:
+                f.write(shallow.read())
+
+    def execute_silent(self, command: str, cwd: str = None) -> None:
+        cwd = cwd or self.dir
+        logging.info(f'Executing "{command}" in {cwd}')
+        subprocess_runner.check_call(command, cwd=cwd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def output(self, command: str) -> str:
+        logging.info(f'Executing "{command}" in {self.dir}')
+        return subprocess_runner.check_output(command, cwd=self.dir, shell=True).decode().strip()
@@ -7,23 +7,32 @@
 import logging
 import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Any, List
+from typing import IO, Any, Dict, List, Tuple
 
+from git.git_mirror import GitMirror
+from system import subprocess_runner
 from system.temporary_directory import TemporaryDirectory
+from system.tracer import Tracer
 
 
 class GitRepository:
     dir: str
+    __stable_refs__: Dict[Tuple[str, str], List[str]] = {}
+    __stable_refs_lock__ = threading.Lock()
     """
     This class checks out a Git repository at a particular ref into an empty named directory (or temporary a directory if no named directory is given).
     Temporary directories will be automatically deleted when the GitRepository object goes out of scope; named directories will be left alone.
     Clients can obtain the actual commit ID by querying the "sha" attribute, and the temp directory name with "dir".
+    When a mirrors directory is given, or set in the GIT_MIRROR_DIR environment variable, refs are fetched into a shared local mirror
+    of the repository, and the checkout borrows objects from that mirror instead of downloading them again.
     """
 
-    def __init__(self, url: str, ref: str, directory: str = None, working_subdirectory: str = None) -> None:
+    def __init__(self, url: str, ref: str, directory: str = None, working_subdirectory: str = None, mirror_dir: str = None) -> None:
         self.url = url
         self.ref = ref
+        self.mirror_dir = mirror_dir or os.getenv("GIT_MIRROR_DIR")
         if directory is None:
             self.temp_dir = TemporaryDirectory()
             self.dir = os.path.realpath(self.temp_dir.name)
@@ -42,12 +51,19 @@ class GitRepository:
             self.temp_dir.__exit__(exc_type, exc_value, exc_traceback)
 
     def __checkout__(self) -> None:
-        self.execute_silent("git init", self.dir)
-        self.execute_silent(f"git remote add origin {self.url}", self.dir)
-        self.execute_silent(f"git fetch --depth 1 origin {self.ref}", self.dir)
-        self.execute_silent("git checkout FETCH_HEAD", self.dir)
-        self.sha = self.output("git rev-parse HEAD", self.dir)
-        logging.info(f"Checked out {self.url}@{self.ref} into {self.dir} at {self.sha}")
+        with Tracer.default().span("checkout", url=self.url, ref=self.ref):
+            self.execute_silent("git init", self.dir)
+            self.execute_silent(f"git remote add origin {self.url}", self.dir)
+            if self.mirror_dir:
+                mirror = GitMirror(self.mirror_dir, self.url)
+                sha = mirror.fetch(self.ref)
+                mirror.reference(self.dir)
+                self.execute_silent(f"git checkout {sha}", self.dir)
+            else:
+                self.execute_silent(f"git fetch --depth 1 origin {self.ref}", self.dir)
+                self.execute_silent("git checkout FETCH_HEAD", self.dir)
+            self.sha = self.output("git rev-parse HEAD", self.dir)
+            logging.info(f"Checked out {self.url}@{self.ref} into {self.dir} at {self.sha}")
 
     @property
     def working_directory(self) -> str:
@@ -57,14 +73,48 @@ class GitRepository:
             return self.dir
 
     @classmethod
-    def stable_ref(self, url: str, ref: str) -> List[str]:
-        results = subprocess.check_output(f"git ls-remote {url} {ref}", shell=True).decode().strip().split("\t")
-        return results if len(results) > 1 else [ref, ref]
+    def ls_remote(cls, url: str, refs: List[str]) -> List[List[str]]:
+        """
+        List the [commit ID, ref name] pairs of the remote refs matching refs. Annotated tags resolve to the commit they point to.
+        """
+        lines = subprocess_runner.check_output(f"git ls-remote {url} {' '.join(refs)}", shell=True).decode().strip().splitlines()
+        results = [line.split("\t") for line in lines if "\t" in line]
+        # an annotated tag is listed with the ID of the tag object, followed by a peeled "<tag>^{}" line with the ID of the commit
+        peeled = {name[:-len("^{}")]: sha for sha, name in results if name.endswith("^{}")}
+        return [[peeled.get(name, sha), name] for sha, name in results if not name.endswith("^{}")]
+
+    @classmethod
+    def stable_ref(cls, url: str, ref: str) -> List[str]:
+        results = cls.ls_remote(url, [ref])
+        return results[0] if results else [ref, ref]
+
+    @classmethod
+    def stable_refs(cls, url: str, refs: List[str]) -> Dict[str, List[str]]:
+        """
+        Resolve several refs of a repository with a single "git ls-remote", results are cached for the lifetime of the process.
+        :returns a dictionary of ref to a [commit ID, ref name] pair, same as stable_ref.
+        """
+        with cls.__stable_refs_lock__:
+            missing = [ref for ref in dict.fromkeys(refs) if (url, ref) not in cls.__stable_refs__]
+
+        resolved: Dict[str, List[str]] = {}
+        if len(missing) == 1:
+            resolved[missing[0]] = cls.stable_ref(url, missing[0])
+        elif len(missing) > 1:
+            results = cls.ls_remote(url, missing)
+            for ref in missing:
+                matches = [result for result in results if result[1] == ref or result[1].endswith(f"/{ref}")]
+                resolved[ref] = matches[0] if matches else [ref, ref]
+
+        with cls.__stable_refs_lock__:
+            for ref, result in resolved.items():
+                cls.__stable_refs__[(url, ref)] = result
+            return {ref: cls.__stable_refs__[(url, ref)] for ref in refs}
 
     def execute_silent(self, command: str, cwd: str = None) -> None:
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
-        subprocess.check_call(
+        subprocess_runner.check_call(
             command,
             cwd=cwd,
             shell=True,
@@ -75,12 +125,15 @@ class GitRepository:
     def output(self, command: str, cwd: str = None) -> str:
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
-        return subprocess.check_output(command, cwd=cwd, shell=True).decode().strip()
+        return subprocess_runner.check_output(command, cwd=cwd, shell=True).decode().strip()
 
-    def execute(self, command: str, cwd: str = None) -> None:
+    def execute(self, command: str, cwd: str = None, stdout: IO = None) -> None:
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
-        subprocess.check_call(command, cwd=cwd, shell=True)
+        if stdout:
+            subprocess_runner.check_call(command, cwd=cwd, shell=True, stdout=stdout, stderr=subprocess.STDOUT)
+        else:
+            subprocess_runner.check_call(command, cwd=cwd, shell=True)
 
     def path(self, subdirname: str = None) -> Path:
         dirname = self.dir
@@ -34,15 +34,19 @@ components:
       - windows
       - darwin
       - linux
+    depends_on: optional list of components that must be built first
+      - component1
+      - ...
   - ...
 """
 import copy
 import itertools
 import logging
-from typing import Callable, Iterator, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
 from git.git_repository import GitRepository
 from manifests.component_manifest import Component, ComponentManifest, Components
+from system import thread_pool
 
 
 class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
@@ -85,6 +89,7 @@ class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
                             "working_directory": {"type": "string"},
                             "checks": {"type": "list", "schema": {"anyof": [{"type": "string"}, {"type": "dict"}]}},
                             "platforms": {"type": "list", "schema": {"type": "string", "allowed": ["linux", "windows", "darwin"]}},
+                            "depends_on": {"type": "list", "schema": {"type": "string"}},
                         },
                     },
                     {
@@ -94,6 +99,7 @@ class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
                             "dist": {"required": True, "type": "string"},
                             "checks": {"type": "list", "schema": {"anyof": [{"type": "string"}, {"type": "dict"}]}},
                             "platforms": {"type": "list", "schema": {"type": "string", "allowed": ["linux", "windows", "darwin"]}},
+                            "depends_on": {"type": "list", "schema": {"type": "string"}},
                         },
                     },
                 ]
@@ -172,6 +178,14 @@ class InputComponents(Components['InputComponent']):
         return InputComponent._from(data)  # type: ignore[no-any-return]
 
     def __stabilize__(self) -> None:
+        # resolve all refs of each repository with a single call, and all repositories concurrently
+        refs: Dict[str, List[str]] = {}
+        for component in self.values():
+            if isinstance(component, InputComponentFromSource):
+                refs.setdefault(component.repository, []).append(component.ref)
+
+        thread_pool.run(GitRepository.stable_refs, refs.items())
+
         for component in self.values():
             component.__stabilize__()
 
@@ -202,6 +216,7 @@ class InputComponent(Component):
     def __init__(self, data: dict) -> None:
         super().__init__(data)
         self.platforms = data.get("platforms", None)
+        self.depends_on = data.get("depends_on", None)
         self.checks = list(map(lambda entry: Check(entry), data.get("checks", [])))
 
     @classmethod
@@ -239,7 +254,7 @@ class InputComponentFromSource(InputComponent):
         self.working_directory = data.get("working_directory", None)
 
     def __stabilize__(self) -> None:
-        ref, name = GitRepository.stable_ref(self.repository, self.ref)
+        ref, name = GitRepository.stable_refs(self.repository, [self.ref])[self.ref]
         logging.info(f"Updating ref for {self.repository} from {self.ref} to {ref} ({name})")
         self.ref = ref
 
@@ -251,6 +266,7 @@ class InputComponentFromSource(InputComponent):
             "working_directory": self.working_directory,
             "checks": list(map(lambda check: check.__to_dict__(), self.checks)),
             "platforms": self.platforms,
+            "depends_on": self.depends_on,
         }
 
 
@@ -264,7 +280,8 @@ class InputComponentFromDist(InputComponent):
             "name": self.name,
             "dist": self.dist,
             "platforms": self.platforms,
-            "checks": list(map(lambda check: check.__to_dict__(), self.checks))
+            "checks": list(map(lambda check: check.__to_dict__(), self.checks)),
+            "depends_on": self.depends_on,
         }
 
 
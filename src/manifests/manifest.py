@@ -6,6 +6,7 @@
 
 import logging
 import os
+import threading
 import urllib.request
 from abc import ABC, abstractmethod
 from typing import IO, Any, Dict, Generic, Optional, Type, TypeVar
@@ -17,6 +18,9 @@ from cerberus import Validator
 
 T = TypeVar('T', bound='Manifest')
 
+# the libyaml parser is an order of magnitude faster, when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Manifest(ABC, Generic[T]):
     SCHEMA = {
@@ -27,9 +31,12 @@ class Manifest(ABC, Generic[T]):
 
     VERSIONS: Optional[Dict[str, object]] = None
 
+    # validators keep state while validating, so they are reused per thread
+    __validators__ = threading.local()
+
     @classmethod
     def from_file(cls, file: IO[Any]) -> T:
-        yml = yaml.safe_load(file)
+        yml = yaml.load(file, Loader=SafeLoader)
         version = yml["schema-version"]
         loader = cls.from_version(version)
         return loader(yml)
@@ -38,7 +45,7 @@ class Manifest(ABC, Generic[T]):
     def from_url(cls, url: str) -> T:
         logging.info(f"Loading {url}")
         with urllib.request.urlopen(url) as f:
-            yml = yaml.safe_load(f.read().decode("utf-8"))
+            yml = yaml.load(f.read().decode("utf-8"), Loader=SafeLoader)
             version = yml["schema-version"]
             loader = cls.from_version(version)
             return loader(yml)
@@ -115,7 +122,17 @@ class Manifest(ABC, Generic[T]):
     def schema(self) -> Any:
         return self.SCHEMA
 
+    @property
+    def validator(self) -> Validator:
+        if not hasattr(Manifest.__validators__, "validators"):
+            Manifest.__validators__.validators = {}
+        validators: Dict[type, Validator] = Manifest.__validators__.validators
+        # the schema of a manifest class does not change, compiling it is the slow part of creating a validator
+        if type(self) not in validators:
+            validators[type(self)] = Validator(self.schema)
+        return validators[type(self)]
+
     def validate(self, data: dict) -> None:
-        v = Validator(self.schema)
+        v = self.validator
         if not v.validate(data):
             raise ValueError(f"Invalid manifest schema: {v.errors}")
@@ -16,7 +16,9 @@ from assemble_workflow.bundle_recorder import BundleRecorder
 from assemble_workflow.bundles import Bundles
 from manifests.build_manifest import BuildManifest
 from paths.assemble_output_dir import AssembleOutputDir
+from paths.logs_output_dir import LogsOutputDir
 from system import console
+from system.tracer import Tracer
 
 
 def main() -> int:
@@ -50,6 +52,9 @@ def main() -> int:
 
         bundle_recorder.write_manifest(output_dir)
 
+    # the trace is kept with the logs, not in the published output
+    Tracer.default().write(os.path.join(LogsOutputDir(build.filename, build.distribution).dir, "trace-assemble.json"))
+
     logging.info("Done.")
     return 0
 
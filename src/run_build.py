@@ -9,15 +9,21 @@
 import logging
 import os
 import sys
+from typing import IO
 
 from build_workflow.build_args import BuildArgs
+from build_workflow.build_cache import BuildCache
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_scheduler import BuildScheduler
 from build_workflow.build_target import BuildTarget
 from build_workflow.builders import Builders
-from manifests.input_manifest import InputManifest
+from manifests.input_manifest import InputComponent, InputManifest
 from paths.build_output_dir import BuildOutputDir
+from paths.logs_output_dir import LogsOutputDir
 from system import console
+from system.resource_accounting import ResourceAccounting
 from system.temporary_directory import TemporaryDirectory
+from system.tracer import Tracer
 
 
 def main() -> int:
@@ -39,6 +45,8 @@ def main() -> int:
         return 0
 
     output_dir = BuildOutputDir(manifest.build.filename, args.distribution).dir
+    # logs, traces and resources are kept next to the output, not in it, since the output is published
+    logs_dir = LogsOutputDir(manifest.build.filename, args.distribution).dir
 
     with TemporaryDirectory(keep=args.keep, chdir=True) as work_dir:
         logging.info(f"Building in {work_dir.name}")
@@ -55,23 +63,40 @@ def main() -> int:
             architecture=args.architecture or manifest.build.architecture,
         )
 
-        build_recorder = BuildRecorder(target)
+        components = list(manifest.components.select(focus=args.components, platform=target.platform))
+
+        build_recorder = BuildRecorder(target, [component.name for component in components])
+
+        build_cache = BuildCache(args.cache_dir) if args.cache else None
 
         logging.info(f"Building {manifest.build.name} ({target.architecture}) into {target.output_dir}")
 
-        for component in manifest.components.select(focus=args.components, platform=target.platform):
+        scheduler = BuildScheduler(
+            components,
+            core=manifest.build.name.replace(" ", "-"),
+            workers=args.parallel,
+            log_dir=logs_dir,
+        )
+
+        def build(component: InputComponent, log: IO = None) -> None:
             logging.info(f"Building {component.name}")
 
-            builder = Builders.builder_from(component, target)
+            builder = Builders.builder_from(component, target, log, build_cache, scheduler.dependencies(component))
             try:
-                builder.checkout(work_dir.name)
-                builder.build(build_recorder)
-                builder.export_artifacts(build_recorder)
+                with ResourceAccounting.default().component(component.name):
+                    builder.checkout(work_dir.name)
+                    with Tracer.default().span("build", component=component.name):
+                        builder.build(build_recorder)
+                    builder.export_artifacts(build_recorder)
             except:
                 logging.error(f"Error building {component.name}, retry with: {args.component_command(component.name)}")
                 raise
 
+        scheduler.run(build)
+
         build_recorder.write_manifest()
+        Tracer.default().write(os.path.join(logs_dir, "trace-build.json"))
+        ResourceAccounting.default().write(os.path.join(logs_dir, "resources.yml"))
 
     logging.info("Done.")
     return 0
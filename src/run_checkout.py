@@ -8,12 +8,15 @@
 
 import logging
 import os
+import shutil
 import sys
+import time
+from typing import Dict
 
 from checkout_workflow.checkout_args import CheckoutArgs
 from git.git_repository import GitRepository
 from manifests.input_manifest import InputComponentFromSource, InputManifest
-from system import console
+from system import console, thread_pool
 from system.temporary_directory import TemporaryDirectory
 
 
@@ -25,16 +28,32 @@ def main() -> int:
     with TemporaryDirectory(keep=True, chdir=True) as work_dir:
         logging.info(f"Checking out into {work_dir.name}")
 
-        for component in manifest.components.select():
+        timings: Dict[str, float] = {}
+
+        def checkout(component: InputComponentFromSource) -> None:
             logging.info(f"Checking out {component.name}")
-            if type(component) is InputComponentFromSource:
+            start = time.time()
+            directory = os.path.join(work_dir.name, component.name)
+            try:
                 with GitRepository(
                     component.repository,
                     component.ref,
-                    os.path.join(work_dir.name, component.name),
+                    directory,
                     component.working_directory,
                 ) as repo:
                     logging.debug(f"Checked out {component.name} into {repo.dir}")
+            except:
+                logging.error(f"Error checking out {component.name}, removing {directory}")
+                shutil.rmtree(directory, ignore_errors=True)
+                raise
+            timings[component.name] = time.time() - start
+
+        components = [component for component in manifest.components.select() if type(component) is InputComponentFromSource]
+
+        thread_pool.run(checkout, [(component,) for component in components], args.jobs)
+
+        for name, elapsed in sorted(timings.items(), key=lambda timing: timing[1], reverse=True):
+            logging.info(f"Checked out {name} in {elapsed:.1f}s")
 
     logging.info(f"Done, checked out into {work_dir.name}.")
     return 0
@@ -5,10 +5,13 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import os
 import sys
 
 from manifests.test_manifest import TestManifest
 from system import console
+from system.resource_accounting import ResourceAccounting
+from system.tracer import Tracer
 from test_workflow.integ_test.integ_test_runners import IntegTestRunners
 from test_workflow.test_args import TestArgs
 
@@ -21,7 +24,10 @@ def main() -> int:
 
     test_manifest = TestManifest.from_path(args.test_manifest_path)
 
-    all_results = IntegTestRunners.from_test_manifest(args, test_manifest).run()
+    runner = IntegTestRunners.from_test_manifest(args, test_manifest)
+    all_results = runner.run()
+    Tracer.default().write(os.path.join(runner.test_recorder.location, "trace-integ-test.json"))
+    ResourceAccounting.default().write(os.path.join(runner.test_recorder.location, "resources.yml"))
 
     all_results.log()
 
@@ -11,6 +11,7 @@ import sys
 from sign_workflow.sign_args import SignArgs
 from sign_workflow.sign_artifacts import SignArtifacts
 from system import console
+from system.tracer import Tracer
 
 
 def main() -> int:
@@ -23,10 +24,16 @@ def main() -> int:
         components=args.components,
         artifact_type=args.type,
         signature_type=args.sigtype,
-        platform=args.platform
+        platform=args.platform,
+        jobs=args.jobs,
+        force=args.force
     )
 
     sign.sign()
+
+    # the target is published, the trace is only written where asked
+    if args.trace:
+        Tracer.default().write(args.trace)
     return 0
 
 
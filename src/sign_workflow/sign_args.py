@@ -19,6 +19,9 @@ class SignArgs:
     type: str
     sigtype: str
     platform: str
+    jobs: int
+    force: bool
+    trace: str
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Sign artifacts")
@@ -27,6 +30,9 @@ class SignArgs:
         parser.add_argument("--type", help="Artifact type")
         parser.add_argument("--sigtype", choices=self.ACCEPTED_SIGNATURE_FILE_TYPES, help="Type of signature file.", default=".asc")
         parser.add_argument("--platform", choices=self.ACCEPTED_PLATFORM, help="Distribution platform.", default="linux")
+        parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of artifacts to sign concurrently.")
+        parser.add_argument("--force", action="store_true", default=False, help="Sign all artifacts, including ones with an up to date signature.")
+        parser.add_argument("--trace", type=str, help="Path to write a trace of signing to, none is written by default.")
         parser.add_argument(
             "-v",
             "--verbose",
@@ -44,3 +50,6 @@ class SignArgs:
         self.sigtype = args.sigtype
         self.components = args.components
         self.platform = args.platform
+        self.jobs = args.jobs
+        self.force = args.force
+        self.trace = args.trace
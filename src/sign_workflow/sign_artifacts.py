@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, List, Type
 
 from manifests.build_manifest import BuildManifest
+from sign_workflow.signature_ledger import SignatureLedger
 from sign_workflow.signer import Signer
 from sign_workflow.signers import Signers
 
@@ -25,13 +26,15 @@ class SignArtifacts:
     platform: str
     signer: Signer
 
-    def __init__(self, target: Path, components: List[str], artifact_type: str, signature_type: str, platform: str) -> None:
+    def __init__(self, target: Path, components: List[str], artifact_type: str, signature_type: str, platform: str, jobs: int = 1, force: bool = False) -> None:
         self.target = target
         self.components = components
         self.artifact_type = artifact_type
         self.signature_type = signature_type
         self.platform = platform
-        self.signer = Signers.create(platform)
+        # artifacts are recorded relative to the directory being signed, or to the directory of the manifest or artifact
+        ledger = SignatureLedger.for_dir(str(self.target if self.target.is_dir() else self.target.parent))
+        self.signer = Signers.create(platform, jobs, ledger, force)
 
     @abstractmethod
     def __sign__(self) -> None:
@@ -39,6 +42,7 @@ class SignArtifacts:
 
     def sign(self) -> None:
         self.__sign__()
+        self.signer.log_summary()
         logging.info("Done.")
 
     def __sign_artifacts__(self, artifacts: List[str], basepath: Path) -> None:
@@ -57,9 +61,9 @@ class SignArtifacts:
             return SignArtifactsExistingArtifactFile
 
     @classmethod
-    def from_path(self, path: Path, components: List[str], artifact_type: str, signature_type: str, platform: str) -> Any:
+    def from_path(self, path: Path, components: List[str], artifact_type: str, signature_type: str, platform: str, jobs: int = 1, force: bool = False) -> Any:
         klass = self.__signer_class__(path)
-        return klass(path, components, artifact_type, signature_type, platform)
+        return klass(path, components, artifact_type, signature_type, platform, jobs, force)
 
 
 class SignWithBuildManifest(SignArtifacts):
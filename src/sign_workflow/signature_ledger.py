@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict
+
+from system.file_digest import file_digest
+
+"""
+This class records which artifacts have been signed, so that re-running signing on a partially signed tree only signs new or changed files.
+Each entry maps an artifact to the SHA-256 of its contents, its signature file and the SHA-256 of that signature, and the signer that produced it.
+Entries are appended to a JSON lines file as soon as an artifact is signed, so that progress survives a failed run. Later entries win.
+The ledger of a tree of artifacts is kept outside of that tree, so that it is never published with the artifacts, in a directory
+set in the SIGNATURE_LEDGER_DIR environment variable, or in ~/.cache/opensearch-build/signatures.
+"""
+
+
+class SignatureLedger:
+    def __init__(self, path: str, dir: str = None) -> None:
+        """
+        A ledger in path, of artifacts recorded relative to dir, by default the directory of path.
+        """
+        self.path = path
+        self.dir = os.path.realpath(dir) if dir else os.path.dirname(os.path.realpath(path))
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        if os.path.isfile(path):
+            with open(path, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # a run may have been interrupted while appending
+                        logging.warning(f"Ignoring invalid entry in {path}")
+                        continue
+                    self.entries[entry["artifact"]] = entry
+            logging.info(f"Loaded {len(self.entries)} signature(s) from {path}")
+
+    @classmethod
+    def default_dir(cls) -> str:
+        return os.getenv("SIGNATURE_LEDGER_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "signatures")
+
+    @classmethod
+    def for_dir(cls, dir: str) -> 'SignatureLedger':
+        """
+        The ledger of the artifacts in dir, named after the real path of dir and kept in the ledger directory.
+        """
+        real_dir = os.path.realpath(dir)
+        name = f"{os.path.basename(real_dir) or 'root'}-{hashlib.sha256(real_dir.encode()).hexdigest()[:12]}.jsonl"
+        return cls(os.path.join(cls.default_dir(), name), real_dir)
+
+    def __relpath(self, path: str) -> str:
+        return os.path.relpath(os.path.realpath(path), self.dir)
+
+    def is_signed(self, artifact: str, sha256: str, signature: str, signer: str) -> bool:
+        entry = self.entries.get(self.__relpath(artifact))
+        if entry is None or entry["sha256"] != sha256 or entry["signer"] != signer:
+            return False
+        if entry["signature"] != self.__relpath(signature) or not os.path.isfile(signature):
+            return False
+        return bool(entry["signature_sha256"] == file_digest(signature, "sha256"))
+
+    def record(self, artifact: str, sha256: str, signature: str, signer: str) -> None:
+        entry = {
+            "artifact": self.__relpath(artifact),
+            "sha256": sha256,
+            "signature": self.__relpath(signature),
+            "signature_sha256": file_digest(signature, "sha256"),
+            "signer": signer,
+        }
+        with self.lock:
+            self.entries[entry["artifact"]] = entry
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry, sort_keys=True) + "\n")
@@ -8,33 +8,121 @@
 
 import logging
 import os
+import subprocess
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Union
+
+from retry.api import retry_call  # type: ignore
 
 from git.git_repository import GitRepository
+from sign_workflow.signature_ledger import SignatureLedger
+from sign_workflow.signer_cache import SignerCache, SignerInstallation
+from system import thread_pool
+from system.file_digest import file_digest
+from system.tracer import Tracer
 
 
 class Signer(ABC):
-    git_repo: GitRepository
+    git_repo: Union[GitRepository, SignerInstallation]
+
+    SIGNER: str
+    TRIES = 3
+    RETRY_DELAY = 5
+    # failures of the signer client, e.g. when the signing service is unavailable, and network errors
+    TRANSIENT_ERRORS = (subprocess.CalledProcessError, ConnectionError)
+
+    class VerificationError(Exception):
+        def __init__(self, signature: str) -> None:
+            self.signature = signature
+            super().__init__(f"Signature {signature} could not be verified.")
 
-    def __init__(self) -> None:
-        self.git_repo = GitRepository(self.get_repo_url(), "HEAD", working_subdirectory="src")
-        self.git_repo.execute("./bootstrap")
-        self.git_repo.execute("rm config.cfg")
+    def __init__(self, jobs: int = 1, cache_dir: str = None, ledger: SignatureLedger = None, force: bool = False) -> None:
+        self.jobs = jobs
+        # artifacts recorded in the ledger with an up to date signature are not signed again, unless forced
+        self.ledger = ledger
+        self.force = force
+        self.timings: Dict[str, float] = {}
+        self.timings_lock = threading.Lock()
+        self.cache_dir = cache_dir or os.getenv("SIGNER_CACHE_DIR")
+        if self.cache_dir:
+            self.git_repo = SignerCache(self.cache_dir).install(self.get_repo_url(), self.__bootstrap)
+        else:
+            self.git_repo = GitRepository(self.get_repo_url(), "HEAD", working_subdirectory="src")
+            self.__bootstrap(self.git_repo)
+
+    def __bootstrap(self, git_repo: GitRepository) -> None:
+        with Tracer.default().span("bootstrap signer"):
+            git_repo.execute("./bootstrap")
+            git_repo.execute("rm config.cfg")
 
     def sign_artifact(self, artifact: str, basepath: Path, signature_type: str) -> None:
         if not self.is_valid_file_type(artifact):
             logging.info(f"Skipping signing of file {artifact}")
             return
-        self.generate_signature_and_verify(artifact, basepath, signature_type)
+        self.__sign_and_verify(artifact, basepath, signature_type)
 
     def sign_artifacts(self, artifacts: List[str], basepath: Path, signature_type: str) -> None:
+        valid_artifacts = []
         for artifact in artifacts:
             if not self.is_valid_file_type(artifact):
                 logging.info(f"Skipping signing of file {artifact}")
                 continue
+            valid_artifacts.append(artifact)
+
+        # each worker signs and then verifies one artifact, so that signing and verification overlap across artifacts
+        thread_pool.run(self.__sign_and_verify, [(artifact, basepath, signature_type) for artifact in valid_artifacts], self.jobs)
+
+    def signature_file(self, artifact: str, basepath: Path, signature_type: str) -> str:
+        return os.path.join(basepath, artifact) + signature_type
+
+    def __sign_and_verify(self, artifact: str, basepath: Path, signature_type: str) -> None:
+        location = os.path.join(basepath, artifact)
+        signature = self.signature_file(artifact, basepath, signature_type)
+        if self.ledger:
+            sha256 = file_digest(location, "sha256")
+            if not self.force and self.ledger.is_signed(location, sha256, signature, self.SIGNER):
+                logging.info(f"Skipping signing of file {artifact}, signature {signature} is up to date")
+                return
+        start = time.time()
+        with Tracer.default().span("sign", artifact=location) as span:
+            span.add_file(location)
+            # the signer is a remote service, retry transient failures with an exponential backoff, verification failures are not retried
+            retry_call(
+                self.__generate_signature_and_verify,
+                fargs=[artifact, basepath, signature_type],
+                exceptions=self.TRANSIENT_ERRORS,
+                tries=self.TRIES,
+                delay=self.RETRY_DELAY,
+                backoff=2,
+            )
+        with self.timings_lock:
+            self.timings[location] = time.time() - start
+        if self.ledger:
+            self.ledger.record(location, sha256, signature, self.SIGNER)
+
+    def __generate_signature_and_verify(self, artifact: str, basepath: Path, signature_type: str) -> None:
+        try:
             self.generate_signature_and_verify(artifact, basepath, signature_type)
+        except self.TRANSIENT_ERRORS:
+            location = os.path.join(basepath, artifact)
+            if not os.path.isfile(location):
+                # the signer client fails the same way for a missing artifact, which signing again will not fix
+                raise FileNotFoundError(f"Artifact {location} does not exist.")
+            raise
+
+    def log_summary(self) -> None:
+        if not self.timings:
+            return
+        elapsed = sorted(self.timings.values())
+        logging.info(
+            f"Signed {len(elapsed)} artifact(s) in {sum(elapsed):.1f}s of signer time, "
+            f"p50 {elapsed[len(elapsed) // 2]:.1f}s, p95 {elapsed[min(len(elapsed) - 1, len(elapsed) * 95 // 100)]:.1f}s, max {elapsed[-1]:.1f}s"
+        )
+        for path, seconds in sorted(self.timings.items(), key=lambda timing: timing[1], reverse=True)[0:5]:
+            logging.info(f"Signed {path} in {seconds:.1f}s")
 
     @abstractmethod
     def generate_signature_and_verify(self, artifact: str, basepath: Path, signature_type: str) -> None:
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+import shutil
+from typing import Callable, Optional
+
+from git.git_repository import GitRepository
+from system import subprocess_runner
+from system.cache_directory import CacheDirectory
+from system.file_lock import FileLock
+
+"""
+This class keeps bootstrapped installations of the signer client, one per commit of the signer client repository.
+The first job that needs a version checks it out and bootstraps it, later jobs on the same host reuse that installation.
+Least recently used installations are removed when the cache grows beyond `max_size` bytes, and installations not used for `max_age` seconds are removed.
+"""
+
+
+class SignerInstallation:
+    def __init__(self, dir: str, sha: str) -> None:
+        self.dir = dir
+        self.sha = sha
+
+    @property
+    def working_directory(self) -> str:
+        return os.path.join(self.dir, "src")
+
+    def execute(self, command: str, cwd: str = None) -> None:
+        cwd = cwd or self.working_directory
+        logging.info(f'Executing "{command}" in {cwd}')
+        subprocess_runner.check_call(command, cwd=cwd, shell=True)
+
+
+class SignerCache(CacheDirectory):
+    MARKER = ".installed"
+    MAX_SIZE = 5 * 1024 * 1024 * 1024
+    MAX_AGE = 14 * 24 * 60 * 60
+
+    def __init__(self, path: str, max_size: int = MAX_SIZE, max_age: int = MAX_AGE) -> None:
+        super().__init__(path, max_size, max_age)
+
+    def install(self, url: str, bootstrap: Callable[[GitRepository], None]) -> SignerInstallation:
+        sha = GitRepository.stable_ref(url, "HEAD")[0]
+        path = os.path.join(self.path, sha)
+        # bootstrapping may record absolute paths, so the client is installed in place and marked as complete when done
+        marker = os.path.join(path, self.MARKER)
+        with FileLock(f"{path}.lock"):
+            if os.path.isfile(marker):
+                # mark as recently used
+                os.utime(marker)
+                logging.info(f"Using signer client {sha} from {path}")
+            else:
+                shutil.rmtree(path, ignore_errors=True)
+                bootstrap(GitRepository(url, sha, path, working_subdirectory="src"))
+                open(marker, "w").close()
+                logging.info(f"Installed signer client {sha} into {path}")
+        self.evict(keep=path)
+        return SignerInstallation(path, sha)
+
+    def last_used(self, path: str) -> Optional[float]:
+        marker = os.path.join(path, self.MARKER)
+        # installations without a marker are being bootstrapped, or failed and will be replaced by the next install
+        return os.path.getmtime(marker) if os.path.isfile(marker) else None
+
+    def remove(self, path: str, last_used: float) -> bool:
+        with FileLock(f"{path}.lock"):
+            marker = os.path.join(path, self.MARKER)
+            # another job evicted it, or started using it in the meantime
+            if not os.path.isfile(marker) or os.path.getmtime(marker) > last_used:
+                return False
+            # an installation that is only partially removed is bootstrapped again
+            os.remove(marker)
+            shutil.rmtree(path, ignore_errors=True)
+            return True
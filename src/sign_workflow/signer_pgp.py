@@ -7,6 +7,7 @@
 # compatible open source license.
 
 import os
+import subprocess
 from pathlib import Path
 
 from sign_workflow.signer import Signer
@@ -20,6 +21,7 @@ The signed artifacts will be found in the same location as the original artifact
 class SignerPGP(Signer):
 
     ACCEPTED_FILE_TYPES = [".zip", ".jar", ".war", ".pom", ".module", ".tar.gz", ".whl", ".crate", ".rpm"]
+    SIGNER = "pgp"
 
     def generate_signature_and_verify(self, artifact: str, basepath: Path, signature_type: str) -> None:
         location = os.path.join(basepath, artifact)
@@ -42,10 +44,13 @@ class SignerPGP(Signer):
             "-o",
             signature_file,
             "-p",
-            "pgp",
+            self.SIGNER,
         ]
         self.git_repo.execute(" ".join(signing_cmd))
 
     def verify(self, filename: str) -> None:
         verify_cmd = ["gpg", "--verify-files", filename]
-        self.git_repo.execute(" ".join(verify_cmd))
+        try:
+            self.git_repo.execute(" ".join(verify_cmd))
+        except subprocess.CalledProcessError as e:
+            raise Signer.VerificationError(filename) from e
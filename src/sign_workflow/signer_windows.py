@@ -20,6 +20,7 @@ The signed artifacts will be found in the subfolder called signed under the orig
 class SignerWindows(Signer):
 
     ACCEPTED_FILE_TYPES = [".msi", ".exe", ".dll", ".sys", ".ps1", ".psm1", ".psd1", ".cat", ".zip"]
+    SIGNER = "windows"
 
     def generate_signature_and_verify(self, artifact: str, basepath: Path, signature_type: str) -> None:
         self.sign(artifact, basepath, signature_type)
@@ -29,6 +30,9 @@ class SignerWindows(Signer):
             file_name.endswith(x) for x in SignerWindows.ACCEPTED_FILE_TYPES
         )
 
+    def signature_file(self, artifact: str, basepath: Path, signature_type: str) -> str:
+        return os.path.join(basepath, "signed", artifact)
+
     def sign(self, artifact: str, basepath: Path, signature_type: str) -> None:
         filename = os.path.join(basepath, artifact)
         signed_prefix = "signed_"
@@ -41,11 +45,10 @@ class SignerWindows(Signer):
             "-o",
             signature_file,
             "-p",
-            "windows",
+            self.SIGNER,
         ]
         self.git_repo.execute(" ".join(signing_cmd))
         signed_folder = os.path.join(basepath, "signed")
-        if not os.path.exists(signed_folder):
-            os.mkdir(signed_folder)
+        os.makedirs(signed_folder, exist_ok=True)
         signed_location = os.path.join(signed_folder, artifact)
         os.rename(signature_file, signed_location)
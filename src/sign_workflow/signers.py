@@ -7,6 +7,7 @@
 # compatible open source license.
 
 
+from sign_workflow.signature_ledger import SignatureLedger
 from sign_workflow.signer import Signer
 from sign_workflow.signer_pgp import SignerPGP
 from sign_workflow.signer_windows import SignerWindows
@@ -26,6 +27,6 @@ class Signers:
         return klass  # type: ignore[return-value]
 
     @classmethod
-    def create(cls, platform: str) -> Signer:
+    def create(cls, platform: str, jobs: int = 1, ledger: SignatureLedger = None, force: bool = False) -> Signer:
         klass = cls.from_platform(platform)
-        return klass()  # type: ignore[no-any-return, operator]
+        return klass(jobs, ledger=ledger, force=force)  # type: ignore[no-any-return, operator]
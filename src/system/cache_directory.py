@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+import shutil
+import time
+from typing import List, Optional, Tuple
+
+"""
+This class is a local cache directory with one subdirectory per entry, dated by when it was last used.
+Least recently used entries are evicted when the cache grows beyond `max_size` bytes, and entries not used for `max_age` seconds are removed.
+"""
+
+
+class CacheDirectory:
+    def __init__(self, path: str, max_size: int, max_age: int) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.max_age = max_age
+
+    @classmethod
+    def size(cls, path: str) -> int:
+        """
+        The size of the files in path, links are not followed.
+        """
+        size = 0
+        for dir, _, files in os.walk(path):
+            for file_name in files:
+                file_path = os.path.join(dir, file_name)
+                if not os.path.islink(file_path):
+                    size += os.path.getsize(file_path)
+        return size
+
+    def last_used(self, path: str) -> Optional[float]:
+        """
+        When the entry in path was last used, None when path is not a complete entry.
+        """
+        return os.path.getmtime(path) if os.path.isdir(path) else None
+
+    def remove(self, path: str, last_used: float) -> bool:
+        """
+        Remove the entry in path, last used at last_used.
+        :returns whether the entry was removed.
+        """
+        shutil.rmtree(path, ignore_errors=True)
+        return True
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """
+        The entries of the cache, least recently used first, with when they were last used and their size.
+        """
+        entries = []
+        for name in os.listdir(self.path) if os.path.isdir(self.path) else []:
+            path = os.path.join(self.path, name)
+            last_used = None if name.startswith(".") else self.last_used(path)
+            if last_used is not None:
+                entries.append((last_used, self.size(path), path))
+        return sorted(entries)
+
+    def evict(self, keep: str = None) -> None:
+        """
+        Evict entries, least recently used first, except for the entry in keep, e.g. one that was just added.
+        """
+        entries = self.entries()
+        total_size = sum(size for _, size, _ in entries)
+        now = time.time()
+        for last_used, size, path in entries:
+            if path == keep or (total_size <= self.max_size and now - last_used <= self.max_age):
+                continue
+            logging.info(f"Evicting {os.path.basename(path)} from {self.path}")
+            if self.remove(path, last_used):
+                total_size -= size
@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import threading
+from typing import Any, Dict, Type, TypeVar
+
+T = TypeVar("T", bound="DefaultInstance")
+
+
+class DefaultInstance:
+    """
+    Gives a class one instance shared by the whole process, created by __create_default__ the first time default() is called.
+    """
+
+    __instances__: Dict[type, Any] = {}
+    # a default instance may use the default instance of another class while it is created
+    __instances_lock__ = threading.RLock()
+
+    @classmethod
+    def default(cls: Type[T]) -> T:
+        with DefaultInstance.__instances_lock__:
+            if cls not in DefaultInstance.__instances__:
+                DefaultInstance.__instances__[cls] = cls.__create_default__()
+            instance: T = DefaultInstance.__instances__[cls]
+            return instance
+
+    @classmethod
+    def __create_default__(cls: Type[T]) -> T:
+        return cls()
@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import requests
+from retry.api import retry_call  # type: ignore
+
+from system import thread_pool
+from system.default_instance import DefaultInstance
+from system.file_digest import file_digest
+from system.file_lock import FileLock
+from system.file_materializer import FileMaterializer
+
+"""
+This class downloads files over HTTP on a bounded pool of threads that share a pool of keep-alive connections.
+Files are downloaded into a .part file next to their destination, failed requests are retried with a jittered exponential backoff,
+and an interrupted download is resumed with a range request.
+When a .sha512 file is published next to a file, the download is verified against it. A .sha512 file that is downloaded along with its file
+is fetched once, before the file, and used to verify it.
+When a cache directory is given, or set in the DOWNLOAD_CACHE_DIR environment variable, downloaded files are kept in that directory
+and copied from it by later downloads of the same URL. A cached file is checked against the published checksum when there is one,
+and otherwise revalidated with a conditional request using the ETag and Last-Modified headers it was downloaded with.
+"""
+
+
+class Downloader(DefaultInstance):
+    TRIES = 3
+    RETRY_DELAY = 1
+    RETRY_JITTER = (0, 1)
+    # data read in a chunk is lost when a connection breaks, keep chunks small so that a resumed download repeats little
+    CHUNK_SIZE = 64 * 1024
+    TIMEOUT = 60
+
+    # files that are checksums or signatures themselves, checksums are not published for these
+    UNVERIFIED_EXTENSIONS = [".asc", ".md5", ".sha1", ".sha256", ".sha512"]
+    CHECKSUM_EXTENSION = ".sha512"
+
+    class ServerError(requests.HTTPError):
+        pass
+
+    class ChecksumError(Exception):
+        def __init__(self, url: str, expected: str, actual: str) -> None:
+            self.url = url
+            super().__init__(f"Checksum of {url} does not match, expected sha512 {expected}, but was {actual}.")
+
+    def __init__(self, jobs: int = thread_pool.WORKERS, cache_dir: str = None) -> None:
+        self.jobs = jobs
+        self.cache_dir = cache_dir or os.getenv("DOWNLOAD_CACHE_DIR")
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=jobs, pool_maxsize=jobs)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.materializer = FileMaterializer(link=False)
+        self.files_downloaded = 0
+        self.files_cached = 0
+        self.bytes_downloaded = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def download_all(self, downloads: List[Tuple[str, str]]) -> None:
+        """
+        Download (url, dest) pairs on a pool of `jobs` threads, raising the error of the first download that fails.
+        """
+        urls = set(url for url, _ in downloads)
+        # the checksums of other files in the batch are downloaded first, and verify those files rather than being fetched again
+        checksums = [(url, dest) for url, dest in downloads if url.endswith(self.CHECKSUM_EXTENSION) and url[:-len(self.CHECKSUM_EXTENSION)] in urls]
+        thread_pool.run(self.download, checksums, self.jobs)
+        checksum_dests = {url[:-len(self.CHECKSUM_EXTENSION)]: dest for url, dest in checksums}
+        files = [(url, dest, self.read_checksum(checksum_dests[url]) if url in checksum_dests else None) for url, dest in downloads if (url, dest) not in checksums]
+        thread_pool.run(self.download, files, self.jobs)
+
+    def download(self, url: str, dest: str, checksum: str = None) -> str:
+        """
+        Download url into dest, verified against checksum when the sha512 of url is known already, and otherwise against the published one.
+        """
+        started = time.time()
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        checksum = checksum or self.__published_checksum(url)
+        if not self.cache_dir:
+            self.__fetch(url, dest, checksum)
+            self.__record(started, cached=False)
+            return dest
+
+        entry = os.path.join(self.cache_dir, hashlib.sha256(url.encode()).hexdigest(), os.path.basename(urllib.parse.urlparse(url).path))
+        with FileLock(f"{os.path.dirname(entry)}.lock"):
+            cached = False
+            if os.path.isfile(entry) and checksum is not None:
+                cached = file_digest(entry) == checksum
+                if not cached:
+                    self.__fetch(url, entry, checksum)
+            else:
+                cached = not self.__fetch(url, entry, checksum, self.__cached_headers(entry))
+            if cached:
+                logging.info(f"Using {url} from {entry}")
+        self.materializer.materialize(entry, dest)
+        self.__record(started, cached)
+        return dest
+
+    def __record(self, started: float, cached: bool) -> None:
+        with self.lock:
+            self.started = min(self.started or started, started)
+            self.finished = time.time()
+            if cached:
+                self.files_cached += 1
+            else:
+                self.files_downloaded += 1
+
+    @property
+    def summary(self) -> str:
+        with self.lock:
+            elapsed = max((self.finished or 0) - (self.started or 0), 0.001)
+            megabytes = self.bytes_downloaded / (1024 * 1024)
+            files = self.files_downloaded + self.files_cached
+            return (
+                f"Downloaded {self.files_downloaded} file(s) ({megabytes:.1f} MB) and used {self.files_cached} file(s) from cache in {elapsed:.1f}s"
+                f" ({megabytes / elapsed:.1f} MB/s, {files / elapsed:.1f} files/s)"
+            )
+
+    def log_summary(self) -> None:
+        if self.files_downloaded or self.files_cached:
+            logging.info(self.summary)
+
+    def __published_checksum(self, url: str) -> Optional[str]:
+        if os.path.splitext(urllib.parse.urlparse(url).path)[1] in self.UNVERIFIED_EXTENSIONS:
+            return None
+        checksum: Optional[str] = self.__retry(self.__fetch_checksum, [f"{url}{self.CHECKSUM_EXTENSION}"])
+        return checksum
+
+    @classmethod
+    def read_checksum(cls, path: str) -> Optional[str]:
+        """
+        The checksum in a .sha512 file that has been downloaded, if any.
+        """
+        if not os.path.isfile(path):
+            return None
+        with open(path, "r") as f:
+            return cls.__parse_checksum(f.read())
+
+    def __fetch_checksum(self, url: str) -> Optional[str]:
+        response = self.session.get(url, timeout=self.TIMEOUT)
+        if response.status_code == 404:
+            return None
+        self.__raise_for_status(response)
+        return self.__parse_checksum(response.text)
+
+    @classmethod
+    def __parse_checksum(cls, text: str) -> Optional[str]:
+        # the file is in the format of sha512sum, i.e. "<checksum>  <filename>"
+        words = text.split()
+        return words[0].lower() if words else None
+
+    def __raise_for_status(self, response: requests.Response) -> None:
+        if response.status_code >= 500:
+            raise Downloader.ServerError(f"{response.status_code} Server Error: {response.reason} for url: {response.url}", response=response)
+        response.raise_for_status()
+
+    def __retry(self, function: Any, fargs: List[Any]) -> Any:
+        # client errors, e.g. a missing file, are not retried
+        return retry_call(
+            function,
+            fargs=fargs,
+            exceptions=(requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError, Downloader.ServerError),
+            tries=self.TRIES,
+            delay=self.RETRY_DELAY,
+            backoff=2,
+            jitter=self.RETRY_JITTER,
+        )
+
+    def __cached_headers(self, entry: str) -> Dict[str, str]:
+        try:
+            with open(f"{entry}.headers.json", "r") as f:
+                return dict(json.load(f)) if os.path.isfile(entry) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __fetch(self, url: str, dest: str, checksum: Optional[str], cached_headers: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Download url into dest, unless the server replies that dest, downloaded with cached_headers, is not modified.
+        :returns whether dest was downloaded.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        part = f"{dest}.part"
+        # a failed attempt leaves the .part file behind, the next attempt resumes it
+        headers = self.__retry(self.__fetch_part, [url, part, cached_headers or {}])
+        if headers is None:
+            return False
+        logging.info(f"Downloaded {url} into {dest}")
+        if checksum is not None:
+            actual = file_digest(part)
+            if actual != checksum:
+                os.remove(part)
+                raise Downloader.ChecksumError(url, checksum, actual)
+        os.replace(part, dest)
+        if self.cache_dir:
+            with open(f"{dest}.headers.json", "w") as f:
+                json.dump({key: headers[key] for key in ["ETag", "Last-Modified"] if key in headers}, f)
+        return True
+
+    def __fetch_part(self, url: str, part: str, cached_headers: Dict[str, str]) -> Optional[Mapping[str, str]]:
+        offset = os.path.getsize(part) if os.path.isfile(part) else 0
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        elif "ETag" in cached_headers:
+            headers["If-None-Match"] = cached_headers["ETag"]
+        elif "Last-Modified" in cached_headers:
+            headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+        with self.session.get(url, headers=headers, stream=True, timeout=self.TIMEOUT) as response:
+            if response.status_code == 304:
+                return None
+            if response.status_code == 416:
+                # the .part file is already complete
+                return response.headers
+            self.__raise_for_status(response)
+            if response.status_code != 206:
+                # the server ignored the range, start over
+                offset = 0
+            else:
+                logging.info(f"Resuming {url} at {offset} byte(s)")
+            with open(part, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    f.write(chunk)
+                    with self.lock:
+                        self.bytes_downloaded += len(chunk)
+            return response.headers
@@ -5,9 +5,10 @@
 # compatible open source license.
 
 import logging
-import subprocess
 from typing import Any, Tuple
 
+from system import subprocess_runner
+
 
 def execute(command: str, dir: str, capture: bool = True, raise_on_failure: bool = True) -> Tuple[int, Any, Any]:
     """
@@ -19,7 +20,7 @@ def execute(command: str, dir: str, capture: bool = True, raise_on_failure: bool
     :returns a tuple containing the exit code, stdout, and stderr.
     """
     logging.info(f'Executing "{command}" in {dir}')
-    result = subprocess.run(command, cwd=dir, shell=True, capture_output=capture, text=True)
+    result = subprocess_runner.run(command, cwd=dir, shell=True, capture_output=capture, text=True)
     if raise_on_failure:
         result.check_returncode()
     return result.returncode, result.stdout, result.stderr
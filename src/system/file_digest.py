@@ -0,0 +1,20 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: str, algorithm: str = "sha512") -> str:
+    """
+    The hex digest of the contents of a file, e.g. its SHA-512, read in chunks so that large files are not loaded in memory.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
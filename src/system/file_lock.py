@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+import sys
+import time
+from typing import IO, Any
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    An exclusive lock on a file, shared between threads and processes on the same host.
+    The lock file is created if it does not exist, and is left behind when the lock is released.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file: IO = None
+
+    def __enter__(self) -> 'FileLock':
+        os.makedirs(os.path.dirname(os.path.realpath(self.path)), exist_ok=True)
+        self.file = open(self.path, "a+")
+        logging.debug(f"Acquiring lock on {self.path}")
+        if sys.platform == "win32":
+            self.file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+        else:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        if sys.platform == "win32":
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.file.close()
+        self.file = None
+        logging.debug(f"Released lock on {self.path}")
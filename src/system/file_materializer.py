@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import logging
+import os
+import shutil
+import sys
+import threading
+from typing import Callable, Dict, Set, Tuple
+
+if sys.platform != "win32":
+    import fcntl
+
+"""
+This class places a copy of a file at a destination path with the cheapest strategy the filesystems involved support,
+in order: a reflink (copy-on-write clone), a hard link, an in-kernel copy_file_range, and a plain copy.
+Hard links share the file with its source, so they are only used when `link` is set and neither side is modified later.
+Strategies that a pair of filesystems does not support are detected on first use and skipped for the rest of the process,
+strategies that fail for a single file, e.g. one that may not be hard-linked, fall back to the next one for that file only.
+"""
+
+
+class FileMaterializer:
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    COPY_FILE_RANGE = "copy_file_range"
+    COPY = "copy"
+
+    # ioctl to clone a file on Linux filesystems that support copy-on-write, e.g. btrfs and xfs
+    FICLONE = 0x40049409
+
+    # errors that mean a strategy is not supported between two filesystems, rather than a problem with one file
+    UNSUPPORTED_ERRORS = [errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.ENOSYS]
+    # errors that mean a strategy cannot be used for one file, e.g. a file with too many links, or one that may not be linked
+    FALLBACK_ERRORS = [errno.EMLINK, errno.EINVAL, errno.EPERM, errno.EBADF]
+
+    __unsupported__: Set[Tuple[int, int, str]] = set()
+    __unsupported_lock__ = threading.Lock()
+
+    def __init__(self, link: bool = True) -> None:
+        self.strategies = [self.REFLINK, self.HARDLINK, self.COPY_FILE_RANGE, self.COPY] if link else [self.REFLINK, self.COPY_FILE_RANGE, self.COPY]
+        self.files: Dict[str, int] = {}
+        self.bytes_linked = 0
+        self.bytes_copied = 0
+        self.lock = threading.Lock()
+
+    def materialize(self, source: str, dest: str, link: bool = True) -> str:
+        """
+        Place the contents of source at dest, replacing dest if it exists.
+        Unset link when source may be modified later, e.g. when it is in a cache, to never hard-link it.
+        :returns the strategy that was used.
+        """
+        if os.path.lexists(dest):
+            # never write through an existing file, it may be linked to another one
+            os.remove(dest)
+        size = os.path.getsize(source)
+        devices = (os.stat(source).st_dev, os.stat(os.path.dirname(os.path.abspath(dest))).st_dev)
+        for strategy in self.strategies:
+            if strategy == self.HARDLINK and not link:
+                continue
+            with self.__unsupported_lock__:
+                if devices + (strategy,) in self.__unsupported__:
+                    continue
+            try:
+                self.__strategy(strategy)(source, dest)
+            except OSError as e:
+                if strategy == self.COPY:
+                    raise
+                if os.path.lexists(dest):
+                    os.remove(dest)
+                if e.errno in self.UNSUPPORTED_ERRORS:
+                    logging.debug(f"Cannot use {strategy} from {source} to {dest}: {e}")
+                    with self.__unsupported_lock__:
+                        self.__unsupported__.add(devices + (strategy,))
+                elif e.errno in self.FALLBACK_ERRORS:
+                    logging.debug(f"Cannot use {strategy} from {source} to {dest}, falling back: {e}")
+                else:
+                    raise
+                continue
+            with self.lock:
+                self.files[strategy] = self.files.get(strategy, 0) + 1
+                if strategy in [self.REFLINK, self.HARDLINK]:
+                    self.bytes_linked += size
+                else:
+                    self.bytes_copied += size
+            return strategy
+        raise OSError(errno.ENOTSUP, f"Cannot materialize {source} into {dest}")
+
+    def __strategy(self, strategy: str) -> Callable[[str, str], None]:
+        strategies: Dict[str, Callable[[str, str], None]] = {
+            self.REFLINK: self.__reflink,
+            self.HARDLINK: os.link,
+            self.COPY_FILE_RANGE: self.__copy_file_range,
+            self.COPY: self.__copy,
+        }
+        return strategies[strategy]
+
+    def __reflink(self, source: str, dest: str) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.EOPNOTSUPP, "reflinks are only supported on Linux")
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), self.FICLONE, src.fileno())
+
+    def __copy_file_range(self, source: str, dest: str) -> None:
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is None:
+            raise OSError(errno.ENOSYS, "copy_file_range is not available")
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+
+    def __copy(self, source: str, dest: str) -> None:
+        shutil.copyfile(source, dest)
+
+    @property
+    def summary(self) -> str:
+        with self.lock:
+            files = ", ".join(f"{count} by {strategy}" for strategy, count in sorted(self.files.items()))
+            return f"Materialized {sum(self.files.values())} file(s) ({files or 'none'}), {self.bytes_linked} byte(s) linked, {self.bytes_copied} byte(s) copied"
+
+    def log_summary(self) -> None:
+        if self.files:
+            logging.info(self.summary)
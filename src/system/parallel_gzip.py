@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import io
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, List
+
+"""
+This class is a write-only gzip stream that compresses fixed-size blocks on a pool of threads, similar to pigz.
+Each block is written as an independent gzip member, and a gzip file made of concatenated members is a standard
+gzip file that can be read by gzip, tar and Python's gzip and tarfile modules.
+Member headers carry no file name or timestamp, so that identical input always produces identical output.
+zlib releases the GIL while compressing, which is what makes compressing on threads effective.
+"""
+
+
+class ParallelGzipFile(io.RawIOBase):
+    BLOCK_SIZE = 4 * 1024 * 1024
+
+    # magic, deflate, no flags, zero mtime, no extra flags, unknown OS
+    HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+    def __init__(self, path: str, compresslevel: int = 6, workers: int = None, block_size: int = BLOCK_SIZE) -> None:
+        super().__init__()
+        self.path = path
+        self.compresslevel = compresslevel
+        self.workers = workers or os.cpu_count() or 1
+        self.block_size = block_size
+        self.file = open(path, "wb")
+        self.buffer: List[bytes] = []
+        self.buffered = 0
+        self.pending: Deque[Future] = deque()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+
+    @classmethod
+    def compress(cls, data: bytes, compresslevel: int) -> bytes:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+        body = compressor.compress(data) + compressor.flush()
+        return cls.HEADER + body + struct.pack("<II", zlib.crc32(data) & 0xFFFFFFFF, len(data) & 0xFFFFFFFF)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.buffer.append(bytes(data))
+        self.buffered += len(data)
+        while self.buffered >= self.block_size:
+            block = b"".join(self.buffer)
+            self.__submit(block[:self.block_size])
+            rest = block[self.block_size:]
+            self.buffer = [rest]
+            self.buffered = len(rest)
+        return len(data)
+
+    def __submit(self, block: bytes) -> None:
+        self.pending.append(self.executor.submit(self.compress, block, self.compresslevel))
+        # bound memory use by writing out compressed members in order once enough blocks are in flight
+        while len(self.pending) > 2 * self.workers:
+            self.file.write(self.pending.popleft().result())
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        try:
+            if self.buffered or not self.pending:
+                self.__submit(b"".join(self.buffer))
+            while self.pending:
+                self.file.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown()
+            self.file.close()
+            self.file = None
+            self.buffer = []
+            self.buffered = 0
+            super().close()
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import socket
+import threading
+from typing import List, Set
+
+"""
+This class hands out free TCP ports on the local host, so that several services can run side by side.
+A port is free when the operating system lets us bind it. Ports are reserved until they are released,
+so that two callers in the same process never get the same port before either of them has started listening on it.
+Another process may still start listening on a port between its allocation and the service binding it, a service that fails to start
+while another process listens on one of its ports is started again on other ports, see `retry`.
+"""
+
+
+class PortAllocator:
+    # times to start a service on newly allocated ports when other processes took its ports first
+    TRIES = 3
+
+    def __init__(self) -> None:
+        self.reserved: Set[int] = set()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def free_port(cls) -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            return int(s.getsockname()[1])
+
+    @classmethod
+    def in_use(cls, ports: List[int]) -> List[int]:
+        """
+        The ports that a process listens on.
+        """
+        results = []
+        for port in ports:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                # connections of a terminated service that linger in TIME_WAIT do not count
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                try:
+                    s.bind(("127.0.0.1", port))
+                except OSError:
+                    results.append(port)
+        return results
+
+    @classmethod
+    def retry(cls, ports: List[int], attempt: int) -> bool:
+        """
+        Whether a service that failed to start on ports, and was terminated, should be started again on other ports,
+        i.e. when another process listens on one of them, at most TRIES times.
+        """
+        taken = cls.in_use(ports)
+        if not taken or attempt >= cls.TRIES:
+            return False
+        logging.warning(f"Ports {taken} were taken by another process, starting again on other ports")
+        return True
+
+    def allocate(self, count: int = 1) -> List[int]:
+        ports: List[int] = []
+        with self.lock:
+            while len(ports) < count:
+                port = self.free_port()
+                if port not in self.reserved and port not in ports:
+                    ports.append(port)
+            self.reserved.update(ports)
+        logging.debug(f"Allocated ports {ports}")
+        return ports
+
+    def release(self, ports: List[int]) -> None:
+        with self.lock:
+            self.reserved.difference_update(ports)
@@ -5,34 +5,56 @@
 # compatible open source license.
 import logging
 import subprocess
-import tempfile
-from typing import Any
+import time
+from typing import Any, Callable, List
 
 import psutil
 
+from system.process_output import ProcessOutput
+
 
 class Process:
+    # seconds to wait for the output of a terminated process to be read
+    OUTPUT_TIMEOUT = 10
+
     def __init__(self) -> None:
         self.process: subprocess.Popen[bytes] = None
-        self.stdout: Any = None
-        self.stderr: Any = None
-        self.__stdout_data__: str = None
-        self.__stderr_data__: str = None
+        self.stdout: ProcessOutput = None
+        self.stderr: ProcessOutput = None
+        self.stdout_callbacks: List[Callable[[str], None]] = []
+        self.stderr_callbacks: List[Callable[[str], None]] = []
+        self.start_time: float = None
+
+    def on_stdout(self, callback: Callable[[str], None]) -> None:
+        """
+        Call callback with each line of stdout, as it is written by the process.
+        """
+        self.stdout_callbacks.append(callback)
+
+    def on_stderr(self, callback: Callable[[str], None]) -> None:
+        """
+        Call callback with each line of stderr, as it is written by the process.
+        """
+        self.stderr_callbacks.append(callback)
 
     def start(self, command: str, cwd: str) -> None:
         if self.started:
             raise ProcessStartedError(self.pid)
 
-        self.stdout = tempfile.NamedTemporaryFile(mode="r+")
-        self.stderr = tempfile.NamedTemporaryFile(mode="r+")
+        self.close()
+        self.stdout = ProcessOutput(self.stdout_callbacks)
+        self.stderr = ProcessOutput(self.stderr_callbacks)
 
+        self.start_time = time.time()
         self.process = subprocess.Popen(
             command,
             cwd=cwd,
             shell=True,
-            stdout=self.stdout,
-            stderr=self.stderr,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
+        self.stdout.start(self.process.stdout)
+        self.stderr.start(self.process.stderr)
 
     def terminate(self) -> int:
         if not self.started:
@@ -52,21 +74,22 @@ class Process:
 
         logging.info(f"Process killed with exit code {self.process.returncode}")
 
-        if self.stdout:
-            self.__stdout_data__ = self.stdout.read()
-            self.stdout.close()
-            self.stdout = None
-
-        if self.stderr:
-            self.__stderr_data__ = self.stderr.read()
-            self.stderr.close()
-            self.stderr = None
+        self.stdout.join(self.OUTPUT_TIMEOUT)
+        self.stderr.join(self.OUTPUT_TIMEOUT)
 
         self.return_code = self.process.returncode
         self.process = None
 
         return self.return_code
 
+    def close(self) -> None:
+        """
+        Remove the files with the full output of the last process started.
+        """
+        for output in [self.stdout, self.stderr]:
+            if output:
+                output.close()
+
     @property
     def started(self) -> bool:
         return True if self.process else False
@@ -77,11 +100,25 @@ class Process:
 
     @property
     def stdout_data(self) -> Any:
-        return self.stdout.read() if self.stdout else self.__stdout_data__
+        """
+        The most recent lines of stdout, the full output is in the file at stdout_path.
+        """
+        return self.stdout.data if self.stdout else None
 
     @property
     def stderr_data(self) -> Any:
-        return self.stderr.read() if self.stderr else self.__stderr_data__
+        """
+        The most recent lines of stderr, the full output is in the file at stderr_path.
+        """
+        return self.stderr.data if self.stderr else None
+
+    @property
+    def stdout_path(self) -> str:
+        return self.stdout.path if self.stdout else None
+
+    @property
+    def stderr_path(self) -> str:
+        return self.stderr.path if self.stderr else None
 
 
 class ProcessStartedError(Exception):
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import collections
+import logging
+import tempfile
+import threading
+from typing import IO, Callable, Deque, List
+
+"""
+This class captures an output stream of a process, e.g. its stdout, on a background thread.
+Every line is written to a file on disk, and passed to the callbacks subscribed to the stream, while only the most recent `lines`
+are kept in memory. The file holds the full output, and is removed when the capture is closed.
+"""
+
+
+class ProcessOutput:
+    LINES = 10000
+
+    def __init__(self, callbacks: List[Callable[[str], None]] = None, lines: int = LINES) -> None:
+        self.file = tempfile.NamedTemporaryFile(mode="wb+")
+        self.lines: Deque[str] = collections.deque(maxlen=lines)
+        self.callbacks = callbacks if callbacks is not None else []
+        self.lock = threading.Lock()
+        self.thread: threading.Thread = None
+
+    @property
+    def path(self) -> str:
+        return self.file.name
+
+    def start(self, stream: IO[bytes]) -> None:
+        self.thread = threading.Thread(target=self.__read, args=(stream,), daemon=True)
+        self.thread.start()
+
+    def __read(self, stream: IO[bytes]) -> None:
+        try:
+            for data in iter(stream.readline, b""):
+                # flushed, so that the file can be read while the process is running
+                self.file.write(data)
+                self.file.flush()
+                line = data.decode(errors="replace").rstrip("\r\n")
+                with self.lock:
+                    self.lines.append(line)
+                for callback in list(self.callbacks):
+                    try:
+                        callback(line)
+                    except Exception as e:
+                        logging.warning(f"Error processing output line: {e}")
+        finally:
+            stream.close()
+
+    def join(self, timeout: float = None) -> None:
+        """
+        Wait for the end of the stream, i.e. for the process and its children to exit.
+        """
+        if self.thread:
+            self.thread.join(timeout)
+
+    @property
+    def data(self) -> str:
+        """
+        The most recent lines of output.
+        """
+        with self.lock:
+            return "".join(f"{line}\n" for line in self.lines)
+
+    def close(self) -> None:
+        self.file.close()
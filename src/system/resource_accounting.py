@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import contextvars
+import logging
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple
+
+import yaml
+
+from system.default_instance import DefaultInstance
+
+"""
+These classes account for the resources used by the commands that workflows run, i.e. their wall time, user and system CPU time,
+peak RSS and block I/O. Commands run while a component is being built or tested are added up per component, all commands are added up
+for the workflow. A budget, e.g. `cpu=3600,rss=8192`, set in the RESOURCE_BUDGET environment variable, limits the resources of each
+component, in seconds and MB. A component that exceeds its budget is reported, or fails when RESOURCE_BUDGET_ACTION is `fail`.
+"""
+
+
+class ResourceUsage:
+    def __init__(
+        self,
+        wall_time: float = 0.0,
+        user_time: float = 0.0,
+        system_time: float = 0.0,
+        max_rss_kb: int = 0,
+        read_bytes: int = 0,
+        write_bytes: int = 0,
+        commands: int = 0
+    ) -> None:
+        self.wall_time = wall_time
+        self.user_time = user_time
+        self.system_time = system_time
+        self.max_rss_kb = max_rss_kb
+        self.read_bytes = read_bytes
+        self.write_bytes = write_bytes
+        self.commands = commands
+
+    @classmethod
+    def from_rusage(cls, wall_time: float, rusage: Any) -> 'ResourceUsage':
+        """
+        The usage of a command that ran for wall_time seconds, from the struct rusage of the process, if any.
+        """
+        if rusage is None:
+            return cls(wall_time, commands=1)
+        # ru_maxrss is in bytes on macOS, and in KB elsewhere, ru_inblock and ru_oublock count 512 byte blocks
+        max_rss_kb = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+        return cls(wall_time, rusage.ru_utime, rusage.ru_stime, max_rss_kb, rusage.ru_inblock * 512, rusage.ru_oublock * 512, 1)
+
+    @property
+    def cpu_time(self) -> float:
+        return self.user_time + self.system_time
+
+    @property
+    def io_bytes(self) -> int:
+        return self.read_bytes + self.write_bytes
+
+    def __add__(self, other: 'ResourceUsage') -> 'ResourceUsage':
+        return ResourceUsage(
+            self.wall_time + other.wall_time,
+            self.user_time + other.user_time,
+            self.system_time + other.system_time,
+            max(self.max_rss_kb, other.max_rss_kb),
+            self.read_bytes + other.read_bytes,
+            self.write_bytes + other.write_bytes,
+            self.commands + other.commands
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "commands": self.commands,
+            "wall_time": round(self.wall_time, 3),
+            "user_time": round(self.user_time, 3),
+            "system_time": round(self.system_time, 3),
+            "max_rss_kb": self.max_rss_kb,
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.commands} command(s), {self.wall_time:.1f}s wall, {self.user_time:.1f}s user, {self.system_time:.1f}s system, "
+            f"{self.max_rss_kb // 1024}MB peak RSS, {self.read_bytes // 2**20}MB read, {self.write_bytes // 2**20}MB written"
+        )
+
+
+class ResourceBudget:
+    # metric: (description, unit, usage in that unit)
+    METRICS = {
+        "wall": ("wall time", "s", lambda usage: usage.wall_time),
+        "cpu": ("CPU time", "s", lambda usage: usage.cpu_time),
+        "rss": ("peak RSS", "MB", lambda usage: usage.max_rss_kb / 1024),
+        "io": ("block I/O", "MB", lambda usage: usage.io_bytes / 2**20),
+    }
+
+    def __init__(self, limits: Dict[str, float] = None) -> None:
+        self.limits = limits or {}
+        for metric in self.limits:
+            if metric not in self.METRICS:
+                raise ValueError(f"Invalid resource budget metric: {metric}, expected one of {', '.join(self.METRICS)}")
+
+    @classmethod
+    def parse(cls, value: str) -> 'ResourceBudget':
+        """
+        Parse a budget, e.g. `cpu=3600,rss=8192`.
+        """
+        limits: Dict[str, float] = {}
+        for limit in filter(None, (limit.strip() for limit in (value or "").split(","))):
+            metric, _, amount = limit.partition("=")
+            limits[metric.strip()] = float(amount)
+        return cls(limits)
+
+    def exceeded(self, usage: ResourceUsage) -> List[Tuple[str, str]]:
+        """
+        The metrics of usage that exceed the budget, with a description of each.
+        """
+        results = []
+        for metric, limit in self.limits.items():
+            description, unit, measure = self.METRICS[metric]
+            used = measure(usage)
+            if used > limit:
+                results.append((metric, f"{description} of {used:.1f}{unit} exceeds {limit:g}{unit}"))
+        return results
+
+
+class ResourceBudgetExceededException(Exception):
+    """
+    Indicates that a component used more resources than allowed by the budget.
+    """
+
+    pass
+
+
+class ResourceAccounting(DefaultInstance):
+    # the component that commands are accounted to, copied to the threads of system.thread_pool and BuildScheduler
+    current: contextvars.ContextVar = contextvars.ContextVar("resource_accounting_component", default=None)
+
+    def __init__(self, budget: ResourceBudget = None, fail: bool = False) -> None:
+        self.budget = budget or ResourceBudget()
+        self.fail = fail
+        self.total = ResourceUsage()
+        self.components: Dict[str, ResourceUsage] = {}
+        self.reported: Set[Tuple[str, str]] = set()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def __create_default__(cls) -> 'ResourceAccounting':
+        return cls(ResourceBudget.parse(os.getenv("RESOURCE_BUDGET")), os.getenv("RESOURCE_BUDGET_ACTION") == "fail")
+
+    @property
+    def current_component(self) -> Optional[str]:
+        component: Optional[str] = self.current.get()
+        return component
+
+    @contextmanager
+    def component(self, name: str) -> Generator[None, None, None]:
+        """
+        Account the commands run in this context to the named component, including those run on the threads that it is copied to.
+        """
+        token = self.current.set(name)
+        try:
+            yield
+        finally:
+            self.current.reset(token)
+
+    def record(self, command: Any, usage: ResourceUsage) -> None:
+        component = self.current_component
+        logging.debug(f"Command {command!r} used {usage}")
+        with self.lock:
+            self.total += usage
+            if component is None:
+                return
+            self.components[component] = self.components.get(component, ResourceUsage()) + usage
+            exceeded = [(metric, description) for metric, description in self.budget.exceeded(self.components[component])
+                        if self.fail or (component, metric) not in self.reported]
+            self.reported.update((component, metric) for metric, _ in exceeded)
+        if not exceeded:
+            return
+        message = f"{component} exceeded its resource budget: {', '.join(description for _, description in exceeded)}"
+        if self.fail:
+            raise ResourceBudgetExceededException(message)
+        logging.warning(message)
+
+    def write(self, path: str) -> None:
+        with self.lock:
+            components = dict(sorted(self.components.items()))
+            data = {
+                "total": self.total.to_dict(),
+                "components": {name: usage.to_dict() for name, usage in components.items()},
+            }
+        for name, usage in components.items():
+            logging.info(f"{name} used {usage}")
+        logging.info(f"Commands used {self.total}")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            yaml.dump(data, f, sort_keys=False)
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import subprocess
+import threading
+import time
+from typing import IO, Any, Dict, Tuple
+
+from system.resource_accounting import ResourceAccounting, ResourceUsage
+from system.tracer import Tracer
+
+"""
+These functions replace subprocess.run, subprocess.check_call and subprocess.check_output, and record the resources used by each
+command with ResourceAccounting, and in the spans of the Tracer running on the calling thread. Commands are reaped with os.wait4, the resources include those of the processes that the command waited for,
+e.g. the children of a shell. Like subprocess.run, input is sent to the standard input of the command, and a command that runs for longer than
+timeout seconds is killed and raises subprocess.TimeoutExpired.
+"""
+
+
+def run(command: Any, capture_output: bool = False, check: bool = False, input: Any = None, timeout: float = None, **kwargs: Any) -> subprocess.CompletedProcess:
+    if input is not None:
+        if kwargs.get("stdin") is not None:
+            raise ValueError("stdin and input arguments may not both be used.")
+        kwargs["stdin"] = subprocess.PIPE
+    if capture_output:
+        kwargs["stdout"] = subprocess.PIPE
+        kwargs["stderr"] = subprocess.PIPE
+    started = time.time()
+    rusage = None
+    timed_out = False
+    with subprocess.Popen(command, **kwargs) as process:
+        try:
+            if hasattr(os, "wait4"):
+                stdout, stderr, rusage, timed_out = _wait4(process, input, timeout)
+            else:
+                # the resource usage is not available on Windows
+                try:
+                    stdout, stderr = process.communicate(input, timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    stdout, stderr = process.communicate()
+                    timed_out = True
+        except:
+            process.kill()
+            raise
+    usage = ResourceUsage.from_rusage(time.time() - started, rusage)
+    Tracer.default().add_usage(usage)
+    ResourceAccounting.default().record(command, usage)
+    if timed_out:
+        raise subprocess.TimeoutExpired(process.args, timeout, output=stdout, stderr=stderr)
+    if check and process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, process.args, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+
+
+def _wait4(process: subprocess.Popen, input: Any = None, timeout: float = None) -> Tuple[Any, Any, Any, bool]:
+    """
+    Reap the process with wait4, which returns the resource usage of the process along with its exit status, while writing its input
+    and reading its output. The process is killed, and reaped, when it has not exited after timeout seconds.
+    :returns the output and errors of the process, its resource usage, and whether it timed out.
+    """
+    outputs: Dict[str, Any] = {}
+
+    def read(name: str, stream: IO) -> None:
+        with stream:
+            outputs[name] = stream.read()
+
+    def write(stream: IO) -> None:
+        try:
+            with stream:
+                stream.write(input)
+        except BrokenPipeError:
+            # the command exited without reading all of its input
+            pass
+
+    threads = [threading.Thread(target=read, args=(name, stream), daemon=True) for name, stream in [("stdout", process.stdout), ("stderr", process.stderr)] if stream]
+    if process.stdin and input is not None:
+        threads.append(threading.Thread(target=write, args=(process.stdin,), daemon=True))
+    elif process.stdin:
+        # no input is sent to the command
+        process.stdin.close()
+    for thread in threads:
+        thread.start()
+    timed_out = False
+    try:
+        if timeout is None:
+            _, status, rusage = os.wait4(process.pid, 0)
+        else:
+            status, rusage, timed_out = _wait4_timeout(process, timeout)
+        process.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+    except ChildProcessError:
+        # the process was reaped elsewhere, e.g. by a SIGCHLD handler
+        rusage = None
+        process.wait()
+    for thread in threads:
+        thread.join()
+    return outputs.get("stdout"), outputs.get("stderr"), rusage, timed_out
+
+
+def _wait4_timeout(process: subprocess.Popen, timeout: float) -> Tuple[int, Any, bool]:
+    """
+    Poll the process with wait4 until it exits, like subprocess.Popen.wait with a timeout, and kill it after timeout seconds.
+    The process is only reaped here, so that it is never killed after its pid could have been reused.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.0005
+    while True:
+        pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            return status, rusage, False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            process.kill()
+            _, status, rusage = os.wait4(process.pid, 0)
+            return status, rusage, True
+        delay = min(delay * 2, remaining, 0.05)
+        time.sleep(delay)
+
+
+def check_call(command: Any, **kwargs: Any) -> int:
+    return run(command, check=True, **kwargs).returncode
+
+
+def check_output(command: Any, **kwargs: Any) -> bytes:
+    output: bytes = run(command, stdout=subprocess.PIPE, check=True, **kwargs).stdout
+    return output
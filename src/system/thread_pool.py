@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import contextvars
+from typing import Any, Callable, Iterable, List, Tuple
+
+"""
+These functions run calls concurrently on a bounded pool of threads, and fail fast when one of them raises.
+Each call runs in a copy of the context of the caller, e.g. so that what it logs goes to the log of the component being built.
+"""
+
+# default number of threads for I/O bound work, e.g. downloading, checking or exporting artifacts
+WORKERS = 8
+
+
+def run(function: Callable[..., Any], calls: Iterable[Tuple], workers: int = WORKERS) -> List[Any]:
+    """
+    Call function with each tuple of arguments in calls, on up to `workers` threads, or on this thread with a single worker.
+    Raises the error of the first call that fails, once the calls already running have finished. Calls not started yet are cancelled.
+    :returns the results in the order of calls.
+    """
+    arguments = list(calls)
+    if workers <= 1 or len(arguments) <= 1:
+        return [function(*args) for args in arguments]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, function, *args) for args in arguments]
+        for future in concurrent.futures.as_completed(futures):
+            if future.exception():
+                for pending in futures:
+                    pending.cancel()
+                raise future.exception()
+        return [future.result() for future in futures]
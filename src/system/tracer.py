@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import stat
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List
+
+from system.default_instance import DefaultInstance
+from system.resource_accounting import ResourceUsage
+
+"""
+This class records spans of work, e.g. a checkout or a build, with their wall time, the CPU time of the thread that ran them,
+the bytes they processed, and the resources used by the commands that they ran, i.e. those that system.subprocess_runner reaped on the same thread.
+Spans started while another span is running on the same thread are nested in it, and include the commands of the spans nested in them.
+Spans are written to a trace file in the Chrome trace event format, which can be opened with chrome://tracing or https://ui.perfetto.dev.
+"""
+
+
+class Tracer(DefaultInstance):
+    class Span:
+        def __init__(self, name: str, args: Dict[str, Any]) -> None:
+            self.name = name
+            self.args = args
+            self.bytes = 0
+            self.usage = ResourceUsage()
+
+        def add_bytes(self, count: int) -> None:
+            self.bytes += count
+
+        def add_usage(self, usage: ResourceUsage) -> None:
+            self.usage += usage
+
+        def add_file(self, path: str) -> None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                # missing files, e.g. when nothing was produced, do not count
+                return
+            if stat.S_ISREG(st.st_mode):
+                self.add_bytes(st.st_size)
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.pid = os.getpid()
+
+    @property
+    def spans(self) -> List['Tracer.Span']:
+        """
+        The spans running on this thread, outermost first.
+        """
+        if not hasattr(self.local, "spans"):
+            self.local.spans = []
+        spans: List[Tracer.Span] = self.local.spans
+        return spans
+
+    @property
+    def depth(self) -> int:
+        return len(self.spans)
+
+    def add_usage(self, usage: ResourceUsage) -> None:
+        """
+        Add the resources used by a command that this thread ran to the spans running on it.
+        """
+        for span in self.spans:
+            span.add_usage(usage)
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Generator['Tracer.Span', None, None]:
+        span = Tracer.Span(name, args)
+        depth = self.depth
+        self.spans.append(span)
+        cpu = time.thread_time()
+        start = time.time()
+        try:
+            yield span
+        finally:
+            end = time.time()
+            self.spans.pop()
+            event_args = {
+                **span.args,
+                "depth": depth,
+                "cpu_ms": round((time.thread_time() - cpu) * 1000, 3),
+            }
+            if span.bytes:
+                event_args["bytes"] = span.bytes
+            if span.usage.commands:
+                event_args["commands"] = span.usage.commands
+                event_args["children_user_ms"] = round(span.usage.user_time * 1000, 3)
+                event_args["children_system_ms"] = round(span.usage.system_time * 1000, 3)
+                event_args["children_max_rss_kb"] = span.usage.max_rss_kb
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": int(start * 1000000),
+                "dur": int((end - start) * 1000000),
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": event_args,
+            }
+            with self.lock:
+                self.events.append(event)
+
+    def write(self, path: str) -> None:
+        with self.lock:
+            events = sorted(self.events, key=lambda event: (event["ts"], event["args"]["depth"]))
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        logging.info(f"Wrote trace of {len(events)} span(s) to {path}")
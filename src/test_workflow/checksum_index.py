@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from system.file_digest import file_digest
+
+"""
+This class keeps the SHA-512 checksums of files in a directory, e.g. a local maven repository, so that files that have not changed
+since they were last checked are not read again. Entries are keyed by path relative to the directory, and are only used while the
+size, modification time and inode of the file match, i.e. while the file has not been modified or replaced.
+The index is saved as a JSON file in the directory.
+"""
+
+
+class ChecksumIndex:
+    FILENAME = ".opensearch-build-checksums.json"
+
+    def __init__(self, dir: str) -> None:
+        self.dir = dir
+        self.path = os.path.join(dir, self.FILENAME)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.changed = False
+        self.lock = threading.Lock()
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self.entries = json.load(f)
+            except ValueError:
+                logging.warning(f"Ignoring invalid checksum index {self.path}")
+
+    def __entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        The entry of path, while the file has not been modified or replaced since it was recorded.
+        """
+        stat = os.stat(path)
+        with self.lock:
+            entry = self.entries.get(os.path.relpath(path, self.dir))
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns and entry.get("inode") == stat.st_ino:
+            return entry
+        return None
+
+    def sha512(self, path: str) -> str:
+        entry = self.__entry(path)
+        if entry:
+            return str(entry["sha512"])
+        stat = os.stat(path)
+        sha512 = file_digest(path, "sha512")
+        with self.lock:
+            self.entries[os.path.relpath(path, self.dir)] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "inode": stat.st_ino, "sha512": sha512}
+            self.changed = True
+        return sha512
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.changed:
+                return
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.entries, f, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.changed = False
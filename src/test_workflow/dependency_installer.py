@@ -5,17 +5,18 @@
 # compatible open source license.
 
 import abc
-import concurrent.futures
 import logging
 import os
-import shutil
-import urllib
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import validators  # type:ignore
 
 from manifests.build_manifest import BuildManifest
 from manifests.bundle_manifest import BundleManifest
+from system import thread_pool
+from system.downloader import Downloader
+from system.file_materializer import FileMaterializer
+from test_workflow.checksum_index import ChecksumIndex
 
 
 class DependencyInstaller(abc.ABC):
@@ -27,10 +28,15 @@ class DependencyInstaller(abc.ABC):
     Provides a dependency installer for the test suites.
     """
 
-    def __init__(self, root_url: str, build_manifest: BuildManifest, bundle_manifest: BundleManifest) -> None:
+    def __init__(self, root_url: str, build_manifest: BuildManifest, bundle_manifest: BundleManifest, jobs: int = thread_pool.WORKERS) -> None:
         self.root_url = root_url
         self.build_manifest = build_manifest
         self.bundle_manifest = bundle_manifest
+        self.jobs = jobs
+        # downloads share keep-alive connections, and the cache in DOWNLOAD_CACHE_DIR when set
+        self.downloader = Downloader(jobs)
+        # installed files may be modified, never share them with their source
+        self.materializer = FileMaterializer(link=False)
 
     def download_dist(self, dest: str) -> str:
         local_path = os.path.realpath(os.path.join(dest, os.path.basename(self.bundle_manifest.build.location)))
@@ -41,23 +47,76 @@ class DependencyInstaller(abc.ABC):
         dest = os.path.realpath(os.path.join(dest, "/".join(path.split("/")[1:])))
         return (source, dest)
 
-    def download(self, paths: List[str], category: str, dest: str) -> None:
+    def download(self, paths: List[str], category: str, dest: str, checksums: List[str] = None) -> None:
+        """
+        Download or copy paths into dest. The .sha512 files among paths are downloaded first, and like those in checksums,
+        that have been downloaded into dest before, verify the files they are the checksums of without being fetched again.
+        """
         logging.info(f"Downloading to {dest} ...")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            for result in executor.map(
-                lambda args: self.download_or_copy(*args),
-                    map(lambda path: self.__source_dest(path, category, dest),
-                        paths)
-            ):
-                logging.debug(f"Written {result}")
-
-    def download_or_copy(self, source: str, dest: str) -> str:
+        downloaded = [path for path in paths if path.endswith(".sha512")]
+        checksum_paths = set(downloaded + (checksums or []))
+        files = [path for path in paths if path not in downloaded]
+        for result in thread_pool.run(self.download_or_copy, [self.__source_dest(path, category, dest) for path in downloaded], self.jobs):
+            logging.debug(f"Written {result}")
+        calls = [
+            self.__source_dest(path, category, dest) + (self.__checksum(f"{path}.sha512", category, dest) if f"{path}.sha512" in checksum_paths else None,)
+            for path in files
+        ]
+        for result in thread_pool.run(self.download_or_copy, calls, self.jobs):
+            logging.debug(f"Written {result}")
+        self.downloader.log_summary()
+        self.materializer.log_summary()
+
+    def sync(self, paths: List[str], category: str, dest: str, index: ChecksumIndex = None) -> None:
+        """
+        Download paths like `download`, skipping files that are already in dest with the checksum published in the .sha512 file next to them.
+        The checksums of local files are kept in a ChecksumIndex in dest, pass one index to sync several sets of paths into dest and save it once.
+        Published checksums are always downloaded, since files may be republished under the same URL, e.g. that of the latest build.
+        """
+        own_index = index is None
+        index = index or ChecksumIndex(dest)
+        all_paths = set(paths)
+        checksums = [path for path in paths if path.endswith(".sha512")]
+        self.download(checksums, category, dest)
+
+        def unchanged(path: str) -> bool:
+            local_path = self.__source_dest(path, category, dest)[1]
+            checksum_path = f"{local_path}.sha512"
+            if f"{path}.sha512" not in all_paths or not os.path.isfile(local_path) or not os.path.isfile(checksum_path):
+                return False
+            published = Downloader.read_checksum(checksum_path)
+            return published is not None and published == index.sha512(local_path)
+
+        candidates = [path for path in paths if path not in checksums]
+        skipped = set(path for path, skip in zip(candidates, thread_pool.run(unchanged, [(path,) for path in candidates], self.jobs)) if skip)
+        if own_index:
+            index.save()
+        # other checksums and signatures of an unchanged file are unchanged too
+        for path in list(skipped):
+            for ext in [".asc", ".md5", ".sha1", ".sha256"]:
+                if f"{path}{ext}" in all_paths and os.path.isfile(self.__source_dest(f"{path}{ext}", category, dest)[1]):
+                    skipped.add(f"{path}{ext}")
+        fetched = [path for path in candidates if path not in skipped]
+        self.download(fetched, category, dest, checksums)
+
+        bytes_skipped = sum(self.__size(self.__source_dest(path, category, dest)[1]) for path in skipped)
+        bytes_fetched = sum(self.__size(self.__source_dest(path, category, dest)[1]) for path in checksums + fetched)
+        logging.info(
+            f"Skipped {len(skipped)} unchanged file(s) ({bytes_skipped} byte(s)), fetched {len(checksums) + len(fetched)} file(s) ({bytes_fetched} byte(s)) into {dest}"
+        )
+
+    def __checksum(self, path: str, category: str, dest: str) -> Optional[str]:
+        return Downloader.read_checksum(self.__source_dest(path, category, dest)[1])
+
+    def __size(self, path: str) -> int:
+        return os.path.getsize(path) if os.path.isfile(path) else 0
+
+    def download_or_copy(self, source: str, dest: str, checksum: str = None) -> str:
         os.makedirs(os.path.dirname(dest), exist_ok=True)
         if validators.url(source):
             logging.info(f"Downloading {source} into {dest} ...")
-            urllib.request.urlretrieve(source, dest)
+            self.downloader.download(source, dest, checksum)
         else:
             logging.info(f"Copying {source} into {dest} ...")
-            source = os.path.realpath(source)
-            shutil.copyfile(os.path.realpath(source), dest)
+            self.materializer.materialize(os.path.realpath(source), dest)
         return dest
@@ -8,23 +8,38 @@ import os
 
 from manifests.build_manifest import BuildManifest
 from manifests.bundle_manifest import BundleManifest
+from system import thread_pool
+from test_workflow.checksum_index import ChecksumIndex
 from test_workflow.dependency_installer import DependencyInstaller
 
 
 class DependencyInstallerOpenSearch(DependencyInstaller):
 
-    def __init__(self, root_url: str, build_manifest: BuildManifest, bundle_manifest: BundleManifest) -> None:
-        super().__init__(root_url, build_manifest, bundle_manifest)
+    def __init__(self, root_url: str, build_manifest: BuildManifest, bundle_manifest: BundleManifest, jobs: int = thread_pool.WORKERS) -> None:
+        super().__init__(root_url, build_manifest, bundle_manifest, jobs)
 
     @property
     def maven_local_path(self) -> str:
         return os.path.join(os.path.expanduser("~"), ".m2", "repository")
 
-    def install_maven_dependencies(self) -> None:
-        for component in self.build_manifest.components.values():
-            maven_artifacts = component.artifacts.get("maven", None)
-            if maven_artifacts:
-                self.download(maven_artifacts, "builds", self.maven_local_path)
+    def install_maven_dependencies(self, incremental: bool = True) -> None:
+        """
+        Installs the maven artifacts of all components into the maven local repository.
+        When incremental, artifacts already in the repository with their published checksum are not downloaded again.
+        """
+        # the index of the maven local repository is loaded once, shared by all components, and saved once
+        index = ChecksumIndex(self.maven_local_path) if incremental else None
+        try:
+            for component in self.build_manifest.components.values():
+                maven_artifacts = component.artifacts.get("maven", None)
+                if maven_artifacts:
+                    if index:
+                        self.sync(maven_artifacts, "builds", self.maven_local_path, index)
+                    else:
+                        self.download(maven_artifacts, "builds", self.maven_local_path)
+        finally:
+            if index:
+                index.save()
 
     def install_build_dependencies(self, dependency_dict: dict, dest: str) -> None:
         """
@@ -6,10 +6,11 @@
 
 from manifests.build_manifest import BuildManifest
 from manifests.bundle_manifest import BundleManifest
+from system import thread_pool
 from test_workflow.dependency_installer import DependencyInstaller
 
 
 class DependencyInstallerOpenSearchDashboards(DependencyInstaller):
 
-    def __init__(self, root_url: str, build_manifest: BuildManifest, bundle_manifest: BundleManifest) -> None:
-        super().__init__(root_url, build_manifest, bundle_manifest)
+    def __init__(self, root_url: str, build_manifest: BuildManifest, bundle_manifest: BundleManifest, jobs: int = thread_pool.WORKERS) -> None:
+        super().__init__(root_url, build_manifest, bundle_manifest, jobs)
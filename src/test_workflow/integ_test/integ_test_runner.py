@@ -11,10 +11,13 @@ from pathlib import Path
 
 from manifests.component_manifest import Components
 from manifests.test_manifest import TestComponent, TestManifest
+from system import thread_pool
+from system.resource_accounting import ResourceAccounting
 from system.temporary_directory import TemporaryDirectory
 from test_workflow.integ_test.integ_test_suite import IntegTestSuite
 from test_workflow.test_args import TestArgs
 from test_workflow.test_recorder.test_recorder import TestRecorder
+from test_workflow.test_result.test_component_results import TestComponentResults
 from test_workflow.test_result.test_suite_results import TestSuiteResults
 
 
@@ -34,24 +37,49 @@ class IntegTestRunner(abc.ABC):
         os.makedirs(self.tests_dir, exist_ok=True)
         self.test_recorder = TestRecorder(self.args.test_run_id, "integ-test", self.tests_dir)
 
+    @property
+    def parallel(self) -> int:
+        """
+        The number of components to test at the same time.
+        """
+        return self.args.parallel
+
     def run(self) -> TestSuiteResults:
         with TemporaryDirectory(keep=self.args.keep, chdir=True) as work_dir:
 
-            all_results = TestSuiteResults()
+            test_components = []
             for component in self.components.select(focus=self.args.components):
                 if component.name in self.test_manifest.components:
                     test_config = self.test_manifest.components[component.name]
                     if test_config.integ_test:
-                        test_suite = self.__create_test_suite__(component, test_config, work_dir.path)
-                        test_results = test_suite.execute_tests()
-                        all_results.append(component.name, test_results)
+                        test_components.append((component, test_config))
                     else:
                         logging.info(f"Skipping integ-tests for {component.name}, as it is currently not supported")
                 else:
                     logging.info(f"Skipping integ-tests for {component.name}, as it is currently not declared in the test manifest")
 
+            all_results = TestSuiteResults()
+            if self.parallel > 1:
+                logging.info(f"Testing up to {self.parallel} components at the same time")
+                calls = []
+                for component, test_config in test_components:
+                    # each component gets its own work directory, with its own checkout and cluster
+                    component_work_dir = Path(os.path.join(work_dir.path, component.name))
+                    os.makedirs(component_work_dir, exist_ok=True)
+                    calls.append((component, test_config, component_work_dir))
+                for (component, _, _), results in zip(calls, thread_pool.run(self.__test_component, calls, self.parallel)):
+                    all_results.append(component.name, results)
+            else:
+                for component, test_config in test_components:
+                    all_results.append(component.name, self.__test_component(component, test_config, work_dir.path))
+
         return all_results
 
+    def __test_component(self, component: TestComponent, test_config: TestComponent, work_dir: Path) -> TestComponentResults:
+        with ResourceAccounting.default().component(component.name):
+            test_suite = self.__create_test_suite__(component, test_config, work_dir)
+            return test_suite.execute_tests()
+
     @abc.abstractmethod
     def __create_test_suite__(self, component: TestComponent, test_config: TestComponent, work_dir: Path) -> IntegTestSuite:
         pass
@@ -9,21 +9,42 @@ import os
 from pathlib import Path
 
 from manifests.test_manifest import TestComponent, TestManifest
+from system.port_allocator import PortAllocator
 from test_workflow.integ_test.integ_test_runner import IntegTestRunner
 from test_workflow.integ_test.integ_test_start_properties_opensearch import IntegTestStartPropertiesOpenSearch
 from test_workflow.integ_test.integ_test_suite_opensearch import IntegTestSuiteOpenSearch
+from test_workflow.integ_test.local_test_cluster_pool import LocalTestClusterPool
 from test_workflow.test_args import TestArgs
+from test_workflow.test_result.test_suite_results import TestSuiteResults
 
 
 class IntegTestRunnerOpenSearch(IntegTestRunner):
     properties: IntegTestStartPropertiesOpenSearch
+    cluster_pool: LocalTestClusterPool
 
     def __init__(self, args: TestArgs, test_manifest: TestManifest) -> None:
         self.properties = IntegTestStartPropertiesOpenSearch(args.paths.get("opensearch", os.getcwd()))
         self.properties.dependency_installer.install_maven_dependencies()
         super().__init__(args, test_manifest, self.properties.bundle_manifest.components)
+        # clusters of components tested at the same time listen on allocated ports
+        self.port_allocator = PortAllocator() if self.parallel > 1 else None
+        self.cluster_pool = None
         logging.info("Entering integ test for OpenSearch")
 
+    def run(self) -> TestSuiteResults:
+        if not self.args.reuse_cluster:
+            return super().run()
+        # keep up to a cluster with and a cluster without security warm for each component tested at the same time
+        with LocalTestClusterPool(
+            self.properties.dependency_installer,
+            self.properties.bundle_manifest,
+            self.test_recorder,
+            self.port_allocator,
+            2 * self.parallel,
+            self.args.keep
+        ) as self.cluster_pool:
+            return super().run()
+
     def __create_test_suite__(
         self,
         component: TestComponent,
@@ -37,5 +58,7 @@ class IntegTestRunnerOpenSearch(IntegTestRunner):
             self.properties.bundle_manifest,
             self.properties.build_manifest,
             work_dir,
-            self.test_recorder
+            self.test_recorder,
+            self.port_allocator,
+            self.cluster_pool
         )
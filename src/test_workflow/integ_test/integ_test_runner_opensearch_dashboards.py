@@ -26,6 +26,13 @@ class IntegTestRunnerOpenSearchDashboards(IntegTestRunner):
         super().__init__(args, test_manifest, self.properties.build_manifest.components)
         logging.info("Entering integ test for OpenSearch Dashboards")
 
+    @property
+    def parallel(self) -> int:
+        # all plugins are tested against the same OpenSearch and OpenSearch Dashboards ports
+        if self.args.parallel > 1:
+            logging.info("Testing OpenSearch Dashboards components one at a time")
+        return 1
+
     def __create_test_suite__(self, component: TestComponent, test_config: TestComponent, work_dir: Path) -> IntegTestSuiteOpenSearchDashboards:
         return IntegTestSuiteOpenSearchDashboards(
             self.properties_dependency.dependency_installer,
@@ -15,6 +15,7 @@ from manifests.build_manifest import BuildManifest
 from manifests.bundle_manifest import BundleManifest
 from paths.script_finder import ScriptFinder
 from system.execute import execute
+from system.tracer import Tracer
 from test_workflow.dependency_installer import DependencyInstaller
 from test_workflow.test_recorder.log_recorder import LogRecorder
 from test_workflow.test_recorder.test_recorder import TestRecorder
@@ -78,7 +79,8 @@ class IntegTestSuite(abc.ABC):
             cmd = f"{script} -b {endpoint} -p {port} -s {str(security).lower()} -v {self.bundle_manifest.build.version}"
             self.repo_work_dir = os.path.join(
                 self.repo.dir, self.test_config.working_directory) if self.test_config.working_directory is not None else self.repo.dir
-            (status, stdout, stderr) = execute(cmd, self.repo_work_dir, True, False)
+            with Tracer.default().span("integ test", component=self.component.name, test_config=test_config):
+                (status, stdout, stderr) = execute(cmd, self.repo_work_dir, True, False)
 
             test_result_data = TestResultData(
                 self.component.name,
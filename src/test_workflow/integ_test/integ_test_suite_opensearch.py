@@ -12,9 +12,11 @@ from typing import Any
 
 from manifests.build_manifest import BuildManifest
 from manifests.bundle_manifest import BundleManifest
+from system.port_allocator import PortAllocator
 from test_workflow.dependency_installer_opensearch import DependencyInstallerOpenSearch
 from test_workflow.integ_test.integ_test_suite import IntegTestSuite, InvalidTestConfigError
 from test_workflow.integ_test.local_test_cluster import LocalTestCluster
+from test_workflow.integ_test.local_test_cluster_pool import LocalTestClusterPool
 from test_workflow.test_recorder.test_recorder import TestRecorder
 from test_workflow.test_result.test_component_results import TestComponentResults
 from test_workflow.test_result.test_result import TestResult
@@ -31,7 +33,9 @@ class IntegTestSuiteOpenSearch(IntegTestSuite):
         bundle_manifest_opensearch: BundleManifest,
         build_manifest_opensearch: BuildManifest,
         work_dir: Path,
-        test_recorder: TestRecorder
+        test_recorder: TestRecorder,
+        port_allocator: PortAllocator = None,
+        cluster_pool: LocalTestClusterPool = None
     ) -> None:
         super().__init__(
             work_dir,
@@ -42,6 +46,8 @@ class IntegTestSuiteOpenSearch(IntegTestSuite):
             bundle_manifest_opensearch,
             build_manifest_opensearch
         )
+        self.port_allocator = port_allocator
+        self.cluster_pool = cluster_pool
 
     def execute_tests(self) -> TestComponentResults:
         test_results = TestComponentResults()
@@ -71,19 +77,39 @@ class IntegTestSuiteOpenSearch(IntegTestSuite):
         if "additional-cluster-configs" in self.test_config.integ_test.keys():
             self.additional_cluster_config = self.test_config.integ_test.get("additional-cluster-configs")
             logging.info(f"Additional config found: {self.additional_cluster_config}")
-        with LocalTestCluster.create(
-            self.dependency_installer,
-            self.work_dir,
-            self.component.name,
-            self.additional_cluster_config,
-            self.bundle_manifest,
-            security,
-            config,
-            self.test_recorder,
-        ) as (endpoint, port):
-            self.pretty_print_message("Running integration tests for " + self.component.name)
-            os.chdir(self.work_dir)
-            return self.execute_integtest_sh(endpoint, port, security, config)
+        if self.cluster_pool:
+            with self.cluster_pool.cluster(self.component.name, config, security, self.additional_cluster_config) as (endpoint, port):
+                self.pretty_print_message("Running integration tests for " + self.component.name)
+                return self.execute_integtest_sh(endpoint, port, security, config)
+        # clusters of suites that run side by side need their own ports
+        attempt = 0
+        while True:
+            attempt += 1
+            ports = self.port_allocator.allocate(2) if self.port_allocator else []
+            started = False
+            try:
+                with LocalTestCluster.create(
+                    self.dependency_installer,
+                    self.work_dir,
+                    self.component.name,
+                    self.additional_cluster_config,
+                    self.bundle_manifest,
+                    security,
+                    config,
+                    self.test_recorder,
+                    http_port=ports[0] if ports else LocalTestCluster.DEFAULT_HTTP_PORT,
+                    transport_port=ports[1] if ports else None,
+                ) as (endpoint, port):
+                    started = True
+                    self.pretty_print_message("Running integration tests for " + self.component.name)
+                    return self.execute_integtest_sh(endpoint, port, security, config)
+            except Exception:
+                # only a cluster that failed to start is started again, and only on allocated ports
+                if started or not ports or not PortAllocator.retry(ports, attempt):
+                    raise
+            finally:
+                if self.port_allocator:
+                    self.port_allocator.release(ports)
 
     @property
     def test_artifact_files(self) -> dict:
@@ -24,6 +24,8 @@ class LocalTestCluster(TestCluster):
     Represents an on-box test cluster. This class downloads a bundle (from a BundleManifest) and runs it as a background process.
     """
 
+    DEFAULT_HTTP_PORT = 9200
+
     def __init__(
         self,
         dependency_installer: DependencyInstaller,
@@ -34,6 +36,8 @@ class LocalTestCluster(TestCluster):
         security_enabled: bool,
         component_test_config: str,
         test_recorder: TestRecorder,
+        http_port: int = DEFAULT_HTTP_PORT,
+        transport_port: int = None,
     ) -> None:
         super().__init__(
             work_dir,
@@ -47,15 +51,24 @@ class LocalTestCluster(TestCluster):
         self.manifest = bundle_manifest
         self.dependency_installer = dependency_installer
 
+        self.http_port = http_port
         self.service_opensearch = ServiceOpenSearch(
             self.manifest.build.version,
             self.manifest.build.distribution,
             self.additional_cluster_config,
             self.security_enabled,
             self.dependency_installer,
-            self.work_dir
+            self.work_dir,
+            self.http_port,
+            transport_port
         )
 
+    def snapshot(self) -> None:
+        self.service_opensearch.snapshot_templates()
+
+    def reset(self) -> None:
+        self.service_opensearch.reset()
+
     @property
     def service(self) -> Service:
         return self.service_opensearch
@@ -66,4 +79,4 @@ class LocalTestCluster(TestCluster):
 
     @property
     def port(self) -> int:
-        return 9200
+        return self.http_port
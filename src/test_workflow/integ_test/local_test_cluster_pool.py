@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List, Tuple
+
+from manifests.bundle_manifest import BundleManifest
+from system.port_allocator import PortAllocator
+from system.temporary_directory import TemporaryDirectory
+from test_workflow.dependency_installer import DependencyInstaller
+from test_workflow.integ_test.local_test_cluster import LocalTestCluster
+from test_workflow.test_recorder.test_recorder import TestRecorder
+
+"""
+This class keeps warm local test clusters, so that test suites that need a cluster with the same effective configuration,
+i.e. the same security setting and additional cluster configs, reuse a running cluster instead of installing and starting a new one.
+A cluster is used by one test suite at a time, and its indices and templates are deleted before it is handed to the next one.
+Idle clusters listen on allocated ports, and at most `max_idle` of them are kept running, the least recently used are terminated first.
+Without a port allocator, e.g. when one suite runs at a time, clusters listen on the default ports, and idle clusters are terminated
+before another one is started.
+The logs of a cluster are saved for each test suite that used it, when the suite is done with it.
+"""
+
+
+class LocalTestClusterPool:
+    def __init__(
+        self,
+        dependency_installer: DependencyInstaller,
+        bundle_manifest: BundleManifest,
+        test_recorder: TestRecorder,
+        port_allocator: PortAllocator = None,
+        max_idle: int = 2,
+        keep: bool = False
+    ) -> None:
+        self.dependency_installer = dependency_installer
+        self.bundle_manifest = bundle_manifest
+        self.test_recorder = test_recorder
+        self.port_allocator = port_allocator
+        self.max_idle = max_idle
+        self.work_dir = TemporaryDirectory(keep=keep)
+        self.idle: List[Tuple[str, LocalTestCluster]] = []
+        self.ports: Dict[LocalTestCluster, List[int]] = {}
+        self.clusters_started = 0
+        self.clusters_reused = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> 'LocalTestClusterPool':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.terminate()
+
+    @classmethod
+    def key(cls, security_enabled: bool, additional_cluster_config: dict) -> str:
+        return json.dumps([security_enabled, additional_cluster_config or {}], sort_keys=True)
+
+    @contextmanager
+    def cluster(
+        self,
+        component_name: str,
+        component_test_config: str,
+        security_enabled: bool,
+        additional_cluster_config: dict
+    ) -> Generator[Tuple[str, int], None, None]:
+        """
+        Check out a running cluster with the given configuration, starting one when there is no idle cluster to reuse.
+        """
+        key = self.key(security_enabled, additional_cluster_config)
+        cluster = self.__reuse(key)
+        if cluster is None:
+            cluster = self.__start(component_name, component_test_config, security_enabled, additional_cluster_config)
+        try:
+            yield cluster.endpoint, cluster.port
+        finally:
+            try:
+                cluster.save_logs_for(component_name, component_test_config)
+            except Exception as e:
+                logging.warning(f"Unable to save the logs of the cluster in {cluster.work_dir} for {component_name} {component_test_config}: {e}")
+            self.__release(key, cluster)
+
+    def __reuse(self, key: str) -> LocalTestCluster:
+        while True:
+            with self.lock:
+                cluster = next((cluster for idle_key, cluster in self.idle if idle_key == key), None)
+                if cluster is None:
+                    return None
+                self.idle = [(idle_key, idle) for idle_key, idle in self.idle if idle is not cluster]
+            try:
+                cluster.reset()
+            except Exception as e:
+                logging.warning(f"Unable to reset the cluster in {cluster.work_dir}, terminating it: {e}")
+                self.__terminate(cluster)
+                continue
+            logging.info(f"Reusing the cluster in {cluster.work_dir} on port {cluster.port}")
+            with self.lock:
+                self.clusters_reused += 1
+            return cluster
+
+    def __start(self, component_name: str, component_test_config: str, security_enabled: bool, additional_cluster_config: dict) -> LocalTestCluster:
+        if not self.port_allocator:
+            # idle clusters listen on the default ports too
+            with self.lock:
+                idle = [cluster for _, cluster in self.idle]
+                self.idle = []
+            for cluster in idle:
+                self.__terminate(cluster)
+        attempt = 0
+        while True:
+            attempt += 1
+            ports = self.port_allocator.allocate(2) if self.port_allocator else []
+            with self.lock:
+                self.clusters_started += 1
+                work_dir = os.path.join(self.work_dir.name, str(self.clusters_started))
+            cluster = LocalTestCluster(
+                self.dependency_installer,
+                work_dir,
+                component_name,
+                additional_cluster_config,
+                self.bundle_manifest,
+                security_enabled,
+                component_test_config,
+                self.test_recorder,
+                http_port=ports[0] if ports else LocalTestCluster.DEFAULT_HTTP_PORT,
+                transport_port=ports[1] if ports else None,
+            )
+            with self.lock:
+                self.ports[cluster] = ports
+            try:
+                cluster.start()
+                # templates that exist once the cluster is available, e.g. those of plugins, are kept when it is reset
+                cluster.snapshot()
+                return cluster
+            except Exception:
+                self.__terminate(cluster, save_logs=True)
+                if not PortAllocator.retry(ports, attempt):
+                    raise
+
+    def __release(self, key: str, cluster: LocalTestCluster) -> None:
+        with self.lock:
+            self.idle.append((key, cluster))
+            evicted = [idle for _, idle in self.idle[:max(len(self.idle) - self.max_idle, 0)]]
+            self.idle = self.idle[len(evicted):]
+        for idle in evicted:
+            self.__terminate(idle)
+
+    def __terminate(self, cluster: LocalTestCluster, save_logs: bool = False) -> None:
+        # the logs of a cluster that started are saved for each suite that used it
+        try:
+            cluster.terminate(save_logs)
+        finally:
+            with self.lock:
+                ports = self.ports.pop(cluster, [])
+            if self.port_allocator:
+                self.port_allocator.release(ports)
+
+    def terminate(self) -> None:
+        with self.lock:
+            idle = [cluster for _, cluster in self.idle]
+            self.idle = []
+        try:
+            for cluster in idle:
+                self.__terminate(cluster)
+        finally:
+            logging.info(f"Started {self.clusters_started} cluster(s) and reused them {self.clusters_reused} time(s)")
+            self.work_dir.__exit__(None, None, None)
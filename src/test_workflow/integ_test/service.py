@@ -7,6 +7,7 @@
 import abc
 import logging
 import os
+import threading
 import time
 from typing import Dict
 
@@ -14,11 +15,17 @@ import requests
 from requests.models import Response
 
 from system.process import Process
+from system.tracer import Tracer
 from test_workflow.dependency_installer import DependencyInstaller
 from test_workflow.integ_test.service_termination_result import ServiceTerminationResult
 
 
 class Service(abc.ABC):
+    # seconds to wait for a service to become available, can be overridden with SERVICE_READY_TIMEOUT
+    READY_TIMEOUT = 120
+    PROBE_DELAY = 0.1
+    PROBE_MAX_DELAY = 5
+
     work_dir: str
     version: str
     distribution: str
@@ -48,6 +55,10 @@ class Service(abc.ABC):
 
         self.process_handler = Process()
         self.install_dir = ""
+        self.ready_timeout = float(os.getenv("SERVICE_READY_TIMEOUT", self.READY_TIMEOUT))
+        self.time_to_ready: float = None
+        self.ready = threading.Event()
+        self.process_handler.on_stdout(self.__on_stdout)
 
     @abc.abstractmethod
     def start(self) -> None:
@@ -61,17 +72,30 @@ class Service(abc.ABC):
             logging.info("Process is not started")
             return None
 
-        self.return_code = self.process_handler.terminate()
+        with Tracer.default().span("terminate service", service=type(self).__name__):
+            self.return_code = self.process_handler.terminate()
 
-        self.uninstall()
+            self.uninstall()
 
         return ServiceTerminationResult(
             self.return_code,
             self.process_handler.stdout_data,
             self.process_handler.stderr_data,
-            self.log_files
+            {**self.log_files, **self.output_files},
+            self.time_to_ready
         )
 
+    @property
+    def output_files(self) -> Dict[str, str]:
+        """
+        The full stdout and stderr of the service, of which stdout_data and stderr_data of the termination result only hold the most recent lines.
+        """
+        files = {
+            "stdout.log": self.process_handler.stdout_path,
+            "stderr.log": self.process_handler.stderr_path
+        }
+        return {name: path for name, path in files.items() if path}
+
     def endpoint(self) -> str:
         return "localhost"
 
@@ -113,24 +137,51 @@ class Service(abc.ABC):
         logging.info(f"Downloaded bundle to {os.path.realpath(bundle_name)}")
         return bundle_name
 
-    def wait_for_service(self) -> None:
-        logging.info("Waiting for service to become available")
+    @property
+    def ready_marker(self) -> str:
+        """
+        Text logged to stdout when the service is about to become available, if any. The service is probed as soon as it is logged.
+        """
+        return None
 
-        for attempt in range(10):
+    def wait_for_service(self) -> None:
+        """
+        Probe the service until it is available, with an exponential backoff from PROBE_DELAY to PROBE_MAX_DELAY, that starts over when
+        the ready marker is logged. Raises ClusterCreationException when the service is not available within ready_timeout seconds.
+        """
+        logging.info(f"Waiting up to {self.ready_timeout}s for service to become available")
+        started = self.process_handler.start_time or time.time()
+        deadline = time.time() + self.ready_timeout
+        delay = self.PROBE_DELAY
+        marker_seen = False
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 logging.info(f"Pinging service attempt {attempt}")
                 if self.service_alive():
+                    self.time_to_ready = time.time() - started
+                    logging.info(f"Service is ready after {self.time_to_ready:.1f}s")
                     return
             except requests.exceptions.ConnectionError:
                 logging.info("Service not available, yet")
-                stdout = self.process_handler.stdout_data
-                if stdout:
-                    logging.info("- stdout:\n{stdout}")
-                stderr = self.process_handler.stderr_data
-                if stderr:
-                    logging.info("- stderr:\n{stderr}")
-            time.sleep(10)
-        raise ClusterCreationException("Cluster is not available after 10 attempts")
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise ClusterCreationException(f"Cluster is not available after {self.ready_timeout}s and {attempt} attempts")
+            if marker_seen or not self.ready_marker:
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, self.PROBE_MAX_DELAY)
+            elif self.ready.wait(min(delay, remaining)):
+                # probe right away
+                logging.info(f"Service logged {self.ready_marker!r}")
+                marker_seen = True
+                delay = self.PROBE_DELAY
+            else:
+                delay = min(delay * 2, self.PROBE_MAX_DELAY)
+
+    def __on_stdout(self, line: str) -> None:
+        if self.ready_marker and self.ready_marker in line:
+            self.ready.set()
 
     @property
     @abc.abstractmethod
@@ -6,6 +6,7 @@
 
 import logging
 import os
+from typing import Dict, List
 
 import requests
 import yaml
@@ -18,6 +19,9 @@ from test_workflow.integ_test.service import Service
 
 
 class ServiceOpenSearch(Service):
+    # template APIs, with the key of the list of templates in their responses, legacy templates are keyed by name instead
+    TEMPLATES = {"/_index_template": "index_templates", "/_component_template": "component_templates", "/_template": None}
+
     dist: Distribution
     dependency_installer: DependencyInstaller
     install_dir: str
@@ -31,13 +35,19 @@ class ServiceOpenSearch(Service):
         additional_config: dict,
         security_enabled: bool,
         dependency_installer: DependencyInstaller,
-        work_dir: str
+        work_dir: str,
+        http_port: int = 9200,
+        transport_port: int = None
     ) -> None:
         super().__init__(work_dir, version, distribution, security_enabled, additional_config, dependency_installer)
 
+        self.http_port = http_port
+        self.transport_port = transport_port
+
         self.dist = Distributions.get_distribution("opensearch", distribution, version, work_dir)
         self.dependency_installer = dependency_installer
         self.install_dir = self.dist.install_dir
+        self.templates: Dict[str, List[str]] = None
 
     def start(self) -> None:
         self.dist.install(self.download())
@@ -51,9 +61,18 @@ class ServiceOpenSearch(Service):
         if self.additional_config:
             self.__add_plugin_specific_config(self.additional_config)
 
+        if self.transport_port:
+            # allocated ports, so that other clusters can run on the same host
+            self.__add_plugin_specific_config({"http.port": self.http_port, "transport.port": self.transport_port})
+
         self.process_handler.start(self.dist.start_cmd, self.install_dir)
         logging.info(f"Started OpenSearch with parent PID {self.process_handler.pid}")
 
+    @property
+    def ready_marker(self) -> str:
+        # logged by the node once it has joined the cluster and is listening for requests
+        return "] started"
+
     def uninstall(self) -> None:
         self.dist.uninstall()
 
@@ -65,12 +84,50 @@ class ServiceOpenSearch(Service):
         logging.info(f"Pinging {url}")
         return requests.get(url, verify=False, auth=("admin", "admin"))
 
+    def snapshot_templates(self) -> None:
+        """
+        Remember the templates of the running service, e.g. those that plugins create at startup, so that reset keeps them.
+        """
+        self.templates = {path: self.__template_names(path) for path in self.TEMPLATES}
+
+    def reset(self) -> None:
+        """
+        Delete all indices, except hidden and system ones, and the templates created since snapshot_templates, all of them without a snapshot,
+        so that the service can be reused by another test suite.
+        """
+        self.__delete("/*,-.*?expand_wildcards=open,closed")
+        for path in self.TEMPLATES:
+            if self.templates is None:
+                self.__delete(f"{path}/*")
+                continue
+            for name in self.__template_names(path):
+                if name not in self.templates[path]:
+                    self.__delete(f"{path}/{name}")
+
+    def __template_names(self, path: str) -> List[str]:
+        response = requests.get(self.url(path), verify=False, auth=("admin", "admin"))
+        # there are no templates
+        if response.status_code == 404:
+            return []
+        response.raise_for_status()
+        data = response.json()
+        key = self.TEMPLATES[path]
+        return sorted(template["name"] for template in data.get(key, [])) if key else sorted(data)
+
+    def __delete(self, path: str) -> None:
+        url = self.url(path)
+        logging.info(f"Deleting {url}")
+        response = requests.delete(url, verify=False, auth=("admin", "admin"))
+        # there are no templates to delete
+        if response.status_code != 404:
+            response.raise_for_status()
+
     def __add_plugin_specific_config(self, additional_config: dict) -> None:
         with open(self.opensearch_yml_dir, "a") as yamlfile:
             yamlfile.write(yaml.dump(additional_config))
 
     def port(self) -> int:
-        return 9200
+        return self.http_port
 
     def check_service_response_text(self, response_text: str) -> bool:
         return ('"status":"green"' in response_text) or ('"status":"yellow"' in response_text)
@@ -12,15 +12,18 @@ class ServiceTerminationResult:
     stdout_data: str
     stderr_data: str
     log_files: Dict[str, str]
+    time_to_ready: float
 
     def __init__(
         self,
         return_code: int,
         stdout_data: str,
         stderr_data: str,
-        log_files: Dict[str, str]
+        log_files: Dict[str, str],
+        time_to_ready: float = None
     ) -> None:
         self.return_code = return_code
         self.stdout_data = stdout_data
         self.stderr_data = stderr_data
         self.log_files = log_files
+        self.time_to_ready = time_to_ready
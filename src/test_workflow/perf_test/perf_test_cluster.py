@@ -87,7 +87,7 @@ class PerfTestCluster(TestCluster):
     def port(self) -> int:
         return 443 if self.cluster_config.security else 80
 
-    def terminate(self) -> None:
+    def terminate(self, save_logs: bool = True) -> None:
         os.chdir(self.work_dir)
         command = f"cdk destroy {self.params} --force"
         logging.info(f'Executing "{command}" in {os.getcwd()}')
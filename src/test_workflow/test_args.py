@@ -23,6 +23,8 @@ class TestArgs:
     logging_level: int
     test_manifest_path: str
     paths: dict
+    parallel: int
+    reuse_cluster: bool
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Test an OpenSearch Bundle")
@@ -31,6 +33,12 @@ class TestArgs:
         parser.add_argument("--test-run-id", type=int, help="The unique execution id for the test")
         parser.add_argument("--component", type=str, dest="components", nargs='*', help="Test a specific component or components instead of the entire distribution.")
         parser.add_argument("--keep", dest="keep", action="store_true", help="Do not delete the working temporary directory.")
+        parser.add_argument(
+            "--parallel", type=int, default=1, help="Test up to this many components at the same time, each against its own cluster. Defaults to 1."
+        )
+        parser.add_argument(
+            "--reuse-cluster", dest="reuse_cluster", action="store_true", help="Reuse running clusters across test-configs that need the same cluster configuration."
+        )
         parser.add_argument(
             "-v", "--verbose", help="Show more verbose output.", action="store_const", default=logging.INFO, const=logging.DEBUG, dest="logging_level"
         )
@@ -41,6 +49,8 @@ class TestArgs:
         self.logging_level = args.logging_level
         self.test_manifest_path = args.test_manifest_path
         self.paths = args.paths
+        self.parallel = args.parallel
+        self.reuse_cluster = args.reuse_cluster
 
 
 TestArgs.__test__ = False  # type:ignore
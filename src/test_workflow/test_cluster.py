@@ -9,6 +9,7 @@ import os
 from contextlib import contextmanager
 from typing import Any, Generator, List, Tuple
 
+from system.tracer import Tracer
 from test_workflow.integ_test.service import Service
 from test_workflow.integ_test.service_termination_result import ServiceTerminationResult
 from test_workflow.test_recorder.log_recorder import LogRecorder
@@ -50,12 +51,12 @@ class TestCluster(abc.ABC):
 
     @classmethod
     @contextmanager
-    def create(cls, *args: Any) -> Generator[Tuple[str, int], None, None]:
+    def create(cls, *args: Any, **kwargs: Any) -> Generator[Tuple[str, int], None, None]:
         """
         Set up the cluster. When this method returns, the cluster must be available to take requests.
         Throws ClusterCreationException if the cluster could not start for some reason. If this exception is thrown, the caller does not need to call "destroy".
         """
-        cluster = cls(*args)
+        cluster = cls(*args, **kwargs)
         try:
             cluster.start()
             yield cluster.endpoint, cluster.port
@@ -67,24 +68,44 @@ class TestCluster(abc.ABC):
 
         self.all_services = [self.service] + self.dependencies
 
-        for service in self.all_services:
-            service.start()
+        with Tracer.default().span("start cluster", component=self.component_name, test_config=self.component_test_config):
+            for service in self.all_services:
+                service.start()
 
-        for service in self.all_services:
-            service.wait_for_service()
+            for service in self.all_services:
+                service.wait_for_service()
 
-    def terminate(self) -> None:
+    def terminate(self, save_logs: bool = True) -> None:
         if self.service:
             self.termination_result = self.service.terminate()
 
         for service in self.dependencies:
             termination_result = service.terminate()
-            self.__save_test_result_data(termination_result)
+            if save_logs:
+                self.__save_test_result_data(termination_result)
 
         if not self.termination_result:
             raise ClusterServiceNotInitializedException()
 
-        self.__save_test_result_data(self.termination_result)
+        if save_logs:
+            self.__save_test_result_data(self.termination_result)
+
+    def save_logs_for(self, component_name: str, component_test_config: str) -> None:
+        """
+        Save the logs of the running cluster for a test suite that used it, e.g. one of several suites that reuse the cluster in turn.
+        The logs include those of the suites that used the cluster before.
+        """
+        process = self.service.process_handler
+        started_by_suite = (component_name, component_test_config) == (self.component_name, self.component_test_config)
+        self.save_logs.save_test_result_data(TestResultData(
+            component_name,
+            component_test_config,
+            None,
+            process.stdout_data,
+            process.stderr_data,
+            {**self.service.log_files, **self.service.output_files},
+            self.service.time_to_ready if started_by_suite else None
+        ))
 
     def __save_test_result_data(self, termination_result: ServiceTerminationResult) -> None:
         test_result_data = TestResultData(
@@ -93,7 +114,8 @@ class TestCluster(abc.ABC):
             termination_result.return_code,
             termination_result.stdout_data,
             termination_result.stderr_data,
-            termination_result.log_files
+            termination_result.log_files,
+            termination_result.time_to_ready
         )
 
         self.save_logs.save_test_result_data(test_result_data)
@@ -59,8 +59,12 @@ class TestRecorder:
     def _copy_log_files(self, log_files: dict, dest_directory: str) -> None:
         if log_files:
             for log_dest_dir_name, source_log_dir in log_files.items():
-                if os.path.exists(source_log_dir):
+                if source_log_dir and os.path.isfile(source_log_dir):
+                    shutil.copyfile(source_log_dir, os.path.join(dest_directory, log_dest_dir_name))
+                elif source_log_dir and os.path.exists(source_log_dir):
                     dest_dir = os.path.join(dest_directory, log_dest_dir_name)
+                    # logs saved again replace those saved before
+                    shutil.rmtree(dest_dir, ignore_errors=True)
                     shutil.copytree(source_log_dir, dest_dir)
 
 
@@ -86,6 +90,11 @@ class LocalClusterLogs(LogRecorder):
 
         self.parent_class._copy_log_files(test_result_data.log_files, dest_directory)
 
+        if test_result_data.time_to_ready is not None:
+            # tracked across releases to catch cluster startup regressions
+            with open(os.path.join(dest_directory, "startup.yml"), "w") as file:
+                yaml.dump({"time_to_ready": round(test_result_data.time_to_ready, 3)}, file)
+
 
 class RemoteClusterLogs(LogRecorder):
     parent_class: TestRecorder
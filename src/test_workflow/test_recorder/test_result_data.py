@@ -18,6 +18,7 @@ class TestResultData:
     stdout: A string containing the stdout stream from the test process.
     stderr: A string containing the stderr stream from the test process.
     log_files: A generator that yields tuples containing test cluster log files, in the form (absolute_path, relative_path).
+    time_to_ready: Seconds it took the test cluster to become available after it was started, if known.
     """
 
     component_name: str
@@ -26,3 +27,4 @@ class TestResultData:
     stdout: str
     stderr: str
     log_files: dict
+    time_to_ready: float = None
@@ -6,7 +6,7 @@
 
 import os
 import unittest
-from unittest.mock import ANY, MagicMock, Mock, call, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 from pytest import CaptureFixture
@@ -29,12 +29,13 @@ class TestRunAssemble(unittest.TestCase):
 
     BUILD_MANIFEST = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-1.1.0.yml")
 
+    @patch("run_assemble.Tracer")
     @patch("os.makedirs")
     @patch("os.getcwd", return_value="curdir")
     @patch("argparse._sys.argv", ["run_assemble.py", BUILD_MANIFEST])
     @patch("run_assemble.Bundles.create")
     @patch("run_assemble.BundleRecorder", return_value=MagicMock())
-    def test_main(self, mock_recorder: Mock, mock_bundles: Mock, getcwd: Mock, makeDirs: Mock) -> None:
+    def test_main(self, mock_recorder: Mock, mock_bundles: Mock, getcwd: Mock, makeDirs: Mock, mock_tracer: Mock) -> None:
         mock_bundle = MagicMock(min_dist=MagicMock(archive_path="path"))
         mock_bundles.return_value.__enter__.return_value = mock_bundle
 
@@ -50,5 +51,10 @@ class TestRunAssemble(unittest.TestCase):
             call(os.path.join("curdir", "tar", "dist", "opensearch"))
         ])  # manifest included in package
 
-        self.assertEqual(getcwd.call_count, 2)
-        makeDirs.assert_called_once_with(ANY, exist_ok=True)
+        self.assertEqual(getcwd.call_count, 3)
+        makeDirs.assert_has_calls([
+            call(os.path.join("curdir", "tar", "dist", "opensearch"), exist_ok=True),
+            call(os.path.join("curdir", "tar", "logs", "opensearch"), exist_ok=True)
+        ])
+        # the trace is not published with the bundle
+        mock_tracer.default.return_value.write.assert_called_once_with(os.path.join("curdir", "tar", "logs", "opensearch", "trace-assemble.json"))
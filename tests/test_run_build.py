@@ -14,6 +14,7 @@ import pytest
 
 from manifests.input_manifest import InputManifest
 from run_build import main
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestRunBuild(unittest.TestCase):
@@ -39,6 +40,8 @@ class TestRunBuild(unittest.TestCase):
     OPENSEARCH_MANIFEST_1_2 = os.path.realpath(os.path.join(MANIFESTS, "1.2.0", "opensearch-1.2.0.yml"))
 
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux"])
+    @patch("run_build.ResourceAccounting")
+    @patch("run_build.Tracer")
     @patch("run_build.Builders.builder_from", return_value=MagicMock())
     @patch("run_build.BuildRecorder", return_value=MagicMock())
     @patch("run_build.TemporaryDirectory")
@@ -48,8 +51,13 @@ class TestRunBuild(unittest.TestCase):
         self.assertNotEqual(mock_builder.return_value.build.call_count, 0)
         self.assertEqual(mock_builder.return_value.build.call_count, mock_builder.return_value.export_artifacts.call_count)
         mock_recorder.return_value.write_manifest.assert_called()
+        mocks[-2].default.return_value.write.assert_called_once_with(os.path.join(os.getcwd(), "tar", "logs", "opensearch", "trace-build.json"))
+        mocks[-1].default.return_value.write.assert_called_once_with(os.path.join(os.getcwd(), "tar", "logs", "opensearch", "resources.yml"))
+        self.assertEqual(mocks[-1].default.return_value.component.call_count, mock_builder.return_value.build.call_count)
 
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "darwin"])
+    @patch("run_build.ResourceAccounting")
+    @patch("run_build.Tracer")
     @patch("run_build.Builders.builder_from", return_value=MagicMock())
     @patch("run_build.BuildRecorder", return_value=MagicMock())
     @patch("run_build.TemporaryDirectory")
@@ -61,6 +69,8 @@ class TestRunBuild(unittest.TestCase):
         mock_recorder.return_value.write_manifest.assert_called()
 
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "windows"])
+    @patch("run_build.ResourceAccounting")
+    @patch("run_build.Tracer")
     @patch("run_build.Builders.builder_from", return_value=MagicMock())
     @patch("run_build.BuildRecorder", return_value=MagicMock())
     @patch("run_build.TemporaryDirectory")
@@ -79,6 +89,53 @@ class TestRunBuild(unittest.TestCase):
         self.assertEqual(mock_builder.return_value.export_artifacts.call_count, mock_builder.call_count)
         mock_recorder.return_value.write_manifest.assert_called()
 
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--parallel", "4"])
+    @patch("run_build.ResourceAccounting")
+    @patch("run_build.Tracer")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    @patch("run_build.LogsOutputDir")
+    def test_main_parallel(self, mock_logs_dir: Mock, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        with TemporaryDirectory() as work_dir, TemporaryDirectory() as logs_dir:
+            mock_temp.return_value.__enter__.return_value.name = work_dir.name
+            mock_logs_dir.return_value.dir = logs_dir.name
+            main()
+            # the logs of components that were built are kept
+            self.assertTrue(os.path.isfile(os.path.join(logs_dir.name, "common-utils.log")))
+            self.assertFalse(os.path.isfile(os.path.join(work_dir.name, "common-utils.log")))
+        mock_logs_dir.assert_called_once_with("opensearch", "tar")
+        self.assertNotEqual(mock_builder.return_value.build.call_count, 0)
+        self.assertEqual(mock_builder.return_value.build.call_count, mock_builder.return_value.export_artifacts.call_count)
+        self.assertEqual(mock_recorder.call_args[0][1][0], "OpenSearch")
+        mock_recorder.return_value.write_manifest.assert_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux"])
+    @patch("run_build.ResourceAccounting")
+    @patch("run_build.Tracer")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_no_cache(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        for call_args in mock_builder.call_args_list:
+            self.assertIsNone(call_args[0][3])
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--cache", "--cache-dir", "cache"])
+    @patch("run_build.ResourceAccounting")
+    @patch("run_build.Tracer")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_cache(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        _, _, _, cache, dependencies = mock_builder.call_args_list[1][0]
+        self.assertEqual(cache.path, "cache")
+        self.assertEqual(dependencies[0], "OpenSearch")
+        self.assertEqual(mock_builder.call_args_list[0][0][4], [])
+
     OPENSEARCH_DASHBOARDS_MANIFEST = os.path.realpath(
         os.path.join(
             os.path.dirname(__file__),
@@ -90,6 +147,8 @@ class TestRunBuild(unittest.TestCase):
     )
 
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_DASHBOARDS_MANIFEST, "-a", "x64"])
+    @patch("run_build.ResourceAccounting")
+    @patch("run_build.Tracer")
     @patch("run_build.Builders.builder_from", return_value=MagicMock())
     @patch("run_build.BuildRecorder", return_value=MagicMock())
     @patch("run_build.TemporaryDirectory")
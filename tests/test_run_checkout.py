@@ -5,6 +5,7 @@
 # compatible open source license.
 
 import os
+import subprocess
 import tempfile
 import unittest
 from typing import Any
@@ -13,6 +14,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 import pytest
 
 from run_checkout import main
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestRunCheckout(unittest.TestCase):
@@ -65,3 +67,51 @@ class TestRunCheckout(unittest.TestCase):
         )
 
         self.assertNotEqual(mock_repo.call_count, 0)
+
+    @patch("argparse._sys.argv", ["run_checkout.py", OPENSEARCH_MANIFEST, "--jobs", "4"])
+    @patch("run_checkout.GitRepository")
+    @patch("run_checkout.TemporaryDirectory")
+    def test_main_jobs(self, mock_temp: Mock, mock_repo: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_repo.return_value.__enter__.return_value = MagicMock(working_directory="dummy")
+
+        main()
+
+        mock_repo.assert_has_calls(
+            [
+                call(
+                    "https://github.com/opensearch-project/OpenSearch.git",
+                    "tags/1.1.0",
+                    os.path.join(tempfile.gettempdir(), "OpenSearch"),
+                    None,
+                ),
+                call(
+                    "https://github.com/opensearch-project/dashboards-reports.git",
+                    "tags/1.1.0.0",
+                    os.path.join(tempfile.gettempdir(), "dashboards-reports"),
+                    "reports-scheduler",
+                ),
+            ],
+            any_order=True,
+        )
+
+    @patch("argparse._sys.argv", ["run_checkout.py", OPENSEARCH_MANIFEST, "--jobs", "4"])
+    @patch("run_checkout.GitRepository")
+    @patch("run_checkout.TemporaryDirectory")
+    def test_main_jobs_error(self, mock_temp: Mock, mock_repo: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            mock_temp.return_value.__enter__.return_value.name = work_dir.name
+
+            def checkout(url: str, ref: str, directory: str, working_directory: str) -> MagicMock:
+                os.makedirs(directory)
+                if directory.endswith("common-utils"):
+                    raise subprocess.CalledProcessError(128, "git fetch")
+                return MagicMock()
+
+            mock_repo.side_effect = checkout
+
+            with self.assertRaises(subprocess.CalledProcessError):
+                main()
+
+            self.assertFalse(os.path.exists(os.path.join(work_dir.name, "common-utils")))
+            self.assertTrue(os.path.exists(os.path.join(work_dir.name, "OpenSearch")))
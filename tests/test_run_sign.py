@@ -32,9 +32,28 @@ class TestRunSign(unittest.TestCase):
     BUILD_MANIFEST = os.path.join(DATA_PATH, "opensearch-build-1.1.0.yml")
 
     @patch("argparse._sys.argv", ["run_sign.py", BUILD_MANIFEST])
+    @patch("run_sign.Tracer")
     @patch("run_sign.SignArtifacts")
     def test_main(self, mock_sign_artifacts: Mock, *mocks: Any) -> None:
         main()
 
         mock_sign_artifacts.from_path.assert_called_once()
         mock_sign_artifacts.from_path.return_value.sign.assert_called_once()
+        # the target is published, no trace is written next to it
+        mocks[0].default.return_value.write.assert_not_called()
+
+    @patch("argparse._sys.argv", ["run_sign.py", BUILD_MANIFEST, "--trace", "trace-sign.json"])
+    @patch("run_sign.Tracer")
+    @patch("run_sign.SignArtifacts")
+    def test_main_trace(self, mock_sign_artifacts: Mock, mock_tracer: Mock) -> None:
+        main()
+
+        mock_tracer.default.return_value.write.assert_called_once_with("trace-sign.json")
+
+    @patch("argparse._sys.argv", ["run_sign.py", BUILD_MANIFEST, "--jobs", "4"])
+    @patch("run_sign.Tracer")
+    @patch("run_sign.SignArtifacts")
+    def test_main_jobs(self, mock_sign_artifacts: Mock, *mocks: Any) -> None:
+        main()
+
+        self.assertEqual(mock_sign_artifacts.from_path.call_args.kwargs["jobs"], 4)
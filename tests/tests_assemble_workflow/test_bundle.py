@@ -30,8 +30,9 @@ class TestBundle(unittest.TestCase):
         self.assertEqual(bundle.artifacts_dir, artifacts_path)
         self.assertIsNotNone(bundle.bundle_recorder)
         self.assertEqual(bundle.installed_plugins, [])
-        self.assertTrue(bundle.min_dist.path.endswith("opensearch-min-1.1.0-linux-x64.tar.gz"))
-        dist_extract.assert_called_once()
+        self.assertEqual(bundle.min_dist.path, os.path.join(artifacts_path, "dist", "opensearch-min-1.1.0-linux-x64.tar.gz"))
+        dist_extract.assert_called_once_with(bundle.tmp_dir.name)
+        self.assertEqual(os.listdir(bundle.tmp_dir.name), [])
 
     @patch("assemble_workflow.dist.Dist.extract")
     def test_bundle_distribution(self, dist_extract: Mock) -> None:
@@ -45,8 +46,8 @@ class TestBundle(unittest.TestCase):
         self.assertEqual(bundle.artifacts_dir, artifacts_path)
         self.assertIsNotNone(bundle.bundle_recorder)
         self.assertEqual(bundle.installed_plugins, [])
-        self.assertTrue(bundle.min_dist.path.endswith("opensearch-min-1.3.0-windows-x64.zip"))
-        dist_extract.assert_called_once()
+        self.assertEqual(bundle.min_dist.path, os.path.join(artifacts_path, "dist", "opensearch-min-1.3.0-windows-x64.zip"))
+        dist_extract.assert_called_once_with(bundle.tmp_dir.name)
 
     def test_bundle_does_not_exist_raises_error(self) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data/opensearch-build-linux-1.1.0.yml")
@@ -5,9 +5,10 @@
 # compatible open source license.
 
 import os
+import tarfile
 import unittest
 import zipfile
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 from assemble_workflow.bundle_opensearch import BundleOpenSearch
 from manifests.build_manifest import BuildManifest
@@ -33,7 +34,7 @@ class TestBundleOpenSearch(unittest.TestCase):
         artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
         bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, MagicMock())
 
-        with patch("subprocess.check_call") as mock_check_call:
+        with patch("system.subprocess_runner.check_call") as mock_check_call:
             bundle.install_min()
 
             self.assertEqual(mock_check_call.call_count, 1)
@@ -65,7 +66,7 @@ class TestBundleOpenSearch(unittest.TestCase):
         artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
         bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, MagicMock())
 
-        with patch("subprocess.check_call") as mock_check_call:
+        with patch("system.subprocess_runner.check_call") as mock_check_call:
             bundle.install_min()
 
             self.assertEqual(mock_check_call.call_count, 1)
@@ -93,14 +94,14 @@ class TestBundleOpenSearch(unittest.TestCase):
                 ]
             )
 
-    @patch("subprocess.check_call")
+    @patch("system.subprocess_runner.check_call")
     @patch("os.path.isfile", return_value=True)
     def test_bundle_include_common_utils(self, mock_path_isile: Mock, mock_check_call: Mock) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
         artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
         bundle_recorder = MagicMock()
         bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, bundle_recorder)
-        with patch("shutil.copyfile"):
+        with patch("system.file_materializer.FileMaterializer.materialize"):
             bundle.install_components()
         bundle_recorder.record_component.assert_has_calls([
             call(bundle.components["OpenSearch"], "dist/opensearch-min-1.1.0-linux-x64.tar.gz"),
@@ -108,11 +109,11 @@ class TestBundleOpenSearch(unittest.TestCase):
         bundle_recorder.record_component.assert_has_calls([
             call(bundle.components["common-utils"]),
             call(bundle.components["job-scheduler"], "plugins/opensearch-job-scheduler-1.1.0.0.zip"),
-        ])
+        ], any_order=True)
         mock_path_isile.assert_called()
         mock_check_call.assert_called()
 
-    @patch("subprocess.check_call")
+    @patch("system.subprocess_runner.check_call")
     @patch("os.rename")
     def test_bundle_install_min_no_patch(self, mock_os_rename: Mock, mock_check_call: Mock) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
@@ -122,7 +123,7 @@ class TestBundleOpenSearch(unittest.TestCase):
         mock_os_rename.assert_not_called()
         mock_check_call.assert_called()
 
-    @patch("subprocess.check_call")
+    @patch("system.subprocess_runner.check_call")
     @patch("os.rename")
     def test_bundle_install_min_patch(self, mock_os_rename: Mock, mock_check_call: Mock) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.1.yml")
@@ -160,17 +161,43 @@ class TestBundleOpenSearch(unittest.TestCase):
             ]
         )
 
+    @patch("os.path.isfile", return_value=True)
     @patch.object(BundleOpenSearch, "install_plugin")
-    def test_bundle_install_components(self, bundle_install_plugin: Mock) -> None:
+    def test_bundle_install_components(self, bundle_install_plugin: Mock, path_isfile: Mock) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
         bundle = BundleOpenSearch(
             BuildManifest.from_path(manifest_path),
-            os.path.join(os.path.dirname(__file__), "data", "artifacts"),
+            artifacts_path,
             MagicMock(),
         )
 
-        bundle.install_components()
-        self.assertEqual(bundle_install_plugin.call_count, 12)
+        with patch("system.subprocess_runner.check_call") as mock_check_call:
+            bundle.install_components()
+
+        bundle_install_plugin.assert_not_called()
+        # one plugin CLI invocation for all plugins, then one install script per plugin
+        self.assertEqual(mock_check_call.call_count, 13)
+        install_command = mock_check_call.call_args_list[0][0][0]
+        cli_path = os.path.join(bundle.min_dist.archive_path, "bin", bundle.install_plugin_script)
+        self.assertTrue(install_command.startswith(f"{cli_path} install --batch file:{os.path.join(artifacts_path, 'plugins', 'opensearch-job-scheduler-1.1.0.0.zip')} "))
+        self.assertEqual(install_command.count(" file:"), 12)
+        self.assertEqual(
+            mock_check_call.call_args_list[1][0][0],
+            " ".join(
+                [
+                    "bash",
+                    ScriptFinder.find_install_script("opensearch-job-scheduler"),
+                    "-v 1.1.0",
+                    "-p linux",
+                    "-a x64",
+                    "-f",
+                    artifacts_path,
+                    "-o",
+                    bundle.min_dist.archive_path,
+                ]
+            ),
+        )
 
     @patch("os.path.isfile", return_value=True)
     def test_bundle_install_plugin(self, path_isfile: Mock) -> None:
@@ -180,11 +207,11 @@ class TestBundleOpenSearch(unittest.TestCase):
 
         plugin = bundle.components['job-scheduler']
 
-        with patch("shutil.copyfile") as mock_copyfile:
-            with patch("subprocess.check_call") as mock_check_call:
+        with patch("system.file_materializer.FileMaterializer.materialize") as mock_materialize:
+            with patch("system.subprocess_runner.check_call") as mock_check_call:
                 bundle.install_plugin(plugin)
 
-                self.assertEqual(mock_copyfile.call_count, 1)
+                self.assertEqual(mock_materialize.call_count, 1)
                 self.assertEqual(mock_check_call.call_count, 2)
 
                 script = "opensearch-plugin.bat" if current_platform() == "windows" else "opensearch-plugin"
@@ -229,11 +256,12 @@ class TestBundleOpenSearch(unittest.TestCase):
         with patch("tarfile.open") as mock_tarfile_open:
             mock_tarfile_add = MagicMock()
             mock_tarfile_open.return_value.__enter__.return_value.add = mock_tarfile_add
-            with patch("shutil.copyfile") as mock_copyfile:
+            with patch("assemble_workflow.dist.ParallelGzipFile") as mock_gzip_file, patch("os.replace") as mock_replace:
                 bundle.package(os.path.dirname(__file__))
-                mock_tarfile_open.assert_called_with("opensearch.tar", "w:gz")
-                mock_tarfile_add.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.1.0"), arcname="opensearch-1.1.0")
-                self.assertEqual(mock_copyfile.call_count, 1)
+                mock_gzip_file.assert_called_with(os.path.join(os.path.dirname(__file__), "opensearch.tar.part"), compresslevel=9)
+                mock_replace.assert_called_with(os.path.join(os.path.dirname(__file__), "opensearch.tar.part"), os.path.join(os.path.dirname(__file__), "opensearch.tar"))
+                mock_tarfile_open.assert_called_with(fileobj=mock_gzip_file.return_value.__enter__.return_value, mode="w|", format=tarfile.GNU_FORMAT)
+                mock_tarfile_add.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.1.0"), arcname="opensearch-1.1.0", filter=ANY)
 
     def test_bundle_package_zip(self) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.3.0.yml")
@@ -245,10 +273,9 @@ class TestBundleOpenSearch(unittest.TestCase):
         )
 
         with patch("assemble_workflow.dist.ZipFile") as mock_zipfile_open:
-            mock_zipfile_write = MagicMock()
-            mock_zipfile_open.return_value.__enter__.return_value.write = mock_zipfile_write
-            with patch("shutil.copyfile") as mock_copyfile:
-                bundle.package(os.path.dirname(__file__))
-                mock_zipfile_open.assert_called_with("opensearch.zip", "w", zipfile.ZIP_DEFLATED)
-                mock_zipfile_write.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.3.0", "opensearch.txt"), "opensearch.txt")
-                self.assertEqual(mock_copyfile.call_count, 1)
+            mock_zipfile_entry = MagicMock()
+            mock_zipfile_open.return_value.__enter__.return_value.open = mock_zipfile_entry
+            bundle.package(os.path.dirname(__file__))
+            mock_zipfile_open.assert_called_with(os.path.join(os.path.dirname(__file__), "opensearch.zip"), "w", zipfile.ZIP_DEFLATED)
+            mock_zipfile_entry.assert_called_once()
+            self.assertEqual(mock_zipfile_entry.call_args[0][0].filename, "opensearch.txt")
@@ -30,7 +30,7 @@ class TestBundleOpenSearchDashboards(unittest.TestCase):
         artifacts_path = os.path.join(os.path.dirname(__file__), "data/artifacts")
         bundle = BundleOpenSearchDashboards(BuildManifest.from_path(manifest_path), artifacts_path, MagicMock())
 
-        with patch("subprocess.check_call") as mock_check_call:
+        with patch("system.subprocess_runner.check_call") as mock_check_call:
             bundle.install_min()
 
             self.assertEqual(mock_check_call.call_count, 1)
@@ -65,11 +65,11 @@ class TestBundleOpenSearchDashboards(unittest.TestCase):
 
         plugin = bundle.components['alertingDashboards']
 
-        with patch("shutil.copyfile") as mock_copyfile:
-            with patch("subprocess.check_call") as mock_check_call:
+        with patch("system.file_materializer.FileMaterializer.materialize") as mock_materialize:
+            with patch("system.subprocess_runner.check_call") as mock_check_call:
                 bundle.install_plugin(plugin)
 
-                self.assertEqual(mock_copyfile.call_count, 1)
+                self.assertEqual(mock_materialize.call_count, 1)
                 self.assertEqual(mock_check_call.call_count, 2)
 
                 install_plugin_bin = os.path.join(bundle.min_dist.archive_path, "bin", "opensearch-dashboards-plugin")
@@ -29,7 +29,7 @@ class TestBundleRpm(unittest.TestCase):
     @patch("builtins.open")
     @patch("shutil.move")
     @patch("shutil.copy2")
-    @patch("subprocess.check_call")
+    @patch("system.subprocess_runner.check_call")
     def test_extract_rpm(self, check_call_mock: Mock, shutil_copy2_mock: Mock, shutil_move_mock: Mock, builtins_open: Mock) -> None:
 
         self.bundle_rpm.extract(self.artifacts_path)
@@ -46,7 +46,7 @@ class TestBundleRpm(unittest.TestCase):
     @patch("os.walk")
     @patch("builtins.open")
     @patch("shutil.move")
-    @patch("subprocess.check_call")
+    @patch("system.subprocess_runner.check_call")
     def test_build_rpm(self, check_call_mock: Mock, shutil_move_mock: Mock, builtins_open: Mock, os_walk_mock: Mock, os_path_exists: Mock) -> None:
 
         self.bundle_rpm.build(self.package_path, self.artifacts_path, os.path.join(self.artifacts_path, 'opensearch-1.3.0'), self.manifest_rpm.build)
@@ -61,7 +61,7 @@ class TestBundleRpm(unittest.TestCase):
     @patch("os.walk")
     @patch("builtins.open")
     @patch("shutil.move")
-    @patch("subprocess.check_call")
+    @patch("system.subprocess_runner.check_call")
     def test_build_rpm_qualifier(self, check_call_mock: Mock, shutil_move_mock: Mock, builtins_open: Mock, os_walk_mock: Mock, os_path_exists: Mock) -> None:
 
         self.bundle_rpm_qualifier.build(self.package_path, self.artifacts_path, os.path.join(self.artifacts_path, 'opensearch-2.0.0-alpha1'), self.manifest_rpm_qualifier.build)
@@ -4,12 +4,16 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import hashlib
 import os
+import tarfile
 import unittest
+import zipfile
 from unittest.mock import Mock, patch
 
-from assemble_workflow.dist import DistTar
+from assemble_workflow.dist import DistTar, DistZip
 from manifests.build_manifest import BuildManifest
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestDist(unittest.TestCase):
@@ -41,11 +45,77 @@ class TestDist(unittest.TestCase):
         distTar_extract.assert_called_once()
 
     @patch("assemble_workflow.dist.DistTar.__build__")
-    @patch("shutil.copyfile")
-    def test_dist_build(self, shutil_copyfile: Mock, distTar_build: Mock) -> None:
+    def test_dist_build(self, distTar_build: Mock) -> None:
         self.distTar.build("temp_name", "temp_dest")
-        distTar_build.assert_called_once()
-        shutil_copyfile.assert_called_once()
+        distTar_build.assert_called_once_with("temp_name", "temp_dest")
+
+    def test_dist_build_tar(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            archive_path = os.path.join(work_dir.name, "opensearch-1.3.0")
+            os.makedirs(os.path.join(archive_path, "bin"))
+            with open(os.path.join(archive_path, "bin", "opensearch"), "w") as f:
+                f.write("opensearch")
+            self.distTar.archive_path = archive_path
+            dest = os.path.join(work_dir.name, "dist")
+            os.makedirs(dest)
+            self.distTar.build("opensearch.tar.gz", dest)
+            self.assertEqual(os.listdir(dest), ["opensearch.tar.gz"])
+            with tarfile.open(os.path.join(dest, "opensearch.tar.gz"), "r:gz") as tar:
+                self.assertEqual(tar.getnames(), ["opensearch-1.3.0", "opensearch-1.3.0/bin", "opensearch-1.3.0/bin/opensearch"])
+                self.assertEqual(tar.extractfile("opensearch-1.3.0/bin/opensearch").read(), b"opensearch")
+
+    def test_dist_build_tar_fails(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            self.distTar.archive_path = os.path.join(work_dir.name, "opensearch-1.3.0")
+            os.makedirs(self.distTar.archive_path)
+            dest = os.path.join(work_dir.name, "dist")
+            os.makedirs(dest)
+            with patch("tarfile.TarFile.add", side_effect=OSError("No space left on device")):
+                with self.assertRaises(OSError):
+                    self.distTar.build("opensearch.tar.gz", dest)
+            self.assertEqual(os.listdir(dest), [])
+
+    @patch("assemble_workflow.dist.ParallelGzipFile")
+    def test_dist_build_tar_compresslevel(self, mock_gzip: Mock) -> None:
+        self.distTar.archive_path = "opensearch-1.3.0"
+        with patch("tarfile.open"), patch("os.replace") as mock_replace:
+            self.distTar.__build__("opensearch.tar.gz", "dest")
+        mock_gzip.assert_called_once_with(os.path.join("dest", "opensearch.tar.gz.part"), compresslevel=9)
+        mock_replace.assert_called_once_with(os.path.join("dest", "opensearch.tar.gz.part"), os.path.join("dest", "opensearch.tar.gz"))
+
+    def __archive(self, path: str, mtime: int) -> str:
+        archive_path = os.path.join(path, "opensearch-1.3.0")
+        for dir in ["bin", "lib", "config"]:
+            os.makedirs(os.path.join(archive_path, dir))
+            for file_name in ["b.txt", "a.txt"]:
+                with open(os.path.join(archive_path, dir, file_name), "w") as f:
+                    f.write(file_name)
+                os.utime(os.path.join(archive_path, dir, file_name), (mtime, mtime))
+        return archive_path
+
+    def __sha512(self, path: str) -> str:
+        with open(path, "rb") as f:
+            return hashlib.sha512(f.read()).hexdigest()
+
+    @patch.dict(os.environ, {"SOURCE_DATE_EPOCH": "1650000000"})
+    def test_dist_build_reproducible(self) -> None:
+        distZip = DistZip("OpenSearch", "opensearch.zip", "opensearch-1.3.0", self.manifest.build)
+        with TemporaryDirectory() as first, TemporaryDirectory() as second:
+            for dist, name in [(self.distTar, "opensearch.tar.gz"), (distZip, "opensearch.zip")]:
+                dist.archive_path = self.__archive(os.path.join(first.name, name + ".d"), 1000000000)
+                dist.build(name, first.name)
+                dist.archive_path = self.__archive(os.path.join(second.name, name + ".d"), 1100000000)
+                dist.build(name, second.name)
+                self.assertEqual(self.__sha512(os.path.join(first.name, name)), self.__sha512(os.path.join(second.name, name)))
+
+            with tarfile.open(os.path.join(first.name, "opensearch.tar.gz"), "r:gz") as tar:
+                members = tar.getmembers()
+                self.assertEqual(members[1].name, "opensearch-1.3.0/bin")
+                self.assertEqual(members[2].name, "opensearch-1.3.0/bin/a.txt")
+                self.assertEqual({(member.uid, member.gid, member.uname, member.mtime) for member in members}, {(0, 0, "", 1650000000)})
+            with zipfile.ZipFile(os.path.join(first.name, "opensearch.zip")) as zip:
+                self.assertEqual(zip.namelist()[0:2], ["bin/a.txt", "bin/b.txt"])
+                self.assertEqual({info.date_time for info in zip.infolist()}, {(2022, 4, 15, 5, 20, 0)})
 
     def test_find_min_archive_path(self) -> None:
         self.assertEqual(
@@ -69,6 +69,24 @@ class TestBuildArgs(unittest.TestCase):
     def test_components(self) -> None:
         self.assertEqual(BuildArgs().components, ["foo", "bar"])
 
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_parallel_default(self) -> None:
+        self.assertEqual(BuildArgs().parallel, 1)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "8"])
+    def test_parallel(self) -> None:
+        self.assertEqual(BuildArgs().parallel, 8)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_cache_default(self) -> None:
+        self.assertFalse(BuildArgs().cache)
+        self.assertEqual(BuildArgs().cache_dir, os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "builds"))
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--cache", "--cache-dir", "cache"])
+    def test_cache(self) -> None:
+        self.assertTrue(BuildArgs().cache)
+        self.assertEqual(BuildArgs().cache_dir, "cache")
+
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
     def test_platform_default(self) -> None:
         self.assertIsNone(BuildArgs().platform)
@@ -55,3 +55,19 @@ class TestBuildArtifactChecks(unittest.TestCase):
         target = self.__mock_target(name="OpenSearch")
         BuildArtifactChecks.check(target, "plugins", "artifact.zip")
         mock_check.assert_called_with("artifact.zip")
+
+    @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
+    def test_check_many(self, mock_check: Mock) -> None:
+        target = self.__mock_target(name="OpenSearch")
+        BuildArtifactChecks.check_many(target, "plugins", ["a.zip", "b.zip", "c.zip"])
+        self.assertEqual(sorted(call.args[0] for call in mock_check.call_args_list), ["a.zip", "b.zip", "c.zip"])
+
+    @patch.object(BuildArtifactOpenSearchCheckPlugin, "check", side_effect=ValueError("invalid"))
+    def test_check_many_error(self, mock_check: Mock) -> None:
+        target = self.__mock_target(name="OpenSearch")
+        with self.assertRaises(ValueError):
+            BuildArtifactChecks.check_many(target, "plugins", ["a.zip", "b.zip"])
+
+    def test_check_many_other(self) -> None:
+        target = self.__mock_target(name="OpenSearch")
+        BuildArtifactChecks.check_many(target, "other", ["a.txt"])
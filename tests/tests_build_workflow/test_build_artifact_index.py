@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import shutil
+import unittest
+from unittest.mock import MagicMock, patch
+from zipfile import ZipFile
+
+from build_workflow.build_artifact_check import BuildArtifactCheck
+from build_workflow.build_artifact_index import BuildArtifactIndex
+from build_workflow.build_target import BuildTarget
+from build_workflow.opensearch.build_artifact_check_maven import BuildArtifactOpenSearchCheckMaven
+from system.default_instance import DefaultInstance
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildArtifactIndex(unittest.TestCase):
+    def __write_jar(self, path: str, version: str) -> None:
+        with ZipFile(path, "w") as zip:
+            zip.writestr("META-INF/MANIFEST.MF", f"Manifest-Version: 1.0\nImplementation-Version: {version}\n")
+
+    def test_get(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            self.__write_jar(path, "1.3.0.0")
+            index = BuildArtifactIndex()
+            load = MagicMock(return_value={"version": "1.3.0.0"})
+            self.assertEqual(index.get(path, "META-INF/MANIFEST.MF", load), {"version": "1.3.0.0"})
+            self.assertEqual(index.get(path, "META-INF/MANIFEST.MF", load), {"version": "1.3.0.0"})
+            load.assert_called_once()
+            self.assertEqual((index.hits, index.misses), (1, 1))
+
+    def test_get_changed(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            self.__write_jar(path, "1.3.0.0")
+            index = BuildArtifactIndex()
+            index.get(path, "META-INF/MANIFEST.MF", lambda: {"version": "1.3.0.0"})
+            self.__write_jar(path, "1.3.0.0-SNAPSHOT")
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(index.get(path, "META-INF/MANIFEST.MF", lambda: {"version": "1.3.0.0-SNAPSHOT"}), {"version": "1.3.0.0-SNAPSHOT"})
+            self.assertEqual(index.misses, 2)
+
+    def test_get_missing(self) -> None:
+        index = BuildArtifactIndex()
+        with self.assertRaises(FileNotFoundError):
+            index.get("missing.jar", "META-INF/MANIFEST.MF", MagicMock(side_effect=FileNotFoundError()))
+        self.assertEqual(index.entries, {})
+
+    def test_get_persistent(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            index_path = os.path.join(work_dir.name, "index", "artifacts.jsonl")
+            self.__write_jar(path, "1.3.0.0")
+            BuildArtifactIndex(index_path).get(path, "META-INF/MANIFEST.MF", lambda: {"version": "1.3.0.0"})
+            with open(index_path, "a") as f:
+                f.write("{invalid")
+            load = MagicMock()
+            self.assertEqual(BuildArtifactIndex(index_path).get(path, "META-INF/MANIFEST.MF", load), {"version": "1.3.0.0"})
+            load.assert_not_called()
+
+    def test_get_copy(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            copy_path = os.path.join(work_dir.name, "copy", "artifact.jar")
+            index_path = os.path.join(work_dir.name, "artifacts.jsonl")
+            self.__write_jar(path, "1.3.0.0")
+            os.makedirs(os.path.dirname(copy_path))
+            shutil.copyfile(path, copy_path)
+            BuildArtifactIndex(index_path).get(path, "META-INF/MANIFEST.MF", lambda: {"version": "1.3.0.0"})
+            load = MagicMock()
+            self.assertEqual(BuildArtifactIndex(index_path).get(copy_path, "META-INF/MANIFEST.MF", load), {"version": "1.3.0.0"})
+            load.assert_not_called()
+
+    def test_digest(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            self.__write_jar(path, "1.3.0.0")
+            digest = BuildArtifactIndex.digest(path)
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(BuildArtifactIndex.digest(path), digest)
+            self.__write_jar(path, "1.3.0.1")
+            self.assertNotEqual(BuildArtifactIndex.digest(path), digest)
+
+            text_path = os.path.join(work_dir.name, "artifact.txt")
+            with open(text_path, "w") as f:
+                f.write("text")
+            self.assertEqual(BuildArtifactIndex.digest(text_path), "982d9e3eb996f559e633f4d194def3761d909f5a3b647d1a851fead67c32c9d1")
+
+    @patch.object(BuildArtifactIndex, "MAX_ENTRIES", 2)
+    def test_load_compacts(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            index_path = os.path.join(work_dir.name, "artifacts.jsonl")
+            # two builds that started from the same index append the same entry
+            indexes = [BuildArtifactIndex(index_path), BuildArtifactIndex(index_path)]
+            for i, version in [(0, "1.0.0.0"), (0, "1.1.0.0"), (1, "1.1.0.0"), (1, "1.2.0.0")]:
+                path = os.path.join(work_dir.name, f"{version}.jar")
+                self.__write_jar(path, version)
+                indexes[i].get(path, "META-INF/MANIFEST.MF", lambda: version)
+            with open(index_path, "r") as f:
+                self.assertEqual(len(f.readlines()), 4)
+            with open(index_path, "a") as f:
+                f.write("{invalid")
+            index = BuildArtifactIndex(index_path)
+            self.assertEqual(list(index.entries.values()), ["1.1.0.0", "1.2.0.0"])
+            with open(index_path, "r") as f:
+                self.assertEqual(len(f.readlines()), 2)
+            self.assertFalse([name for name in os.listdir(work_dir.name) if name.endswith(".tmp")])
+
+    @patch.dict(os.environ, {"BUILD_ARTIFACT_INDEX": "artifacts.jsonl"})
+    @patch.dict(DefaultInstance.__instances__, clear=True)
+    def test_default(self) -> None:
+        index = BuildArtifactIndex.default()
+        self.assertEqual(index.path, "artifacts.jsonl")
+        self.assertIs(BuildArtifactIndex.default(), index)
+
+    def test_check_maven(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            self.__write_jar(path, "1.3.0.0")
+            index = BuildArtifactIndex()
+            check = BuildArtifactOpenSearchCheckMaven(
+                BuildTarget(build_id="1", output_dir="output_dir", name="OpenSearch", version="1.3.0", architecture="x64", snapshot=False), index
+            )
+            with patch("build_workflow.opensearch.build_artifact_check_maven.ZipFile", wraps=ZipFile) as mock_zipfile:
+                check.check(path)
+                check.check(path)
+            mock_zipfile.assert_called_once()
+            self.assertEqual(list(index.entries.values()), [{"Manifest-Version": "1.0", "Implementation-Version": "1.3.0.0"}])
+
+            self.__write_jar(path, "2.0.0.0")
+            os.utime(path, ns=(0, 0))
+            with self.assertRaises(BuildArtifactCheck.BuildArtifactInvalidError):
+                check.check(path)
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import time
+import unittest
+
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_target import BuildTarget
+from manifests.input_manifest import InputComponentFromSource
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.component = InputComponentFromSource({"name": "common-utils", "repository": "url", "ref": "main"})
+        self.target = BuildTarget(name="OpenSearch", version="1.3.0", platform="linux", architecture="x64", snapshot=False)
+        self.build_script = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..", "scripts", "default", "opensearch", "build.sh"))
+
+    def __artifacts(self, path: str, size: int = 1) -> str:
+        os.makedirs(os.path.join(path, "maven"))
+        with open(os.path.join(path, "maven", "common-utils.jar"), "wb") as f:
+            f.write(b"x" * size)
+        return path
+
+    def test_key(self) -> None:
+        dependencies = {"OpenSearch": "core-sha"}
+        key = BuildCache.key(self.component, "sha", self.target, self.build_script, dependencies)
+        self.assertEqual(len(key), 64)
+        self.assertEqual(key, BuildCache.key(self.component, "sha", self.target, self.build_script, dependencies))
+        self.assertNotEqual(key, BuildCache.key(self.component, "sha2", self.target, self.build_script, dependencies))
+        snapshot = BuildTarget(name="OpenSearch", version="1.3.0", platform="linux", architecture="x64", snapshot=True)
+        self.assertNotEqual(key, BuildCache.key(self.component, "sha", snapshot, self.build_script, dependencies))
+        other = InputComponentFromSource({"name": "job-scheduler", "repository": "url", "ref": "main"})
+        self.assertNotEqual(key, BuildCache.key(other, "sha", self.target, self.build_script, dependencies))
+
+    def test_key_dependencies(self) -> None:
+        key = BuildCache.key(self.component, "sha", self.target, self.build_script, {"OpenSearch": "core-sha"})
+        self.assertNotEqual(key, BuildCache.key(self.component, "sha", self.target, self.build_script, {"OpenSearch": "core-sha2"}))
+        self.assertNotEqual(key, BuildCache.key(self.component, "sha", self.target, self.build_script, {"OpenSearch": "core-sha", "job-scheduler": "sha"}))
+
+    def test_get_miss(self) -> None:
+        with TemporaryDirectory() as cache_dir:
+            cache = BuildCache(os.path.join(cache_dir.name, "cache"))
+            self.assertIsNone(cache.get("key"))
+
+    def test_put_and_get(self) -> None:
+        with TemporaryDirectory() as cache_dir, TemporaryDirectory() as work_dir:
+            cache = BuildCache(os.path.join(cache_dir.name, "cache"))
+            path = cache.put("key", self.__artifacts(os.path.join(work_dir.name, "builds")))
+            self.assertEqual(cache.get("key"), path)
+            self.assertTrue(os.path.isfile(os.path.join(path, "maven", "common-utils.jar")))
+
+    def test_put_existing(self) -> None:
+        with TemporaryDirectory() as cache_dir, TemporaryDirectory() as work_dir:
+            cache = BuildCache(cache_dir.name)
+            artifacts = self.__artifacts(os.path.join(work_dir.name, "builds"))
+            cache.put("key", artifacts)
+            cache.put("key", artifacts)
+            self.assertEqual(os.listdir(cache_dir.name), ["key"])
+
+    def test_evict_by_size(self) -> None:
+        with TemporaryDirectory() as cache_dir, TemporaryDirectory() as work_dir:
+            cache = BuildCache(cache_dir.name, max_size=150)
+            cache.put("old", self.__artifacts(os.path.join(work_dir.name, "old"), 100))
+            os.utime(cache.entry_path("old"), (time.time() - 60, time.time() - 60))
+            cache.put("new", self.__artifacts(os.path.join(work_dir.name, "new"), 100))
+            self.assertIsNone(cache.get("old"))
+            self.assertIsNotNone(cache.get("new"))
+
+    def test_evict_by_age(self) -> None:
+        with TemporaryDirectory() as cache_dir, TemporaryDirectory() as work_dir:
+            cache = BuildCache(cache_dir.name, max_age=3600)
+            cache.put("old", self.__artifacts(os.path.join(work_dir.name, "old")))
+            os.utime(cache.entry_path("old"), (time.time() - 7200, time.time() - 7200))
+            cache.evict()
+            self.assertIsNone(cache.get("old"))
+
+    def test_put_too_large(self) -> None:
+        with TemporaryDirectory() as cache_dir, TemporaryDirectory() as work_dir:
+            cache = BuildCache(cache_dir.name, max_size=150)
+            cache.put("old", self.__artifacts(os.path.join(work_dir.name, "old"), 100))
+            self.assertIsNone(cache.put("new", self.__artifacts(os.path.join(work_dir.name, "new"), 200)))
+            self.assertIsNone(cache.get("new"))
+            self.assertIsNotNone(cache.get("old"))
@@ -4,12 +4,14 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import concurrent.futures
 import os
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
 import yaml
 
+from build_workflow.build_artifact_checks import BuildArtifactChecks
 from build_workflow.build_recorder import BuildRecorder
 from build_workflow.build_target import BuildTarget
 from build_workflow.opensearch.build_artifact_check_maven import BuildArtifactOpenSearchCheckMaven
@@ -46,9 +48,9 @@ class TestBuildRecorder(unittest.TestCase):
             )
         )
 
-    @patch("shutil.copyfile")
+    @patch("system.file_materializer.FileMaterializer.materialize")
     @patch("os.makedirs")
-    def test_record_component_and_artifact(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_component_and_artifact(self, mock_makedirs: Mock, mock_materialize: Mock) -> None:
         recorder = self.__mock(snapshot=False)
 
         recorder.record_component(
@@ -64,6 +66,9 @@ class TestBuildRecorder(unittest.TestCase):
 
         recorder.record_artifact("common-utils", "libs", "../file2.jar", __file__)
 
+        self.assertEqual(recorder.commit_id("common-utils"), "3913d7097934cbfe1fdcf919347f22a597d00b76")
+        self.assertIsNone(recorder.commit_id("job-scheduler"))
+
         self.assertEqual(
             recorder.get_manifest().to_dict(),
             {
@@ -89,12 +94,12 @@ class TestBuildRecorder(unittest.TestCase):
             },
         )
 
-        mock_copyfile.assert_called()
+        mock_materialize.assert_called()
         mock_makedirs.assert_called()
 
-    @patch("shutil.copyfile")
+    @patch("system.file_materializer.FileMaterializer.materialize")
     @patch("os.makedirs")
-    def test_record_artifact(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_artifact(self, mock_makedirs: Mock, mock_materialize: Mock) -> None:
         recorder = self.__mock(snapshot=False)
 
         recorder.record_component(
@@ -110,11 +115,11 @@ class TestBuildRecorder(unittest.TestCase):
 
         output_dir = os.path.join("output_dir", "..")
         mock_makedirs.assert_called_with(output_dir, exist_ok=True)
-        mock_copyfile.assert_called_with(__file__, os.path.join(output_dir, "file1.jar"))
+        mock_materialize.assert_called_with(__file__, os.path.join(output_dir, "file1.jar"), True)
 
-    @patch("shutil.copyfile")
+    @patch("system.file_materializer.FileMaterializer.materialize")
     @patch("os.makedirs")
-    def test_record_artifact_check_plugin(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_artifact_check_plugin(self, mock_makedirs: Mock, mock_materialize: Mock) -> None:
         recorder = self.__mock(snapshot=False)
 
         recorder.record_component("security", MagicMock())
@@ -123,12 +128,12 @@ class TestBuildRecorder(unittest.TestCase):
             recorder.record_artifact("security", "plugins", "../file1.zip", "invalid.file")
 
         mock_check.assert_called_with("invalid.file")
-        mock_copyfile.assert_called()
+        mock_materialize.assert_called()
         mock_makedirs.assert_called()
 
-    @patch("shutil.copyfile")
+    @patch("system.file_materializer.FileMaterializer.materialize")
     @patch("os.makedirs")
-    def test_record_artifact_check_maven(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_artifact_check_maven(self, mock_makedirs: Mock, mock_materialize: Mock) -> None:
         recorder = self.__mock(snapshot=False)
 
         recorder.record_component("security", MagicMock())
@@ -137,7 +142,7 @@ class TestBuildRecorder(unittest.TestCase):
             recorder.record_artifact("security", "maven", "../file1.zip", "valid.jar")
 
         mock_check.assert_called_with("valid.jar")
-        mock_copyfile.assert_called()
+        mock_materialize.assert_called()
         mock_makedirs.assert_called()
 
     def test_get_manifest(self) -> None:
@@ -176,6 +181,78 @@ class TestBuildRecorder(unittest.TestCase):
             },
         )
 
+    @patch("system.file_materializer.FileMaterializer.materialize")
+    @patch("os.makedirs")
+    def test_record_components_in_order(self, *mocks: Mock) -> None:
+        recorder = BuildRecorder(
+            BuildTarget(build_id="1", output_dir="output_dir", name="OpenSearch", version="1.3.0", platform="linux", architecture="x64", snapshot=False),
+            ["OpenSearch", "common-utils", "job-scheduler"],
+        )
+
+        def record(name: str) -> None:
+            recorder.record_component(name, MagicMock(url=f"https://github.com/opensearch-project/{name}", ref="main", sha="sha"))
+            for i in range(10):
+                recorder.record_artifact(name, "libs", f"{name}-{i}.jar", __file__)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(record, ["job-scheduler", "common-utils", "OpenSearch"]))
+
+        components = recorder.get_manifest().to_dict()["components"]
+        self.assertEqual([component["name"] for component in components], ["OpenSearch", "common-utils", "job-scheduler"])
+        self.assertEqual(components[1]["artifacts"]["libs"], [f"common-utils-{i}.jar" for i in range(10)])
+
+    def test_record_artifacts(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            recorder = BuildRecorder(
+                BuildTarget(build_id="1", output_dir=os.path.join(work_dir.name, "output"), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64")
+            )
+            recorder.record_component("common-utils", MagicMock(url="https://github.com/opensearch-project/common-utils", ref="main", sha="sha"))
+            artifacts = []
+            for i in range(20):
+                artifact_file = os.path.join(work_dir.name, f"common-utils-{i}.jar")
+                with open(artifact_file, "w") as f:
+                    f.write(str(i))
+                artifacts.append(("libs", os.path.join("libs", f"common-utils-{i}.jar"), artifact_file))
+            # an output left behind by a previous build is replaced, not written through
+            os.makedirs(os.path.join(work_dir.name, "output", "libs"))
+            os.link(artifacts[0][2], os.path.join(work_dir.name, "previous.jar"))
+            os.link(os.path.join(work_dir.name, "previous.jar"), os.path.join(work_dir.name, "output", "libs", "common-utils-0.jar"))
+
+            with patch.object(BuildArtifactChecks, "check_many") as mock_check_many:
+                recorder.record_artifacts("common-utils", artifacts)
+
+            mock_check_many.assert_called_once_with(recorder.target, "libs", [artifact[2] for artifact in artifacts])
+            self.assertEqual(recorder.get_manifest().to_dict()["components"][0]["artifacts"]["libs"], [artifact[1] for artifact in artifacts])
+            for i in range(20):
+                output_file = os.path.join(work_dir.name, "output", "libs", f"common-utils-{i}.jar")
+                self.assertTrue(os.path.samefile(output_file, artifacts[i][2]))
+
+    def test_record_artifacts_no_link(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            recorder = BuildRecorder(
+                BuildTarget(build_id="1", output_dir=os.path.join(work_dir.name, "output"), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64")
+            )
+            recorder.record_component("common-utils", MagicMock(url="https://github.com/opensearch-project/common-utils", ref="main", sha="sha"))
+            artifact_file = os.path.join(work_dir.name, "common-utils.jar")
+            with open(artifact_file, "w") as f:
+                f.write("jar")
+            with patch.object(BuildArtifactChecks, "check_many"):
+                recorder.record_artifacts("common-utils", [("libs", os.path.join("libs", "common-utils.jar"), artifact_file)], link=False)
+            output_file = os.path.join(work_dir.name, "output", "libs", "common-utils.jar")
+            self.assertFalse(os.path.samefile(output_file, artifact_file))
+            self.assertEqual(os.stat(artifact_file).st_nlink, 1)
+
+    def test_record_artifacts_error(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            recorder = BuildRecorder(
+                BuildTarget(build_id="1", output_dir=os.path.join(work_dir.name, "output"), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64")
+            )
+            recorder.record_component("security", MagicMock())
+            with patch.object(BuildArtifactChecks, "check_many", side_effect=ValueError("invalid plugin")):
+                with self.assertRaises(ValueError):
+                    recorder.record_artifacts("security", [("plugins", "plugins/security.zip", __file__)])
+            self.assertEqual(recorder.build_manifest.components_hash["security"]["artifacts"], {})
+
     def test_write_manifest(self) -> None:
         with TemporaryDirectory() as dest_dir:
             mock = self.__mock(snapshot=False)
@@ -187,10 +264,10 @@ class TestBuildRecorder(unittest.TestCase):
             with open(manifest_path) as f:
                 self.assertEqual(yaml.safe_load(f), data)
 
-    @patch("shutil.copyfile")
+    @patch("system.file_materializer.FileMaterializer.materialize")
     @patch("os.makedirs")
     @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
-    def test_record_artifact_check_plugin_version_properties(self, mock_plugin_check: Mock, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_artifact_check_plugin_version_properties(self, mock_plugin_check: Mock, mock_makedirs: Mock, mock_materialize: Mock) -> None:
         mock = self.__mock(snapshot=False)
         mock.record_component(
             "security",
@@ -205,13 +282,13 @@ class TestBuildRecorder(unittest.TestCase):
         self.assertEqual(manifest_dict["build"]["version"], "1.3.0")
         self.assertEqual(manifest_dict["components"][0]["version"], "1.3.0.0")
         mock_plugin_check.assert_called()
-        mock_copyfile.assert_called()
+        mock_materialize.assert_called()
         mock_makedirs.assert_called()
 
-    @patch("shutil.copyfile")
+    @patch("system.file_materializer.FileMaterializer.materialize")
     @patch("os.makedirs")
     @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
-    def test_record_artifact_check_plugin_version_properties_snapshot(self, mock_plugin_check: Mock, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_artifact_check_plugin_version_properties_snapshot(self, mock_plugin_check: Mock, mock_makedirs: Mock, mock_materialize: Mock) -> None:
         mock = self.__mock(snapshot=True)
         mock.record_component(
             "security",
@@ -226,5 +303,5 @@ class TestBuildRecorder(unittest.TestCase):
         self.assertEqual(manifest_dict["build"]["version"], "1.3.0-SNAPSHOT")
         self.assertEqual(manifest_dict["components"][0]["version"], "1.3.0.0-SNAPSHOT")
         mock_plugin_check.assert_called()
-        mock_copyfile.assert_called()
+        mock_materialize.assert_called()
         mock_makedirs.assert_called()
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import contextvars
+import logging
+import os
+import threading
+import time
+import unittest
+from typing import IO, List
+
+from build_workflow.build_scheduler import BuildScheduler
+from manifests.input_manifest import InputComponent
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildScheduler(unittest.TestCase):
+    def __component(self, name: str, depends_on: List[str] = None) -> InputComponent:
+        data: dict = {"name": name, "repository": f"https://github.com/opensearch-project/{name}.git", "ref": "main"}
+        if depends_on:
+            data["depends_on"] = depends_on
+        return InputComponent._from(data)
+
+    def setUp(self) -> None:
+        self.components = [
+            self.__component("OpenSearch"),
+            self.__component("common-utils"),
+            self.__component("job-scheduler"),
+            self.__component("alerting", ["common-utils"]),
+            self.__component("index-management", ["common-utils", "job-scheduler"]),
+            self.__component("security"),
+        ]
+
+    def test_prerequisites(self) -> None:
+        scheduler = BuildScheduler(self.components, core="OpenSearch")
+        self.assertEqual(scheduler.prerequisites(self.components[0]), [])
+        self.assertEqual(scheduler.prerequisites(self.components[1]), ["OpenSearch"])
+        self.assertEqual(scheduler.prerequisites(self.components[2]), ["OpenSearch", "common-utils"])
+        self.assertEqual(scheduler.prerequisites(self.components[4]), ["OpenSearch", "common-utils", "job-scheduler"])
+        # plugins wait for the libraries they consume from maven local, without listing them
+        self.assertEqual(scheduler.prerequisites(self.components[5]), ["OpenSearch", "common-utils", "job-scheduler"])
+
+    def test_prerequisites_depends_on(self) -> None:
+        components = [self.__component("OpenSearch"), self.__component("notifications", ["notifications-core"]), self.__component("notifications-core")]
+        scheduler = BuildScheduler(components, core="OpenSearch")
+        self.assertEqual(scheduler.prerequisites(components[1]), ["OpenSearch", "notifications-core"])
+
+    def test_prerequisites_not_selected(self) -> None:
+        scheduler = BuildScheduler(self.components[3:4], core="OpenSearch")
+        self.assertEqual(scheduler.prerequisites(self.components[3]), [])
+
+    def test_dependencies(self) -> None:
+        scheduler = BuildScheduler(self.components[3:4], core="OpenSearch")
+        self.assertEqual(scheduler.dependencies(self.components[3]), ["OpenSearch", "common-utils", "job-scheduler"])
+        self.assertEqual(BuildScheduler(self.components, core="OpenSearch").dependencies(self.components[0]), [])
+
+    def test_run_serial(self) -> None:
+        built: List[str] = []
+        BuildScheduler(self.components, core="OpenSearch").run(lambda component, log: built.append(component.name))
+        self.assertEqual(built, [component.name for component in self.components])
+
+    def test_run_parallel(self) -> None:
+        lock = threading.Lock()
+        started: List[str] = []
+        finished: List[str] = []
+
+        def build(component: InputComponent, log: IO) -> None:
+            with lock:
+                for name in BuildScheduler(self.components, core="OpenSearch").prerequisites(component):
+                    self.assertIn(name, finished)
+                started.append(component.name)
+            log.write(f"building {component.name}\n")
+            # logged from a pool thread that runs in a copy of the build's context
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(contextvars.copy_context().run, logging.warning, f"exporting {component.name}").result()
+            time.sleep(0.05)
+            with lock:
+                finished.append(component.name)
+
+        with TemporaryDirectory() as work_dir:
+            scheduler = BuildScheduler(self.components, core="OpenSearch", workers=4, log_dir=work_dir.name)
+            scheduler.run(build)
+            with open(os.path.join(work_dir.name, "alerting.log"), "r") as f:
+                output = f.read()
+            self.assertIn("building alerting", output)
+            self.assertIn("exporting alerting", output)
+            self.assertNotIn("exporting security", output)
+
+        self.assertEqual(started[0], "OpenSearch")
+        self.assertEqual(sorted(finished), sorted(component.name for component in self.components))
+
+    def test_run_parallel_error(self) -> None:
+        built: List[str] = []
+
+        def build(component: InputComponent, log: IO) -> None:
+            if component.name == "common-utils":
+                raise ValueError("failed")
+            built.append(component.name)
+
+        with TemporaryDirectory() as work_dir:
+            with self.assertRaises(ValueError) as ctx:
+                BuildScheduler(self.components, core="OpenSearch", workers=2, log_dir=work_dir.name).run(build)
+            self.assertEqual(str(ctx.exception), "failed")
+
+        self.assertNotIn("alerting", built)
+        self.assertNotIn("index-management", built)
+
+    def test_run_parallel_circular(self) -> None:
+        components = [self.__component("a", ["b"]), self.__component("b", ["a"])]
+        with TemporaryDirectory() as work_dir:
+            with self.assertRaises(ValueError) as ctx:
+                BuildScheduler(components, workers=2, log_dir=work_dir.name).run(lambda component, log: None)
+            self.assertEqual(str(ctx.exception), "Circular dependency between components: a, b")
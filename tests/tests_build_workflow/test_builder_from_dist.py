@@ -6,7 +6,7 @@
 
 import os
 import unittest
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from build_workflow.build_target import BuildTarget
 from build_workflow.builder_from_dist import BuilderFromDist
@@ -44,9 +44,9 @@ class TestBuilderFromDist(unittest.TestCase):
         self.__mock_builder("common-utils").build(build_recorder)
 
     @patch("os.makedirs")
-    @patch("urllib.request.urlretrieve")
+    @patch("build_workflow.builder_from_dist.Downloader")
     @patch("build_workflow.builder_from_dist.BuilderFromDist.ManifestGitRepository")
-    def test_export_artifacts(self, mock_manifest_git_repository: Mock, mock_urllib: Mock, mock_makedirs: Mock) -> None:
+    def test_export_artifacts(self, mock_manifest_git_repository: Mock, mock_downloader: Mock, mock_makedirs: Mock) -> None:
         build_recorder = MagicMock()
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.1.0.yml")
         mock_builder = self.__mock_builder("notifications")
@@ -59,16 +59,24 @@ class TestBuilderFromDist(unittest.TestCase):
             os.path.realpath(os.path.join("builds", "plugins")),
             exist_ok=True
         )
-        mock_urllib.assert_has_calls([
-            call(
+        mock_downloader.default.return_value.download_all.assert_called_once_with([
+            (
                 'dist_url/plugins/opensearch-notifications-1.1.0.0.zip',
-                os.path.realpath(os.path.join("builds", "plugins", "opensearch-notifications-1.1.0.0.zip")))
+                os.path.realpath(os.path.join("builds", "plugins", "opensearch-notifications-1.1.0.0.zip"))
+            )
+        ])
+        build_recorder.record_artifacts.assert_called_once_with("notifications", [
+            (
+                "plugins",
+                "plugins/opensearch-notifications-1.1.0.0.zip",
+                os.path.realpath(os.path.join("builds", "plugins", "opensearch-notifications-1.1.0.0.zip"))
+            )
         ])
 
     @patch("os.makedirs")
-    @patch("urllib.request.urlretrieve")
+    @patch("build_workflow.builder_from_dist.Downloader")
     @patch("build_workflow.builder_from_dist.BuilderFromDist.ManifestGitRepository")
-    def test_export_artifacts_skips_maven_artifacts(self, mock_manifest_git_repository: Mock, mock_urllib: Mock, mock_makedirs: Mock) -> None:
+    def test_export_artifacts_skips_maven_artifacts(self, mock_manifest_git_repository: Mock, mock_downloader: Mock, mock_makedirs: Mock) -> None:
         build_recorder = MagicMock()
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.1.0.yml")
         mock_builder = self.__mock_builder("common-utils")
@@ -76,4 +84,4 @@ class TestBuilderFromDist(unittest.TestCase):
         mock_builder.export_artifacts(build_recorder)
         build_recorder.record_component.assert_called_with("common-utils", mock_manifest_git_repository.return_value)
         mock_makedirs.assert_called_with("builds", exist_ok=True)
-        mock_urllib.assert_not_called()
+        mock_downloader.default.return_value.download_all.assert_not_called()
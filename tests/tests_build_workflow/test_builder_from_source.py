@@ -7,12 +7,13 @@
 import os
 import unittest
 from typing import Any, List
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from build_workflow.build_target import BuildTarget
 from build_workflow.builder_from_source import BuilderFromSource
 from manifests.input_manifest import InputComponentFromSource
 from paths.script_finder import ScriptFinder
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestBuilderFromSource(unittest.TestCase):
@@ -84,7 +85,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s false",
                     "-o builds",
                 ]
-            )
+            ),
+            stdout=None,
         )
         build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
 
@@ -106,7 +108,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s false",
                     "-o builds",
                 ]
-            )
+            ),
+            stdout=None,
         )
         build_recorder.record_component.assert_called_with("OpenSearch", mock_git_repo.return_value)
 
@@ -127,7 +130,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s false",
                     "-o builds",
                 ]
-            )
+            ),
+            stdout=None,
         )
         build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
 
@@ -149,7 +153,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s true",
                     "-o builds",
                 ]
-            )
+            ),
+            stdout=None,
         )
         build_recorder.record_component.assert_called_with("sample_component", self.builder.git_repo)
 
@@ -173,7 +178,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s true",
                     "-o builds",
                 ]
-            )
+            ),
+            stdout=None,
         )
         build_recorder.record_component.assert_called_with("sample_component", self.builder.git_repo)
 
@@ -197,10 +203,75 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s true",
                     "-o builds",
                 ]
-            )
+            ),
+            stdout=None,
         )
         build_recorder.record_component.assert_called_with("not_found_component", mock_git_repo.return_value)
 
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_cache_miss(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha="sha")
+        cache = MagicMock()
+        cache.get.return_value = None
+        builder = BuilderFromSource(self.builder.component, self.builder.target, cache=cache)
+        builder.checkout("dir")
+        with patch("os.path.isdir", return_value=True):
+            builder.build(MagicMock())
+        mock_git_repo.return_value.execute.assert_called()
+        cache.put.assert_called_with(cache.get.call_args[0][0], os.path.join("dir", "builds"))
+        self.assertEqual(builder.artifacts_path, os.path.join("dir", "builds"))
+
+    @patch("build_workflow.builder_from_source.BuildCache.key", return_value="key")
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_cache_dependencies(self, mock_git_repo: Mock, mock_key: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha="sha")
+        cache = MagicMock()
+        cache.get.return_value = None
+        build_recorder = MagicMock()
+        build_recorder.commit_id.side_effect = lambda name: {"OpenSearch": "core-sha"}.get(name)
+        builder = BuilderFromSource(self.builder.component, self.builder.target, cache=cache, dependencies=["OpenSearch"])
+        builder.checkout("dir")
+        builder.build(build_recorder)
+        self.assertEqual(mock_key.call_args[0][4], {"OpenSearch": "core-sha"})
+        cache.get.assert_called_with("key")
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_cache_dependency_not_built(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha="sha")
+        cache = MagicMock()
+        build_recorder = MagicMock()
+        build_recorder.commit_id.return_value = None
+        builder = BuilderFromSource(self.builder.component, self.builder.target, cache=cache, dependencies=["OpenSearch"])
+        builder.checkout("dir")
+        with patch("os.path.isdir", return_value=True):
+            builder.build(build_recorder)
+        mock_git_repo.return_value.execute.assert_called()
+        cache.get.assert_not_called()
+        cache.put.assert_not_called()
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_cache_hit(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha="sha")
+        cache = MagicMock()
+        build_recorder = MagicMock()
+        with TemporaryDirectory() as cache_dir, TemporaryDirectory() as home_dir:
+            os.makedirs(os.path.join(cache_dir.name, "maven", "org", "opensearch"))
+            with open(os.path.join(cache_dir.name, "maven", "org", "opensearch", "common-utils.jar"), "w") as f:
+                f.write("jar")
+            cache.get.return_value = cache_dir.name
+            builder = BuilderFromSource(self.builder.component, self.builder.target, cache=cache)
+            builder.checkout("dir")
+            with patch("os.path.expanduser", return_value=home_dir.name):
+                builder.build(build_recorder)
+            restored = os.path.join(home_dir.name, ".m2", "repository", "org", "opensearch", "common-utils.jar")
+            self.assertTrue(os.path.isfile(restored))
+            # maven local never shares files with the cache
+            self.assertEqual(os.stat(restored).st_nlink, 1)
+        mock_git_repo.return_value.execute.assert_not_called()
+        cache.put.assert_not_called()
+        build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
+        self.assertEqual(builder.artifacts_path, cache_dir.name)
+
     def mock_os_walk(self, artifact_path: str) -> List[Any]:
         if artifact_path.endswith(os.path.join("dir", "builds", "core-plugins")):
             return [["core-plugins", [], ["plugin1.zip"]]]
@@ -217,11 +288,10 @@ class TestBuilderFromSource(unittest.TestCase):
         mock_walk.side_effect = self.mock_os_walk
         self.builder.checkout("dir")
         self.builder.export_artifacts(build_recorder)
-        self.assertEqual(build_recorder.record_artifact.call_count, 2)
-        build_recorder.record_artifact.assert_has_calls(
+        build_recorder.record_artifacts.assert_called_once_with(
+            "sample_component",
             [
-                call(
-                    "sample_component",
+                (
                     "maven",
                     os.path.relpath(
                         os.path.join("maven", "artifact1.jar"),
@@ -229,8 +299,7 @@ class TestBuilderFromSource(unittest.TestCase):
                     ),
                     os.path.join("maven", "artifact1.jar"),
                 ),
-                call(
-                    "sample_component",
+                (
                     "core-plugins",
                     os.path.relpath(
                         os.path.join("core-plugins", "plugin1.zip"),
@@ -238,5 +307,22 @@ class TestBuilderFromSource(unittest.TestCase):
                     ),
                     os.path.join("core-plugins", "plugin1.zip"),
                 ),
-            ]
+            ],
+            link=True,
+        )
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_export_artifacts_cached(self, mock_git_repo: Mock) -> None:
+        build_recorder = MagicMock()
+        with TemporaryDirectory() as cache_dir:
+            os.makedirs(os.path.join(cache_dir.name, "plugins"))
+            with open(os.path.join(cache_dir.name, "plugins", "plugin1.zip"), "w") as f:
+                f.write("zip")
+            self.builder.checkout("dir")
+            self.builder.cached_artifacts_path = cache_dir.name
+            self.builder.export_artifacts(build_recorder)
+        build_recorder.record_artifacts.assert_called_once_with(
+            "sample_component",
+            [("plugins", os.path.join("plugins", "plugin1.zip"), os.path.join(cache_dir.name, "plugins", "plugin1.zip"))],
+            link=False,
         )
@@ -34,3 +34,11 @@ class TestCheckoutArgs(unittest.TestCase):
     @patch("argparse._sys.argv", [CHECKOUT_PY, OPENSEARCH_MANIFEST, "--verbose"])
     def test_verbose_true(self) -> None:
         self.assertTrue(CheckoutArgs().logging_level, logging.DEBUG)
+
+    @patch("argparse._sys.argv", [CHECKOUT_PY, OPENSEARCH_MANIFEST])
+    def test_jobs_default(self) -> None:
+        self.assertEqual(CheckoutArgs().jobs, 1)
+
+    @patch("argparse._sys.argv", [CHECKOUT_PY, OPENSEARCH_MANIFEST, "--jobs", "8"])
+    def test_jobs(self) -> None:
+        self.assertEqual(CheckoutArgs().jobs, 8)
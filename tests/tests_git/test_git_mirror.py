@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import os
+import subprocess
+import unittest
+from unittest.mock import Mock, patch
+
+from git.git_mirror import GitMirror
+from git.git_repository import GitRepository
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestGitMirror(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.origin = os.path.join(self.temp_dir.name, "origin")
+        self.url = f"file://{self.origin}"
+        self.mirrors_dir = os.path.join(self.temp_dir.name, "mirrors")
+        os.makedirs(self.origin)
+        self.git("init -b main")
+        self.sha1 = self.commit("1.txt")
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def git(self, args: str) -> str:
+        return subprocess.check_output(
+            f"git -c user.name=test -c user.email=test@example.com {args}",
+            cwd=self.origin,
+            shell=True,
+        ).decode().strip()
+
+    def commit(self, file_name: str) -> str:
+        with open(os.path.join(self.origin, file_name), "w") as f:
+            f.write(file_name)
+        self.git(f"add {file_name}")
+        self.git(f"commit -m {file_name}")
+        return self.git("rev-parse HEAD")
+
+    def test_dir(self) -> None:
+        mirror = GitMirror(self.mirrors_dir, "https://github.com/opensearch-project/OpenSearch.git")
+        self.assertTrue(os.path.basename(mirror.dir).startswith("OpenSearch-"))
+        self.assertTrue(mirror.dir.endswith(".git"))
+        self.assertNotEqual(mirror.dir, GitMirror(self.mirrors_dir, "https://github.com/opensearch-project/job-scheduler.git").dir)
+
+    def test_fetch(self) -> None:
+        mirror = GitMirror(self.mirrors_dir, self.url)
+        self.assertEqual(mirror.fetch("main"), self.sha1)
+        self.assertTrue(mirror.has_commit(self.sha1))
+        sha2 = self.commit("2.txt")
+        self.assertFalse(mirror.has_commit(sha2))
+        self.assertEqual(mirror.fetch("main"), sha2)
+
+    def test_fetch_shallow(self) -> None:
+        self.commit("2.txt")
+        mirror = GitMirror(self.mirrors_dir, self.url)
+        mirror.fetch("main")
+        self.assertEqual(mirror.output("git rev-parse --is-shallow-repository"), "true")
+        self.assertFalse(mirror.has_commit(self.sha1))
+
+    def test_fetch_prunes_refs(self) -> None:
+        mirror = GitMirror(self.mirrors_dir, self.url)
+        mirror.fetch("main")
+        self.commit("2.txt")
+        with patch.object(GitMirror, "MAX_REFS", 1):
+            sha2 = mirror.fetch("main")
+        self.assertEqual(mirror.output("git for-each-ref --format='%(refname)' refs/mirror/"), f"refs/mirror/{sha2}")
+
+    def test_fetch_prunes_refs_by_fetch_order(self) -> None:
+        self.git("tag old")
+        # a newer commit, fetched first
+        with patch.dict(os.environ, {"GIT_COMMITTER_DATE": "2030-01-01T00:00:00+00:00"}):
+            sha2 = self.commit("2.txt")
+        mirror = GitMirror(self.mirrors_dir, self.url)
+        with patch.object(GitMirror, "MAX_REFS", 2):
+            mirror.fetch("main")
+            # the old commit is fetched last, it is kept over the newer one
+            self.assertEqual(mirror.fetch("old"), self.sha1)
+            self.assertEqual(mirror.output("git for-each-ref --format='%(refname)' refs/mirror/").split(), sorted([f"refs/mirror/{self.sha1}", f"refs/mirror/{sha2}"]))
+            sha3 = self.commit("3.txt")
+            mirror.fetch("main")
+        refs = mirror.output("git for-each-ref --format='%(refname)' refs/mirror/").split()
+        self.assertEqual(refs, sorted([f"refs/mirror/{self.sha1}", f"refs/mirror/{sha3}"]))
+        with open(os.path.join(mirror.dir, GitMirror.FETCH_LOG)) as f:
+            self.assertEqual(f.read().split(), [self.sha1, sha3])
+
+    def test_fetch_create_fails(self) -> None:
+        mirror = GitMirror(self.mirrors_dir, self.url)
+        with patch("system.subprocess_runner.check_call", side_effect=[0, subprocess.CalledProcessError(1, "git remote add")]):
+            with self.assertRaises(subprocess.CalledProcessError):
+                mirror.fetch("main")
+        self.assertEqual(os.listdir(self.mirrors_dir), [os.path.basename(mirror.lock_path)])
+        self.assertEqual(mirror.fetch("main"), self.sha1)
+
+    @patch("system.subprocess_runner.check_call")
+    def test_fetch_known_sha(self, mock_check_call: Mock) -> None:
+        mirror = GitMirror(self.mirrors_dir, self.url)
+        with patch.object(GitMirror, "has_commit", return_value=True), patch("os.path.isdir", return_value=True):
+            self.assertEqual(mirror.fetch(self.sha1), self.sha1)
+        mock_check_call.assert_not_called()
+
+    def test_checkout(self) -> None:
+        sha2 = self.commit("2.txt")
+        with GitRepository(self.url, "main", mirror_dir=self.mirrors_dir) as repo:
+            self.assertEqual(repo.sha, sha2)
+            self.assertTrue(os.path.isfile(os.path.join(repo.dir, "2.txt")))
+            self.assertEqual(repo.output("git remote get-url origin"), self.url)
+            # shallow, like the mirror
+            self.assertEqual(repo.output("git log --format=%H"), sha2)
+        with GitRepository(self.url, self.sha1, mirror_dir=self.mirrors_dir) as repo:
+            self.assertEqual(repo.sha, self.sha1)
+            self.assertFalse(os.path.isfile(os.path.join(repo.dir, "2.txt")))
+        mirror = GitMirror(self.mirrors_dir, self.url)
+        self.assertEqual(sorted(os.listdir(self.mirrors_dir)), sorted([os.path.basename(mirror.dir), os.path.basename(mirror.lock_path)]))
+
+    def test_checkout_concurrent(self) -> None:
+        def checkout(index: int) -> str:
+            with GitRepository(self.url, "main", mirror_dir=self.mirrors_dir) as repo:
+                return repo.sha
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(list(executor.map(checkout, range(4))), [self.sha1] * 4)
+
+    def test_checkout_from_env(self) -> None:
+        with patch.dict(os.environ, {"GIT_MIRROR_DIR": self.mirrors_dir}):
+            with GitRepository(self.url, "main") as repo:
+                self.assertEqual(repo.mirror_dir, self.mirrors_dir)
+                self.assertEqual(repo.sha, self.sha1)
+        self.assertTrue(os.path.isdir(GitMirror(self.mirrors_dir, self.url).dir))
@@ -16,8 +16,8 @@ from system.temporary_directory import TemporaryDirectory
 
 class TestGitRepository(unittest.TestCase):
 
-    @patch('subprocess.check_call', return_value=0)
-    @patch('subprocess.check_output', return_value='8ac515431bf24caf92fea9d9b0af3b8f10b88453'.encode())
+    @patch('system.subprocess_runner.check_call', return_value=0)
+    @patch('system.subprocess_runner.check_output', return_value='8ac515431bf24caf92fea9d9b0af3b8f10b88453'.encode())
     def setUp(self, *mocks: Any) -> None:
         self.repo = GitRepository(
             url="https://github.com/opensearch-project/.github",
@@ -35,13 +35,13 @@ class TestGitRepository(unittest.TestCase):
         self.repo.execute("echo $PWD > created.txt")
         self.assertTrue(os.path.isfile(os.path.join(self.repo.dir, "created.txt")))
 
-    @patch('subprocess.check_call', return_value=0)
+    @patch('system.subprocess_runner.check_call', return_value=0)
     def test_execute_in_subdir(self, mock_check_call: Mock) -> None:
         subdir = os.path.join(self.repo.dir, "ISSUE_TEMPLATE")
         self.repo.execute("echo $PWD > created.txt", subdir)
         mock_check_call.assert_called_with('echo $PWD > created.txt', cwd=subdir, shell=True)
 
-    @patch("subprocess.check_call")
+    @patch("system.subprocess_runner.check_call")
     def test_execute_silent(self, mock_subprocess: Mock) -> None:
         self.repo.execute_silent("echo .")
         mock_subprocess.assert_called_with(
@@ -52,15 +52,15 @@ class TestGitRepository(unittest.TestCase):
             stderr=subprocess.DEVNULL,
         )
 
-    @patch("subprocess.check_output")
+    @patch("system.subprocess_runner.check_output")
     def test_output(self, mock_subprocess: Any) -> None:
         self.repo.output("echo hello")
         mock_subprocess.assert_called_with("echo hello", cwd=self.repo.dir, shell=True)
 
 
 class TestGitRepositoryDir(unittest.TestCase):
-    @patch('subprocess.check_call', return_value=0)
-    @patch('subprocess.check_output', return_value='8ac515431bf24caf92fea9d9b0af3b8f10b88453'.encode())
+    @patch('system.subprocess_runner.check_call', return_value=0)
+    @patch('system.subprocess_runner.check_output', return_value='8ac515431bf24caf92fea9d9b0af3b8f10b88453'.encode())
     def test_checkout_into_dir(self, *mocks: Any) -> None:
         with TemporaryDirectory() as tmpdir:
             subdir = os.path.join(tmpdir.name, ".github")
@@ -78,8 +78,8 @@ class TestGitRepositoryDir(unittest.TestCase):
 
 
 class TestGitRepositoryWithWorkingDir(unittest.TestCase):
-    @patch('subprocess.check_call', return_value=0)
-    @patch('subprocess.check_output', return_value='8ac515431bf24caf92fea9d9b0af3b8f10b88453'.encode())
+    @patch('system.subprocess_runner.check_call', return_value=0)
+    @patch('system.subprocess_runner.check_output', return_value='8ac515431bf24caf92fea9d9b0af3b8f10b88453'.encode())
     def test_checkout_into_dir(self, *mocks: Any) -> None:
         with GitRepository(
             url="https://github.com/opensearch-project/.github",
@@ -92,14 +92,31 @@ class TestGitRepositoryWithWorkingDir(unittest.TestCase):
 
 
 class TestGitRepositoryClassMethods(unittest.TestCase):
-    @patch("subprocess.check_output", return_value="sha\tHEAD".encode())
+    @patch("system.subprocess_runner.check_output", return_value="sha\tHEAD".encode())
     def test_stable_ref(self, mock_output: Mock) -> None:
         ref, name = GitRepository.stable_ref("https://github.com/opensearch-project/OpenSearch", "sha")
         self.assertEqual(ref, "sha")
         self.assertEqual(name, "HEAD")
 
-    @patch("subprocess.check_output", return_value="".encode())
+    @patch("system.subprocess_runner.check_output", return_value="".encode())
     def test_stable_ref_none(self, mock_output: Mock) -> None:
         ref, name = GitRepository.stable_ref("https://github.com/opensearch-project/OpenSearch", "sha")
         self.assertEqual(ref, "sha")
         self.assertEqual(name, "sha")
+
+    @patch("system.subprocess_runner.check_output", return_value="sha1\trefs/heads/main\nsha2\trefs/tags/1.0.0\nsha3\trefs/tags/1.0.0^{}".encode())
+    def test_stable_refs(self, mock_output: Mock) -> None:
+        GitRepository.__stable_refs__.clear()
+        url = "https://github.com/opensearch-project/OpenSearch"
+        refs = GitRepository.stable_refs(url, ["main", "tags/1.0.0", "main", "sha"])
+        self.assertEqual(refs, {"main": ["sha1", "refs/heads/main"], "tags/1.0.0": ["sha3", "refs/tags/1.0.0"], "sha": ["sha", "sha"]})
+        mock_output.assert_called_once_with(f"git ls-remote {url} main tags/1.0.0 sha", shell=True)
+        self.assertEqual(GitRepository.stable_refs(url, ["main"]), {"main": ["sha1", "refs/heads/main"]})
+        mock_output.assert_called_once()
+
+    @patch("system.subprocess_runner.check_output", return_value="sha2\trefs/tags/1.0.0\nsha3\trefs/tags/1.0.0^{}".encode())
+    def test_stable_ref_annotated_tag(self, mock_output: Mock) -> None:
+        ref, name = GitRepository.stable_ref("https://github.com/opensearch-project/OpenSearch", "tags/1.0.0")
+        # the commit that the tag points to, not the tag object
+        self.assertEqual(ref, "sha3")
+        self.assertEqual(name, "refs/tags/1.0.0")
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import argparse
+import glob
+import logging
+import os
+import time
+from typing import Any, List, Tuple
+
+import yaml
+
+import manifests.manifest
+from manifests.input_manifest import InputManifest
+from manifests.manifest import Manifest
+from manifests.test_manifest import TestManifest
+
+"""
+Benchmarks loading every input and test manifest in the manifests directory, with the pure Python and the libyaml parsers,
+and with a new validator for each manifest or reused validators.
+
+    pipenv run python -m tests.tests_manifests.benchmark_manifests --rounds 5
+"""
+
+MANIFESTS_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..", "manifests"))
+
+
+def manifest_files() -> List[Tuple[Any, str]]:
+    results: List[Tuple[Any, str]] = []
+    for path in sorted(glob.glob(os.path.join(MANIFESTS_PATH, "**", "*.yml"), recursive=True)):
+        if path.endswith("-maven.yml"):
+            continue
+        results.append((TestManifest if path.endswith("-test.yml") else InputManifest, path))
+    return results
+
+
+def measure(files: List[Tuple[Any, str]], rounds: int, loader: Any, reuse_validators: bool) -> float:
+    manifests.manifest.SafeLoader = loader
+    validators = Manifest.__validators__.__dict__
+    best = float("inf")
+    for _ in range(rounds):
+        validators.clear()
+        started = time.perf_counter()
+        for klass, path in files:
+            if not reuse_validators:
+                validators.clear()
+            klass.from_path(path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark loading the manifests in the manifests directory.")
+    parser.add_argument("--rounds", type=int, default=5, help="Number of times to load all manifests, the best time is reported.")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    files = manifest_files()
+    print(f"Loading {len(files)} manifests from {MANIFESTS_PATH}, best of {args.rounds}")
+
+    loaders: List[Tuple[str, Any]] = [("pure Python", yaml.SafeLoader)]
+    if getattr(yaml, "CSafeLoader", None):
+        loaders.append(("libyaml", yaml.CSafeLoader))
+    else:
+        print("PyYAML was built without libyaml")
+
+    default = manifests.manifest.SafeLoader
+    baseline = None
+    try:
+        for name, loader in loaders:
+            for reuse_validators in [False, True]:
+                best = measure(files, args.rounds, loader, reuse_validators)
+                baseline = baseline or best
+                validators = "reused validators" if reuse_validators else "new validators"
+                print(f"{name + ' parser, ' + validators:<40} {best * 1000:>8.1f}ms {best * 1000 / len(files):>6.2f}ms/manifest {baseline / best:>5.1f}x")
+    finally:
+        manifests.manifest.SafeLoader = default
+
+
+if __name__ == "__main__":
+    main()
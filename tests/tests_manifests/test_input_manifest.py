@@ -11,6 +11,7 @@ from unittest.mock import Mock, patch
 
 import yaml
 
+from git.git_repository import GitRepository
 from manifests.input_manifest import Check, InputComponent, InputComponentFromDist, InputComponentFromSource, InputManifest
 from system.temporary_directory import TemporaryDirectory
 
@@ -18,6 +19,7 @@ from system.temporary_directory import TemporaryDirectory
 class TestInputManifest(unittest.TestCase):
     def setUp(self) -> None:
         self.maxDiff = None
+        GitRepository.__stable_refs__.clear()
         self.manifests_path = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..", "manifests"))
 
     def test_1_1_1_dist(self) -> None:
@@ -169,7 +171,14 @@ class TestInputManifest(unittest.TestCase):
         self.assertTrue(component.__matches__(focus=["x", "y"]))
         self.assertFalse(component.__matches__(focus=["y"]))
 
-    @patch("subprocess.check_output")
+    def test_component_depends_on(self) -> None:
+        data = {"name": "x", "repository": "", "ref": ""}
+        self.assertIsNone(InputComponent._from(data).depends_on)
+        component = InputComponent._from({**data, "depends_on": ["y"]})  # type: ignore
+        self.assertEqual(component.depends_on, ["y"])
+        self.assertEqual(component.__to_dict__()["depends_on"], ["y"])
+
+    @patch("system.subprocess_runner.check_output")
     def test_stable(self, mock_output: Mock) -> None:
         mock_output.return_value.decode.return_value = "updated\tHEAD"
         path = os.path.join(self.manifests_path, "1.1.0", "opensearch-1.1.0.yml")
@@ -177,7 +186,7 @@ class TestInputManifest(unittest.TestCase):
         opensearch: InputComponentFromSource = manifest.components["OpenSearch"]  # type: ignore[assignment]
         self.assertEqual(opensearch.ref, "updated")
 
-    @patch("subprocess.check_output")
+    @patch("system.subprocess_runner.check_output")
     @patch("git.git_repository.GitRepository.stable_ref", return_value=("abcd", "1234"))
     def test_stable_override_build(self, git_repo: Mock, mock_output: Mock) -> None:
         mock_output.return_value.decode.return_value = "updated\tHEAD"
@@ -186,6 +195,34 @@ class TestInputManifest(unittest.TestCase):
         opensearch: InputComponentFromSource = manifest.components["OpenSearch"]  # type: ignore[assignment]
         self.assertEqual(opensearch.ref, "abcd")
 
+    @patch("system.subprocess_runner.check_output")
+    def test_stable_batched(self, mock_output: Mock) -> None:
+        mock_output.return_value.decode.return_value = "\n".join(
+            [
+                "sha1\trefs/heads/main",
+                "sha2\trefs/tags/1.1.0",
+                "sha3\trefs/tags/1.1.0^{}",
+            ]
+        )
+        unstable = InputManifest(
+            {
+                "schema-version": "1.0",
+                "build": {"name": "OpenSearch", "version": "1.1.0"},
+                "components": [
+                    {"name": "notifications-core", "repository": "https://github.com/opensearch-project/notifications.git", "ref": "main"},
+                    {"name": "notifications", "repository": "https://github.com/opensearch-project/notifications.git", "ref": "tags/1.1.0"},
+                    {"name": "dashboards-notifications", "repository": "https://github.com/opensearch-project/notifications.git", "ref": "1.x"},
+                ],
+            }
+        )
+        manifest = unstable.stable()
+        mock_output.assert_called_once_with("git ls-remote https://github.com/opensearch-project/notifications.git main tags/1.1.0 1.x", shell=True)
+        self.assertEqual([component.ref for component in manifest.components.values()], ["sha1", "sha3", "1.x"])  # type: ignore[attr-defined]
+
+        # resolved refs are cached
+        self.assertEqual(unstable.stable(), manifest)
+        mock_output.assert_called_once()
+
     def test_eq(self) -> None:
         path = os.path.join(self.manifests_path, "1.0.0", "opensearch-1.0.0.yml")
         manifest1 = InputManifest.from_path(path)
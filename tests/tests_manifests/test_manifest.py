@@ -5,8 +5,9 @@
 # compatible open source license.
 
 import os
+import threading
 import unittest
-from typing import Any, Dict
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, Mock, patch
 
 import yaml
@@ -143,3 +144,23 @@ class TestManifest(unittest.TestCase):
         manifest2 = TestManifest.SampleManifest.from_path(manifest_path)
         self.assertEqual(manifest1, manifest1)
         self.assertEqual(manifest1, manifest2)
+
+    def test_validator_reused(self) -> None:
+        manifest_path = os.path.join(self.data_path, "min.yml")
+        manifest1 = TestManifest.SampleManifest.from_path(manifest_path)
+        manifest2 = TestManifest.SampleManifest.from_path(manifest_path)
+        self.assertIs(manifest1.validator, manifest2.validator)
+
+    def test_validator_per_thread(self) -> None:
+        manifest = TestManifest.SampleManifest.from_path(os.path.join(self.data_path, "min.yml"))
+        validators: List[Any] = []
+        thread = threading.Thread(target=lambda: validators.append(manifest.validator))
+        thread.start()
+        thread.join()
+        self.assertIsNot(validators[0], manifest.validator)
+
+    @patch("manifests.manifest.yaml.load", return_value={"schema-version": "3.14"})
+    def test_from_file_loader(self, mock_load: Mock) -> None:
+        with open(os.path.join(self.data_path, "min.yml")) as f:
+            TestManifest.SampleManifest.from_file(f)
+        self.assertIs(mock_load.call_args.kwargs["Loader"], getattr(yaml, "CSafeLoader", yaml.SafeLoader))
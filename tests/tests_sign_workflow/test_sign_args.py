@@ -58,3 +58,27 @@ class TestSignArgs(unittest.TestCase):
     @patch("argparse._sys.argv", [SIGN_PY, OPENSEARCH_MANIFEST, "--platform", "windows"])
     def test_platform_windows(self) -> None:
         self.assertEqual(SignArgs().platform, "windows")
+
+    @patch("argparse._sys.argv", [SIGN_PY, OPENSEARCH_MANIFEST])
+    def test_jobs_default(self) -> None:
+        self.assertEqual(SignArgs().jobs, 1)
+
+    @patch("argparse._sys.argv", [SIGN_PY, OPENSEARCH_MANIFEST, "--jobs", "8"])
+    def test_jobs(self) -> None:
+        self.assertEqual(SignArgs().jobs, 8)
+
+    @patch("argparse._sys.argv", [SIGN_PY, OPENSEARCH_MANIFEST])
+    def test_force_default(self) -> None:
+        self.assertFalse(SignArgs().force)
+
+    @patch("argparse._sys.argv", [SIGN_PY, OPENSEARCH_MANIFEST, "--force"])
+    def test_force(self) -> None:
+        self.assertTrue(SignArgs().force)
+
+    @patch("argparse._sys.argv", [SIGN_PY, OPENSEARCH_MANIFEST])
+    def test_trace_default(self) -> None:
+        self.assertIsNone(SignArgs().trace)
+
+    @patch("argparse._sys.argv", [SIGN_PY, OPENSEARCH_MANIFEST, "--trace", "logs/trace-sign.json"])
+    def test_trace(self) -> None:
+        self.assertEqual(SignArgs().trace, "logs/trace-sign.json")
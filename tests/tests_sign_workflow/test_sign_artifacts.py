@@ -103,3 +103,18 @@ class TestSignArtifacts(unittest.TestCase):
         signer_with_manifest.sign()
         expected = ["tar_dummy_artifact_1.0.0.tar.gz", "zip_dummy_artifact_1.1.0.zip"]
         signer.sign_artifacts.assert_called_with(expected, path, sigtype)
+
+    @patch.dict(os.environ, {"SIGNATURE_LEDGER_DIR": "ledgers"})
+    @patch("sign_workflow.signer.GitRepository")
+    def test_ledger(self, mock_repo: Mock) -> None:
+        manifest = Path(os.path.join(os.path.dirname(__file__), "data", "opensearch-build-1.1.0.yml"))
+        sign_artifacts = SignArtifacts.from_path(manifest, [], None, ".asc", "linux", force=True)
+        ledger = sign_artifacts.signer.ledger
+        self.assertEqual(os.path.dirname(ledger.path), "ledgers")
+        self.assertEqual(ledger.dir, os.path.realpath(manifest.parent))
+        self.assertTrue(sign_artifacts.signer.force)
+
+        directory = Path(os.path.dirname(__file__))
+        directory_ledger = SignArtifacts.from_path(directory, [], None, ".asc", "linux").signer.ledger
+        self.assertEqual(directory_ledger.dir, os.path.realpath(directory))
+        self.assertNotEqual(directory_ledger.path, ledger.path)
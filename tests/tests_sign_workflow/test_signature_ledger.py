@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from unittest.mock import patch
+
+from sign_workflow.signature_ledger import SignatureLedger
+from system.file_digest import file_digest
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestSignatureLedger(unittest.TestCase):
+    def setUp(self) -> None:
+        self.work_dir = TemporaryDirectory()
+        self.ledger_path = os.path.join(self.work_dir.name, "signatures.jsonl")
+        self.artifact = self.__write("maven/the-jar.jar", "jar")
+        self.signature = self.__write("maven/the-jar.jar.asc", "signature")
+        self.sha256 = file_digest(self.artifact, "sha256")
+
+    def tearDown(self) -> None:
+        self.work_dir.__exit__(None, None, None)
+
+    def __write(self, name: str, content: str) -> str:
+        path = os.path.join(self.work_dir.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_sha256(self) -> None:
+        self.assertEqual(self.sha256, "0163f1eea7894350060624d315234d40c508ab251ba121714e234503045faadd")
+
+    def test_for_dir(self) -> None:
+        with patch.dict(os.environ, {"SIGNATURE_LEDGER_DIR": os.path.join(self.work_dir.name, "ledgers")}):
+            ledger = SignatureLedger.for_dir(os.path.join(self.work_dir.name, "maven"))
+            self.assertEqual(ledger.path, SignatureLedger.for_dir(os.path.join(self.work_dir.name, "maven", "..", "maven")).path)
+            ledger.record(self.artifact, self.sha256, self.signature, "pgp")
+        self.assertTrue(os.path.basename(ledger.path).startswith("maven-"))
+        self.assertEqual(os.listdir(os.path.join(self.work_dir.name, "ledgers")), [os.path.basename(ledger.path)])
+        # nothing is written next to the artifacts
+        self.assertEqual(sorted(os.listdir(os.path.join(self.work_dir.name, "maven"))), ["the-jar.jar", "the-jar.jar.asc"])
+        self.assertTrue(SignatureLedger(ledger.path, ledger.dir).is_signed(self.artifact, self.sha256, self.signature, "pgp"))
+
+    def test_default_dir(self) -> None:
+        with patch.dict(os.environ, {}, clear=True), patch("os.path.expanduser", return_value="home"):
+            self.assertEqual(SignatureLedger.default_dir(), os.path.join("home", ".cache", "opensearch-build", "signatures"))
+
+    def test_is_signed(self) -> None:
+        ledger = SignatureLedger(self.ledger_path)
+        self.assertFalse(ledger.is_signed(self.artifact, self.sha256, self.signature, "pgp"))
+        ledger.record(self.artifact, self.sha256, self.signature, "pgp")
+        self.assertTrue(ledger.is_signed(self.artifact, self.sha256, self.signature, "pgp"))
+        self.assertFalse(ledger.is_signed(self.artifact, self.sha256, self.signature, "windows"))
+        self.assertFalse(ledger.is_signed(self.artifact, "changed", self.signature, "pgp"))
+
+    def test_is_signed_persisted(self) -> None:
+        SignatureLedger(self.ledger_path).record(self.artifact, self.sha256, self.signature, "pgp")
+        self.assertTrue(SignatureLedger(self.ledger_path).is_signed(self.artifact, self.sha256, self.signature, "pgp"))
+
+    def test_is_signed_signature_changed(self) -> None:
+        ledger = SignatureLedger(self.ledger_path)
+        ledger.record(self.artifact, self.sha256, self.signature, "pgp")
+        self.__write("maven/the-jar.jar.asc", "truncated")
+        self.assertFalse(ledger.is_signed(self.artifact, self.sha256, self.signature, "pgp"))
+        os.remove(self.signature)
+        self.assertFalse(ledger.is_signed(self.artifact, self.sha256, self.signature, "pgp"))
+
+    def test_load_ignores_partial_entry(self) -> None:
+        SignatureLedger(self.ledger_path).record(self.artifact, self.sha256, self.signature, "pgp")
+        with open(self.ledger_path, "a") as f:
+            f.write('{"artifact": "maven/other')
+        ledger = SignatureLedger(self.ledger_path)
+        self.assertEqual(list(ledger.entries.keys()), [os.path.join("maven", "the-jar.jar")])
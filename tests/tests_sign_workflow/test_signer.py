@@ -1,4 +1,6 @@
 import os
+import subprocess
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, call, patch
@@ -23,6 +25,20 @@ class TestSigner(unittest.TestCase):
         self.assertEqual(mock_repo.return_value.execute.call_count, 2)
         mock_repo.return_value.execute.assert_has_calls([call("./bootstrap"), call("rm config.cfg")])
 
+    @patch("sign_workflow.signer.GitRepository")
+    @patch("sign_workflow.signer.SignerCache")
+    def test_signer_cached(self, mock_cache: Mock, mock_repo: Mock) -> None:
+        with patch.dict(os.environ, {"SIGNER_CACHE_DIR": "cache"}):
+            signer = self.DummySigner()
+        mock_repo.assert_not_called()
+        mock_cache.assert_called_once_with("cache")
+        self.assertEqual(signer.git_repo, mock_cache.return_value.install.return_value)
+
+        # bootstrapping a fresh installation
+        git_repo = MagicMock()
+        mock_cache.return_value.install.call_args[0][1](git_repo)
+        git_repo.execute.assert_has_calls([call("./bootstrap"), call("rm config.cfg")])
+
     @patch("sign_workflow.signer.GitRepository")
     def test_sign_artifact_not_called(self, mock_repo: Mock) -> None:
         signer = self.DummySigner()
@@ -37,16 +53,78 @@ class TestSigner(unittest.TestCase):
         signer.sign_artifact("the-jar.zip", Path("/path"), ".sig")
         signer.generate_signature_and_verify.assert_called_with("the-jar.zip", Path("/path"), ".sig")
 
+    @patch("os.remove")
     @patch("sign_workflow.signer.GitRepository")
-    def test_remove_existing_signature_found(self, mock_repo: Mock) -> None:
+    def test_remove_existing_signature_found(self, mock_repo: Mock, mock_remove: Mock) -> None:
         signer = self.DummySigner()
-        os.remove = MagicMock()
         signer.__remove_existing_signature__("tests/tests_sign_workflow/data/signature/tar_dummy_artifact_1.0.0.tar.gz.sig")
-        os.remove.assert_called_with("tests/tests_sign_workflow/data/signature/tar_dummy_artifact_1.0.0.tar.gz.sig")
+        mock_remove.assert_called_with("tests/tests_sign_workflow/data/signature/tar_dummy_artifact_1.0.0.tar.gz.sig")
 
+    @patch("os.remove")
     @patch("sign_workflow.signer.GitRepository")
-    def test_remove_existing_signature_not_found(self, mock_repo: Mock) -> None:
+    def test_remove_existing_signature_not_found(self, mock_repo: Mock, mock_remove: Mock) -> None:
         signer = self.DummySigner()
-        os.remove = MagicMock()
         signer.__remove_existing_signature__("tests/tests_sign_workflow/data/signature/not_found.tar.gz.sig")
-        os.remove.assert_not_called()
+        mock_remove.assert_not_called()
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_concurrent(self, mock_repo: Mock) -> None:
+        signer = self.DummySigner(jobs=2)
+        barrier = threading.Barrier(2, timeout=10)
+        # every artifact waits for another one to be signed at the same time
+        signer.generate_signature_and_verify = MagicMock(side_effect=lambda *args: barrier.wait())  # type: ignore
+        signer.sign_artifacts(["a.zip", "b.zip", "c.jar", "d.zip", "e.zip"], Path("/path"), ".sig")
+        self.assertEqual(signer.generate_signature_and_verify.call_count, 4)
+        self.assertEqual(sorted(signer.timings.keys()), [os.path.join(Path("/path"), name) for name in ["a.zip", "b.zip", "d.zip", "e.zip"]])
+
+    @patch("sign_workflow.signer.GitRepository")
+    @patch.object(Signer, "RETRY_DELAY", 0)
+    def test_sign_artifacts_retry(self, mock_repo: Mock) -> None:
+        signer = self.DummySigner()
+        signer.generate_signature_and_verify = MagicMock(side_effect=[subprocess.CalledProcessError(1, "./opensearch-signer-client"), None])  # type: ignore
+        with patch("os.path.isfile", return_value=True):
+            signer.sign_artifacts(["the-jar.zip"], Path("/path"), ".sig")
+        self.assertEqual(signer.generate_signature_and_verify.call_count, 2)
+
+    @patch("sign_workflow.signer.GitRepository")
+    @patch.object(Signer, "RETRY_DELAY", 0)
+    def test_sign_artifacts_no_retry(self, mock_repo: Mock) -> None:
+        signer = self.DummySigner()
+        for error in [Signer.VerificationError("/path/the-jar.zip.sig"), ValueError("invalid")]:
+            signer.generate_signature_and_verify = MagicMock(side_effect=error)  # type: ignore
+            with self.assertRaises(type(error)):
+                signer.sign_artifacts(["the-jar.zip"], Path("/path"), ".sig")
+            signer.generate_signature_and_verify.assert_called_once()
+
+    @patch("sign_workflow.signer.GitRepository")
+    @patch.object(Signer, "RETRY_DELAY", 0)
+    def test_sign_artifacts_missing(self, mock_repo: Mock) -> None:
+        signer = self.DummySigner()
+        signer.generate_signature_and_verify = MagicMock(side_effect=subprocess.CalledProcessError(1, "./opensearch-signer-client"))  # type: ignore
+        with self.assertRaises(FileNotFoundError) as ctx:
+            signer.sign_artifacts(["the-jar.zip"], Path("/path"), ".sig")
+        self.assertEqual(str(ctx.exception), f"Artifact {os.path.join('/path', 'the-jar.zip')} does not exist.")
+        signer.generate_signature_and_verify.assert_called_once()
+
+    @patch("sign_workflow.signer.GitRepository")
+    @patch.object(Signer, "RETRY_DELAY", 0)
+    def test_sign_artifacts_error(self, mock_repo: Mock) -> None:
+        signer = self.DummySigner(jobs=2)
+        signer.generate_signature_and_verify = MagicMock(side_effect=Exception("signer unavailable"))  # type: ignore
+        with self.assertRaises(Exception) as ctx:
+            signer.sign_artifacts(["a.zip", "b.zip"], Path("/path"), ".sig")
+        self.assertEqual(str(ctx.exception), "signer unavailable")
+        self.assertEqual(signer.timings, {})
+
+    @patch("sign_workflow.signer.GitRepository")
+    @patch("logging.info")
+    def test_log_summary(self, mock_logging_info: Mock, mock_repo: Mock) -> None:
+        signer = self.DummySigner()
+        signer.timings = {"a.zip": 1.0, "b.zip": 3.0, "c.zip": 2.0}
+        signer.log_summary()
+        mock_logging_info.assert_has_calls([
+            call("Signed 3 artifact(s) in 6.0s of signer time, p50 2.0s, p95 3.0s, max 3.0s"),
+            call("Signed b.zip in 3.0s"),
+            call("Signed c.zip in 2.0s"),
+            call("Signed a.zip in 1.0s"),
+        ])
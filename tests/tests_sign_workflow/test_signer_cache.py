@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import subprocess
+import time
+import unittest
+from typing import List
+from unittest.mock import Mock, patch
+
+from git.git_repository import GitRepository
+from sign_workflow.signer_cache import SignerCache, SignerInstallation
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestSignerCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.origin = os.path.join(self.temp_dir.name, "origin")
+        self.url = f"file://{self.origin}"
+        self.cache = SignerCache(os.path.join(self.temp_dir.name, "cache"))
+        os.makedirs(os.path.join(self.origin, "src"))
+        self.git("init -b main")
+        self.sha = self.commit("1")
+        self.bootstrapped: List[str] = []
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def git(self, args: str) -> str:
+        return subprocess.check_output(
+            f"git -c user.name=test -c user.email=test@example.com {args}",
+            cwd=self.origin,
+            shell=True,
+        ).decode().strip()
+
+    def commit(self, version: str) -> str:
+        with open(os.path.join(self.origin, "src", "version"), "w") as f:
+            f.write(version)
+        self.git("add src/version")
+        self.git(f"commit -m {version}")
+        return self.git("rev-parse HEAD")
+
+    def bootstrap(self, git_repo: GitRepository) -> None:
+        self.bootstrapped.append(git_repo.sha)
+        git_repo.execute("touch bootstrapped")
+
+    def test_install(self) -> None:
+        installation = self.cache.install(self.url, self.bootstrap)
+        self.assertEqual(installation.sha, self.sha)
+        self.assertTrue(os.path.isfile(os.path.join(installation.working_directory, "bootstrapped")))
+        self.assertEqual(self.cache.install(self.url, self.bootstrap).dir, installation.dir)
+        self.assertEqual(self.bootstrapped, [self.sha])
+
+    def test_install_new_version(self) -> None:
+        self.cache.install(self.url, self.bootstrap)
+        sha = self.commit("2")
+        installation = self.cache.install(self.url, self.bootstrap)
+        self.assertEqual(installation.sha, sha)
+        self.assertEqual(self.bootstrapped, [self.sha, sha])
+
+    def test_install_failed_bootstrap(self) -> None:
+        def bootstrap(git_repo: GitRepository) -> None:
+            raise subprocess.CalledProcessError(1, "./bootstrap")
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.cache.install(self.url, bootstrap)
+        installation = self.cache.install(self.url, self.bootstrap)
+        self.assertEqual(self.bootstrapped, [self.sha])
+        self.assertTrue(os.path.isfile(os.path.join(installation.working_directory, "bootstrapped")))
+
+    def test_install_evicts_old_versions(self) -> None:
+        old = self.cache.install(self.url, self.bootstrap)
+        two_weeks_ago = time.time() - SignerCache.MAX_AGE - 60
+        os.utime(os.path.join(old.dir, SignerCache.MARKER), (two_weeks_ago, two_weeks_ago))
+        # the version in use is kept, however old
+        self.assertEqual(self.cache.install(self.url, self.bootstrap).dir, old.dir)
+        self.assertTrue(os.path.isdir(old.dir))
+
+        os.utime(os.path.join(old.dir, SignerCache.MARKER), (two_weeks_ago, two_weeks_ago))
+        self.commit("2")
+        installation = self.cache.install(self.url, self.bootstrap)
+        self.assertFalse(os.path.exists(old.dir))
+        self.assertTrue(os.path.isdir(installation.dir))
+
+    def test_install_evicts_least_recently_used(self) -> None:
+        cache = SignerCache(self.cache.path, max_size=1)
+        first = cache.install(self.url, self.bootstrap)
+        self.commit("2")
+        second = cache.install(self.url, self.bootstrap)
+        self.assertFalse(os.path.exists(first.dir))
+        self.assertTrue(os.path.isdir(second.dir))
+
+    def test_evict_keeps_incomplete_installations(self) -> None:
+        incomplete = os.path.join(self.cache.path, "incomplete")
+        os.makedirs(incomplete)
+        SignerCache(self.cache.path, max_size=0, max_age=0).evict()
+        self.assertTrue(os.path.isdir(incomplete))
+
+
+class TestSignerInstallation(unittest.TestCase):
+    @patch("system.subprocess_runner.check_call")
+    def test_execute(self, mock_check_call: Mock) -> None:
+        installation = SignerInstallation("signer", "sha")
+        installation.execute("./opensearch-signer-client -h")
+        mock_check_call.assert_called_once_with("./opensearch-signer-client -h", cwd=os.path.join("signer", "src"), shell=True)
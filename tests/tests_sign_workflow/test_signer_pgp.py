@@ -1,9 +1,13 @@
 import os
+import subprocess
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, call, patch
 
+from sign_workflow.signature_ledger import SignatureLedger
+from sign_workflow.signer import Signer
 from sign_workflow.signer_pgp import SignerPGP
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestSignerPGP(unittest.TestCase):
@@ -81,6 +85,14 @@ class TestSignerPGP(unittest.TestCase):
         signer.verify("/path/the-jar.jar.asc")
         mock_repo.assert_has_calls([call().execute("gpg --verify-files /path/the-jar.jar.asc")])
 
+    @patch("sign_workflow.signer.GitRepository")
+    def test_signer_verify_fails(self, mock_repo: Mock) -> None:
+        signer = SignerPGP()
+        mock_repo.return_value.execute.side_effect = subprocess.CalledProcessError(2, "gpg")
+        with self.assertRaises(Signer.VerificationError) as ctx:
+            signer.verify("/path/the-jar.jar.sig")
+        self.assertEqual(str(ctx.exception), "Signature /path/the-jar.jar.sig could not be verified.")
+
     @patch("sign_workflow.signer.GitRepository")
     def test_signer_verify_sig(self, mock_repo: Mock) -> None:
         signer = SignerPGP()
@@ -102,3 +114,48 @@ class TestSignerPGP(unittest.TestCase):
         command = "./opensearch-signer-client -i " + os.path.join(Path("/path/"), 'the-jar.jar') + " -o " + os.path.join(Path("/path/"), 'the-jar.jar.sig') + " -p pgp"
         mock_repo.assert_has_calls(
             [call().execute(command)])
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_with_stub_signer(self, mock_repo: Mock) -> None:
+        signer = SignerPGP(jobs=4)
+        stub_path = os.path.join(os.path.dirname(__file__), "data", "signer")
+        mock_repo.return_value.execute.side_effect = lambda command: subprocess.check_call(command, cwd=stub_path, shell=True)
+        signer.verify = MagicMock()  # type: ignore
+        artifacts = [f"artifact-{i}.jar" for i in range(8)]
+        with TemporaryDirectory() as work_dir:
+            for artifact in artifacts:
+                with open(os.path.join(work_dir.name, artifact), "w") as f:
+                    f.write(artifact)
+            signer.sign_artifacts(artifacts, Path(work_dir.name), ".asc")
+            for artifact in artifacts:
+                with open(os.path.join(work_dir.name, artifact + ".asc")) as f:
+                    self.assertEqual(f.read(), f"pgp signature of {artifact}\n")
+            self.assertEqual(signer.verify.call_count, 8)
+            self.assertEqual(len(signer.timings), 8)
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_incremental(self, mock_repo: Mock) -> None:
+        stub_path = os.path.join(os.path.dirname(__file__), "data", "signer")
+        # signers are created for each run, their bootstrap is not run by the stub
+        mock_repo.return_value.execute.side_effect = lambda command: None if command in ["./bootstrap", "rm config.cfg"] else subprocess.check_call(command, cwd=stub_path, shell=True)
+        with TemporaryDirectory() as work_dir:
+            for artifact in ["a.jar", "b.jar"]:
+                with open(os.path.join(work_dir.name, artifact), "w") as f:
+                    f.write(artifact)
+            signer = SignerPGP(ledger=SignatureLedger(os.path.join(work_dir.name, "signatures.jsonl")))
+            signer.verify = MagicMock()  # type: ignore
+            signer.sign_artifacts(["a.jar", "b.jar"], Path(work_dir.name), ".asc")
+            self.assertEqual(signer.verify.call_count, 2)
+
+            # a new run only signs the artifact that changed
+            with open(os.path.join(work_dir.name, "b.jar"), "w") as f:
+                f.write("changed")
+            signer = SignerPGP(ledger=SignatureLedger(os.path.join(work_dir.name, "signatures.jsonl")))
+            signer.verify = MagicMock()  # type: ignore
+            signer.sign_artifacts(["a.jar", "b.jar"], Path(work_dir.name), ".asc")
+            signer.verify.assert_called_once_with(os.path.join(work_dir.name, "b.jar.asc"))
+
+            signer = SignerPGP(ledger=SignatureLedger(os.path.join(work_dir.name, "signatures.jsonl")), force=True)
+            signer.verify = MagicMock()  # type: ignore
+            signer.sign_artifacts(["a.jar", "b.jar"], Path(work_dir.name), ".asc")
+            self.assertEqual(signer.verify.call_count, 2)
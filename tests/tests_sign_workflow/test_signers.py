@@ -7,6 +7,7 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from sign_workflow.signature_ledger import SignatureLedger
 from sign_workflow.signer_pgp import SignerPGP
 from sign_workflow.signer_windows import SignerWindows
 from sign_workflow.signers import Signers
@@ -24,6 +25,13 @@ class TestSigners(unittest.TestCase):
         signer = Signers.create("windows")
         self.assertIs(type(signer), SignerWindows)
 
+    @patch("sign_workflow.signer.GitRepository")
+    def test_signer_ledger(self, mock_repo: Mock) -> None:
+        ledger = SignatureLedger("signatures.jsonl")
+        signer = Signers.create("linux", 4, ledger, True)
+        self.assertEqual((signer.jobs, signer.ledger, signer.force), (4, ledger, True))
+        self.assertEqual((Signers.create("linux").ledger, Signers.create("linux").force), (None, False))
+
     def test_signer_invalid(self) -> None:
         with self.assertRaises(ValueError) as ctx:
             Signers.create("mac")
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import time
+import unittest
+
+from system.cache_directory import CacheDirectory
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestCacheDirectory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.path = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def __entry(self, name: str, size: int, age: int = 0) -> str:
+        path = os.path.join(self.path, name)
+        os.makedirs(path)
+        with open(os.path.join(path, "file"), "wb") as f:
+            f.write(b"x" * size)
+        os.utime(path, (time.time() - age, time.time() - age))
+        return path
+
+    def test_size(self) -> None:
+        path = self.__entry("entry", 100)
+        os.symlink(os.path.join(path, "file"), os.path.join(path, "link"))
+        self.assertEqual(CacheDirectory.size(path), 100)
+
+    def test_entries(self) -> None:
+        new = self.__entry("new", 10)
+        old = self.__entry("old", 20, 60)
+        self.__entry(".temp", 30)
+        self.assertEqual([(size, path) for _, size, path in CacheDirectory(self.path, 0, 0).entries()], [(20, old), (10, new)])
+        self.assertEqual(CacheDirectory(os.path.join(self.path, "missing"), 0, 0).entries(), [])
+
+    def test_evict_by_size(self) -> None:
+        self.__entry("oldest", 100, 120)
+        self.__entry("old", 100, 60)
+        self.__entry("new", 100)
+        CacheDirectory(self.path, 250, 3600).evict()
+        self.assertEqual(sorted(os.listdir(self.path)), ["new", "old"])
+
+    def test_evict_by_age(self) -> None:
+        self.__entry("old", 1, 7200)
+        self.__entry("new", 1)
+        CacheDirectory(self.path, 100, 3600).evict()
+        self.assertEqual(os.listdir(self.path), ["new"])
+
+    def test_evict_keep(self) -> None:
+        self.__entry("old", 100, 60)
+        new = self.__entry("new", 200)
+        # an entry larger than the cache is kept when it was just added
+        CacheDirectory(self.path, 150, 3600).evict(keep=new)
+        self.assertEqual(os.listdir(self.path), ["new"])
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import unittest
+from unittest.mock import patch
+
+from system.default_instance import DefaultInstance
+
+
+class Counter(DefaultInstance):
+    def __init__(self, start: int = 0) -> None:
+        self.start = start
+
+
+class Other(DefaultInstance):
+    @classmethod
+    def __create_default__(cls) -> 'Other':
+        # may use the default instance of another class
+        Counter.default()
+        return cls()
+
+
+@patch.dict(DefaultInstance.__instances__, clear=True)
+class TestDefaultInstance(unittest.TestCase):
+    def test_default(self) -> None:
+        self.assertIs(Counter.default(), Counter.default())
+        self.assertEqual(Counter.default().start, 0)
+
+    def test_default_per_class(self) -> None:
+        self.assertIsInstance(Other.default(), Other)
+        self.assertIsInstance(Counter.default(), Counter)
+        self.assertIsNot(Other.default(), Counter.default())
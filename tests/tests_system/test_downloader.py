@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import functools
+import hashlib
+import http.server
+import os
+import threading
+import unittest
+from typing import Any, Dict, List, Optional, Set, Tuple
+from unittest.mock import patch
+
+import requests
+
+from system.downloader import Downloader
+from system.temporary_directory import TemporaryDirectory
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Serves files from a directory, with support for range requests and ETags.
+    Paths in `truncate` are closed half way through the first time they are requested.
+    Paths in `failures` fail with a server error the given number of times.
+    """
+
+    requests: List[Tuple[str, Optional[str]]] = []
+    truncate: Set[str] = set()
+    failures: Dict[str, int] = {}
+
+    def do_GET(self) -> None:
+        self.requests.append((self.path, self.headers.get("Range")))
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.send_error(503)
+            return
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        etag = f'"{hashlib.sha256(data).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        range = self.headers.get("Range")
+        start = int(range.split("=")[1].split("-")[0]) if range else 0
+        if start >= len(data) and range:
+            self.send_error(416)
+            return
+        body = data[start:]
+        self.send_response(206 if range else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        if self.path in self.truncate:
+            self.truncate.remove(self.path)
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@patch.object(Downloader, "RETRY_DELAY", 0)
+@patch.object(Downloader, "RETRY_JITTER", 0)
+class TestDownloader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = TemporaryDirectory()
+        self.work_dir = TemporaryDirectory()
+        RangeRequestHandler.requests = []
+        RangeRequestHandler.truncate = set()
+        RangeRequestHandler.failures = {}
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(RangeRequestHandler, directory=self.root.name))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.root.__exit__(None, None, None)
+        self.work_dir.__exit__(None, None, None)
+
+    def __publish(self, name: str, data: bytes, checksum: bool = True) -> None:
+        with open(os.path.join(self.root.name, name), "wb") as f:
+            f.write(data)
+        if checksum:
+            with open(os.path.join(self.root.name, f"{name}.sha512"), "w") as f:
+                f.write(f"{hashlib.sha512(data).hexdigest()}  {name}\n")
+
+    def __read(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def __dest(self, name: str) -> str:
+        return os.path.join(self.work_dir.name, "dest", name)
+
+    def test_download_all(self) -> None:
+        self.__publish("a.zip", b"a" * 1000)
+        self.__publish("b.zip", b"b" * 1000, checksum=False)
+        Downloader(jobs=2).download_all([(f"{self.url}/a.zip", self.__dest("a.zip")), (f"{self.url}/b.zip", self.__dest("b.zip"))])
+        self.assertEqual(self.__read(self.__dest("a.zip")), b"a" * 1000)
+        self.assertEqual(self.__read(self.__dest("b.zip")), b"b" * 1000)
+        self.assertFalse(os.path.exists(f"{self.__dest('a.zip')}.part"))
+
+    def test_download_all_with_checksums(self) -> None:
+        self.__publish("a.zip", b"a" * 1000)
+        self.__publish("b.zip", b"b" * 1000)
+        downloads = [
+            (f"{self.url}/a.zip", self.__dest("a.zip")),
+            (f"{self.url}/a.zip.sha512", self.__dest("a.zip.sha512")),
+            (f"{self.url}/b.zip.sha512", self.__dest("b.zip.sha512")),
+        ]
+        Downloader(jobs=2).download_all(downloads)
+        self.assertEqual(self.__read(self.__dest("a.zip")), b"a" * 1000)
+        self.assertEqual(self.__read(self.__dest("a.zip.sha512")), self.__read(os.path.join(self.root.name, "a.zip.sha512")))
+        self.assertTrue(os.path.isfile(self.__dest("b.zip.sha512")))
+        # the checksum in the batch is fetched once, and used to verify the file
+        self.assertEqual(sorted(request[0] for request in RangeRequestHandler.requests), ["/a.zip", "/a.zip.sha512", "/b.zip.sha512"])
+
+    def test_download_all_with_checksum_mismatch(self) -> None:
+        self.__publish("a.zip", b"a" * 1000)
+        self.__publish("a.zip", b"b" * 1000, checksum=False)
+        with self.assertRaises(Downloader.ChecksumError):
+            Downloader().download_all([(f"{self.url}/a.zip.sha512", self.__dest("a.zip.sha512")), (f"{self.url}/a.zip", self.__dest("a.zip"))])
+        self.assertFalse(os.path.exists(self.__dest("a.zip")))
+
+    def test_default(self) -> None:
+        self.assertIs(Downloader.default(), Downloader.default())
+
+    def test_download_missing(self) -> None:
+        with self.assertRaises(requests.HTTPError):
+            Downloader().download_all([(f"{self.url}/missing.zip", self.__dest("missing.zip"))])
+        self.assertFalse(os.path.exists(self.__dest("missing.zip")))
+        # client errors are not retried
+        self.assertEqual(RangeRequestHandler.requests, [("/missing.zip.sha512", None), ("/missing.zip", None)])
+
+    def test_download_retry(self) -> None:
+        self.__publish("a.zip", b"a" * 1000)
+        RangeRequestHandler.failures = {"/a.zip.sha512": 1, "/a.zip": 2}
+        Downloader().download(f"{self.url}/a.zip", self.__dest("a.zip"))
+        self.assertEqual(self.__read(self.__dest("a.zip")), b"a" * 1000)
+        self.assertEqual(len(RangeRequestHandler.requests), 5)
+
+    def test_download_retry_failure(self) -> None:
+        self.__publish("a.zip", b"a" * 1000)
+        RangeRequestHandler.failures = {"/a.zip": Downloader.TRIES}
+        with self.assertRaises(Downloader.ServerError):
+            Downloader().download(f"{self.url}/a.zip", self.__dest("a.zip"))
+
+    def test_download_checksum_not_published(self) -> None:
+        self.__publish("a.zip.sha1", b"checksum", checksum=False)
+        Downloader().download(f"{self.url}/a.zip.sha1", self.__dest("a.zip.sha1"))
+        self.assertEqual(RangeRequestHandler.requests, [("/a.zip.sha1", None)])
+
+    def test_download_checksum_mismatch(self) -> None:
+        self.__publish("a.zip", b"a" * 1000)
+        self.__publish("a.zip", b"b" * 1000, checksum=False)
+        with self.assertRaises(Downloader.ChecksumError):
+            Downloader().download(f"{self.url}/a.zip", self.__dest("a.zip"))
+        self.assertFalse(os.path.exists(self.__dest("a.zip")))
+        self.assertFalse(os.path.exists(f"{self.__dest('a.zip')}.part"))
+
+    @patch.object(Downloader, "CHUNK_SIZE", 1024)
+    def test_download_resume(self) -> None:
+        self.__publish("a.zip", bytes(range(256)) * 100)
+        RangeRequestHandler.truncate = {"/a.zip"}
+        Downloader().download(f"{self.url}/a.zip", self.__dest("a.zip"))
+        self.assertEqual(self.__read(self.__dest("a.zip")), bytes(range(256)) * 100)
+        # at most the chunk being read when the connection broke is downloaded again
+        self.assertIn(("/a.zip", "bytes=12288-"), RangeRequestHandler.requests)
+
+    def test_download_resume_part(self) -> None:
+        self.__publish("a.zip", b"a" * 1000)
+        os.makedirs(os.path.dirname(self.__dest("a.zip")))
+        with open(f"{self.__dest('a.zip')}.part", "wb") as f:
+            f.write(b"a" * 600)
+        Downloader().download(f"{self.url}/a.zip", self.__dest("a.zip"))
+        self.assertEqual(self.__read(self.__dest("a.zip")), b"a" * 1000)
+        self.assertIn(("/a.zip", "bytes=600-"), RangeRequestHandler.requests)
+
+    def test_download_cache(self) -> None:
+        cache_dir = os.path.join(self.work_dir.name, "cache")
+        self.__publish("a.zip", b"a" * 1000)
+        Downloader(cache_dir=cache_dir).download(f"{self.url}/a.zip", self.__dest("first.zip"))
+        Downloader(cache_dir=cache_dir).download(f"{self.url}/a.zip", self.__dest("second.zip"))
+        self.assertEqual(self.__read(self.__dest("second.zip")), b"a" * 1000)
+        self.assertEqual([request for request in RangeRequestHandler.requests if request[0] == "/a.zip"], [("/a.zip", None)])
+
+        # a changed file is downloaded again
+        self.__publish("a.zip", b"b" * 1000)
+        Downloader(cache_dir=cache_dir).download(f"{self.url}/a.zip", self.__dest("third.zip"))
+        self.assertEqual(self.__read(self.__dest("third.zip")), b"b" * 1000)
+        self.assertEqual(self.__read(self.__dest("first.zip")), b"a" * 1000)
+
+    def test_download_cache_revalidate(self) -> None:
+        cache_dir = os.path.join(self.work_dir.name, "cache")
+        self.__publish("a.zip", b"a" * 1000, checksum=False)
+        downloader = Downloader(cache_dir=cache_dir)
+        downloader.download(f"{self.url}/a.zip", self.__dest("first.zip"))
+        downloader.download(f"{self.url}/a.zip", self.__dest("second.zip"))
+        self.assertEqual(self.__read(self.__dest("second.zip")), b"a" * 1000)
+        self.assertEqual((downloader.files_downloaded, downloader.files_cached, downloader.bytes_downloaded), (1, 1, 1000))
+
+        # a changed file is downloaded again
+        self.__publish("a.zip", b"b" * 1000, checksum=False)
+        downloader.download(f"{self.url}/a.zip", self.__dest("third.zip"))
+        self.assertEqual(self.__read(self.__dest("third.zip")), b"b" * 1000)
+        self.assertEqual((downloader.files_downloaded, downloader.files_cached, downloader.bytes_downloaded), (2, 1, 2000))
+        self.assertRegex(downloader.summary, r"^Downloaded 2 file\(s\) \(0.0 MB\) and used 1 file\(s\) from cache in [\d.]+s \([\d.]+ MB/s, [\d.]+ files/s\)$")
+
+    def test_summary(self) -> None:
+        self.assertEqual(Downloader().summary, "Downloaded 0 file(s) (0.0 MB) and used 0 file(s) from cache in 0.0s (0.0 MB/s, 0.0 files/s)")
+
+    @patch.dict(os.environ, {"DOWNLOAD_CACHE_DIR": "cache"})
+    def test_cache_dir(self) -> None:
+        self.assertEqual(Downloader().cache_dir, "cache")
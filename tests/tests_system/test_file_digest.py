@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import os
+import unittest
+from unittest.mock import patch
+
+from system.file_digest import file_digest
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestFileDigest(unittest.TestCase):
+    def test_file_digest(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "file.zip")
+            with open(path, "wb") as f:
+                f.write(b"0123456789" * 10)
+            with patch("system.file_digest.CHUNK_SIZE", 16):
+                self.assertEqual(file_digest(path), hashlib.sha512(b"0123456789" * 10).hexdigest())
+                self.assertEqual(file_digest(path, "sha256"), hashlib.sha256(b"0123456789" * 10).hexdigest())
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import os
+import time
+import unittest
+from typing import List
+
+from system.file_lock import FileLock
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestFileLock(unittest.TestCase):
+    def test_lock(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "subdir", "file.lock")
+            with FileLock(path) as lock:
+                self.assertIsNotNone(lock.file)
+                self.assertTrue(os.path.isfile(path))
+            self.assertIsNone(lock.file)
+            self.assertTrue(os.path.isfile(path))
+
+    def test_lock_exclusive(self) -> None:
+        events: List[str] = []
+
+        def locked(index: int) -> None:
+            with FileLock(os.path.join(work_dir.name, "file.lock")):
+                events.append("enter")
+                time.sleep(0.01)
+                events.append("exit")
+
+        with TemporaryDirectory() as work_dir:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(locked, range(4)))
+
+        self.assertEqual(events, ["enter", "exit"] * 4)
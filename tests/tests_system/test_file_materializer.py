@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from system.file_materializer import FileMaterializer
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestFileMaterializer(unittest.TestCase):
+    def setUp(self) -> None:
+        FileMaterializer.__unsupported__.clear()
+
+    def __write(self, path: str, data: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def __read(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_materialize(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            dest = os.path.join(work_dir.name, "dest.jar")
+            self.__write(source, b"contents")
+            materializer = FileMaterializer()
+            strategy = materializer.materialize(source, dest)
+            self.assertIn(strategy, [FileMaterializer.REFLINK, FileMaterializer.HARDLINK])
+            self.assertEqual(self.__read(dest), b"contents")
+            self.assertEqual(materializer.bytes_linked, 8)
+            self.assertEqual(materializer.bytes_copied, 0)
+
+    def test_materialize_no_link(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            dest = os.path.join(work_dir.name, "dest.jar")
+            self.__write(source, b"contents")
+            strategy = FileMaterializer(link=False).materialize(source, dest)
+            self.assertNotEqual(strategy, FileMaterializer.HARDLINK)
+            self.assertFalse(os.path.samefile(source, dest))
+            self.assertEqual(self.__read(dest), b"contents")
+
+    def test_materialize_link_disabled(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            dest = os.path.join(work_dir.name, "dest.jar")
+            self.__write(source, b"contents")
+            strategy = FileMaterializer().materialize(source, dest, link=False)
+            self.assertNotEqual(strategy, FileMaterializer.HARDLINK)
+            self.assertFalse(os.path.samefile(source, dest))
+
+    def test_materialize_replaces_link(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            previous = os.path.join(work_dir.name, "previous.jar")
+            dest = os.path.join(work_dir.name, "dest.jar")
+            self.__write(source, b"new")
+            self.__write(previous, b"previous")
+            os.link(previous, dest)
+            FileMaterializer(link=False).materialize(source, dest)
+            self.assertEqual(self.__read(dest), b"new")
+            self.assertEqual(self.__read(previous), b"previous")
+
+    @patch("os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link"))
+    @patch("fcntl.ioctl", side_effect=OSError(errno.EOPNOTSUPP, "Operation not supported"))
+    def test_materialize_unsupported(self, mock_ioctl: Mock, mock_link: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            self.__write(source, b"contents")
+            materializer = FileMaterializer()
+            for i in range(3):
+                strategy = materializer.materialize(source, os.path.join(work_dir.name, f"dest-{i}.jar"))
+                self.assertIn(strategy, [FileMaterializer.COPY_FILE_RANGE, FileMaterializer.COPY])
+                self.assertEqual(self.__read(os.path.join(work_dir.name, f"dest-{i}.jar")), b"contents")
+            mock_ioctl.assert_called_once()
+            mock_link.assert_called_once()
+            self.assertEqual(materializer.bytes_linked, 0)
+            self.assertEqual(materializer.bytes_copied, 24)
+
+    @patch("os.link", side_effect=OSError(errno.EPERM, "Operation not permitted"))
+    @patch("fcntl.ioctl", side_effect=OSError(errno.EBADF, "Bad file descriptor"))
+    def test_materialize_fallback(self, mock_ioctl: Mock, mock_link: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            self.__write(source, b"contents")
+            materializer = FileMaterializer()
+            for i in range(3):
+                strategy = materializer.materialize(source, os.path.join(work_dir.name, f"dest-{i}.jar"))
+                self.assertIn(strategy, [FileMaterializer.COPY_FILE_RANGE, FileMaterializer.COPY])
+            # errors with one file are not cached for the filesystems
+            self.assertEqual(mock_ioctl.call_count, 3)
+            self.assertEqual(mock_link.call_count, 3)
+            self.assertEqual(FileMaterializer.__unsupported__, set())
+
+    @patch("os.link", side_effect=OSError(errno.ENOSPC, "No space left on device"))
+    @patch("fcntl.ioctl", side_effect=OSError(errno.EOPNOTSUPP, "Operation not supported"))
+    def test_materialize_error(self, *mocks: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            dest = os.path.join(work_dir.name, "dest.jar")
+            self.__write(source, b"contents")
+            with self.assertRaises(OSError) as ctx:
+                FileMaterializer().materialize(source, dest)
+            self.assertEqual(ctx.exception.errno, errno.ENOSPC)
+            self.assertFalse(os.path.lexists(dest))
+
+    def test_summary(self) -> None:
+        materializer = FileMaterializer()
+        self.assertEqual(materializer.summary, "Materialized 0 file(s) (none), 0 byte(s) linked, 0 byte(s) copied")
+        with TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir.name, "source.jar")
+            self.__write(source, b"contents")
+            materializer.strategies = [FileMaterializer.COPY]
+            materializer.materialize(source, os.path.join(work_dir.name, "dest.jar"))
+        self.assertEqual(materializer.summary, "Materialized 1 file(s) (1 by copy), 0 byte(s) linked, 8 byte(s) copied")
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import gzip
+import os
+import unittest
+
+from system.parallel_gzip import ParallelGzipFile
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestParallelGzipFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = b"".join(f"line {i}\n".encode() for i in range(10000))
+
+    def __write(self, path: str, chunk_size: int, workers: int) -> bytes:
+        with ParallelGzipFile(path, workers=workers, block_size=1000) as gz:
+            for i in range(0, len(self.data), chunk_size):
+                gz.write(self.data[i:i + chunk_size])
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_write(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "data.gz")
+            self.__write(path, 333, 4)
+            with gzip.open(path, "rb") as f:
+                self.assertEqual(f.read(), self.data)
+
+    def test_write_byte_stable(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            first = self.__write(os.path.join(work_dir.name, "first.gz"), 333, 4)
+            second = self.__write(os.path.join(work_dir.name, "second.gz"), 4096, 2)
+            self.assertEqual(first, second)
+
+    def test_write_empty(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "empty.gz")
+            ParallelGzipFile(path).close()
+            with gzip.open(path, "rb") as f:
+                self.assertEqual(f.read(), b"")
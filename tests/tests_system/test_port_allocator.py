@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import socket
+import unittest
+from unittest.mock import patch
+
+from system.port_allocator import PortAllocator
+
+
+class TestPortAllocator(unittest.TestCase):
+    def test_free_port(self) -> None:
+        port = PortAllocator.free_port()
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", port))
+
+    def test_allocate(self) -> None:
+        allocator = PortAllocator()
+        ports = allocator.allocate(2)
+        self.assertEqual(len(ports), 2)
+        self.assertEqual(len(set(ports)), 2)
+        self.assertEqual(allocator.reserved, set(ports))
+
+    @patch.object(PortAllocator, "free_port", side_effect=[9200, 9200, 9300, 9200, 9300, 9400])
+    def test_allocate_reserved(self, *args: object) -> None:
+        allocator = PortAllocator()
+        self.assertEqual(allocator.allocate(2), [9200, 9300])
+        # reserved ports are not handed out again until they are released
+        self.assertEqual(allocator.allocate(1), [9400])
+        allocator.release([9200, 9300])
+        self.assertEqual(allocator.reserved, {9400})
+
+    def test_in_use(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            s.listen()
+            port = s.getsockname()[1]
+            free_port = PortAllocator.free_port()
+            self.assertEqual(PortAllocator.in_use([port, free_port]), [port])
+
+    @patch.object(PortAllocator, "in_use", return_value=[9200])
+    def test_retry(self, *args: object) -> None:
+        self.assertTrue(PortAllocator.retry([9200, 9300], 1))
+        self.assertFalse(PortAllocator.retry([9200, 9300], PortAllocator.TRIES))
+
+    @patch.object(PortAllocator, "in_use", return_value=[])
+    def test_retry_not_in_use(self, *args: object) -> None:
+        self.assertFalse(PortAllocator.retry([9200, 9300], 1))
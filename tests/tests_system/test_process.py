@@ -4,8 +4,10 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import os
 import tempfile
 import unittest
+from typing import List
 from unittest.mock import MagicMock, call, patch
 
 from system.process import Process, ProcessNotStartedError, ProcessStartedError
@@ -20,6 +22,7 @@ class TestProcess(unittest.TestCase):
 
         self.assertTrue(process_handler.started)
         self.assertIsNotNone(process_handler.pid)
+        self.assertIsNotNone(process_handler.start_time)
         self.assertIsNotNone(process_handler.stdout_data)
         self.assertIsNotNone(process_handler.stderr_data)
 
@@ -36,7 +39,30 @@ class TestProcess(unittest.TestCase):
     def test_file_open_mode(self, mock_tempfile: MagicMock) -> None:
         process_handler = Process()
         process_handler.start("./tests/tests_system/data/wait_for_input.sh", ".")
-        mock_tempfile.assert_has_calls([call(mode="r+"), call(mode="r+")])
+        mock_tempfile.assert_has_calls([call(mode="wb+"), call(mode="wb+")])
+
+    def test_output(self) -> None:
+        process_handler = Process()
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+        process_handler.on_stdout(stdout_lines.append)
+        process_handler.on_stderr(stderr_lines.append)
+
+        process_handler.start("echo hello && echo world 1>&2", ".")
+        process_handler.stdout.join()
+        process_handler.stderr.join()
+        process_handler.terminate()
+
+        self.assertEqual(stdout_lines, ["hello"])
+        self.assertEqual(stderr_lines, ["world"])
+        self.assertEqual(process_handler.stdout_data, "hello\n")
+        self.assertEqual(process_handler.stderr_data, "world\n")
+        with open(process_handler.stdout_path, "r") as f:
+            self.assertEqual(f.read(), "hello\n")
+
+        stdout_path = process_handler.stdout_path
+        process_handler.close()
+        self.assertFalse(os.path.exists(stdout_path))
 
     def test_start_twice(self) -> None:
         process_handler = Process()
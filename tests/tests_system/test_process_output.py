@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import io
+import os
+import unittest
+from typing import List
+
+from system.process_output import ProcessOutput
+
+
+class TestProcessOutput(unittest.TestCase):
+    def test_output(self) -> None:
+        lines: List[str] = []
+        output = ProcessOutput([lines.append], lines=2)
+        output.start(io.BytesIO(b"one\ntwo\r\nthree\nfour"))
+        output.join()
+
+        # only the most recent lines are kept in memory
+        self.assertEqual(output.data, "three\nfour\n")
+        self.assertEqual(lines, ["one", "two", "three", "four"])
+        with open(output.path, "rb") as f:
+            self.assertEqual(f.read(), b"one\ntwo\r\nthree\nfour")
+
+        output.close()
+        self.assertFalse(os.path.exists(output.path))
+
+    def test_callback_error(self) -> None:
+        lines: List[str] = []
+
+        def callback(line: str) -> None:
+            if line == "one":
+                raise ValueError(line)
+            lines.append(line)
+
+        output = ProcessOutput([callback])
+        output.start(io.BytesIO(b"one\ntwo\n"))
+        output.join()
+
+        self.assertEqual(lines, ["two"])
+        self.assertEqual(output.data, "one\ntwo\n")
+        output.close()
+
+    def test_invalid_utf8(self) -> None:
+        output = ProcessOutput()
+        output.start(io.BytesIO(b"\xff\n"))
+        output.join()
+
+        self.assertEqual(output.data, "�\n")
+        output.close()
@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import yaml
+
+from system import thread_pool
+from system.resource_accounting import ResourceAccounting, ResourceBudget, ResourceBudgetExceededException, ResourceUsage
+
+
+class TestResourceUsage(unittest.TestCase):
+    def test_from_rusage(self) -> None:
+        rusage = MagicMock(ru_utime=1.5, ru_stime=0.5, ru_maxrss=2048, ru_inblock=2, ru_oublock=4)
+        with patch("sys.platform", "linux"):
+            usage = ResourceUsage.from_rusage(3.0, rusage)
+        self.assertEqual(usage.to_dict(), {
+            "commands": 1,
+            "wall_time": 3.0,
+            "user_time": 1.5,
+            "system_time": 0.5,
+            "max_rss_kb": 2048,
+            "read_bytes": 1024,
+            "write_bytes": 2048,
+        })
+        self.assertEqual(usage.cpu_time, 2.0)
+        self.assertEqual(usage.io_bytes, 3072)
+
+    def test_from_rusage_darwin(self) -> None:
+        rusage = MagicMock(ru_utime=0, ru_stime=0, ru_maxrss=2097152, ru_inblock=0, ru_oublock=0)
+        with patch("sys.platform", "darwin"):
+            self.assertEqual(ResourceUsage.from_rusage(1.0, rusage).max_rss_kb, 2048)
+
+    def test_from_rusage_none(self) -> None:
+        usage = ResourceUsage.from_rusage(1.0, None)
+        self.assertEqual((usage.commands, usage.wall_time, usage.cpu_time), (1, 1.0, 0))
+
+    def test_add(self) -> None:
+        usage = ResourceUsage(1.0, 1.0, 1.0, 1024, 10, 20, 1) + ResourceUsage(2.0, 2.0, 2.0, 512, 30, 40, 1)
+        self.assertEqual(usage.to_dict(), {
+            "commands": 2,
+            "wall_time": 3.0,
+            "user_time": 3.0,
+            "system_time": 3.0,
+            "max_rss_kb": 1024,
+            "read_bytes": 40,
+            "write_bytes": 60,
+        })
+
+
+class TestResourceBudget(unittest.TestCase):
+    def test_parse(self) -> None:
+        self.assertEqual(ResourceBudget.parse("cpu=3600, rss=8192").limits, {"cpu": 3600, "rss": 8192})
+        self.assertEqual(ResourceBudget.parse("").limits, {})
+        self.assertEqual(ResourceBudget.parse(None).limits, {})
+
+    def test_parse_invalid(self) -> None:
+        with self.assertRaises(ValueError) as ctx:
+            ResourceBudget.parse("memory=1024")
+        self.assertEqual(str(ctx.exception), "Invalid resource budget metric: memory, expected one of wall, cpu, rss, io")
+
+    def test_exceeded(self) -> None:
+        budget = ResourceBudget({"cpu": 10, "rss": 1024, "io": 1})
+        usage = ResourceUsage(60, 8, 4, 2048 * 1024, 0, 2**20)
+        self.assertEqual(budget.exceeded(usage), [
+            ("cpu", "CPU time of 12.0s exceeds 10s"),
+            ("rss", "peak RSS of 2048.0MB exceeds 1024MB"),
+        ])
+
+
+class TestResourceAccounting(unittest.TestCase):
+    def test_default(self) -> None:
+        self.assertIs(ResourceAccounting.default(), ResourceAccounting.default())
+
+    def test_record(self) -> None:
+        accounting = ResourceAccounting()
+        accounting.record("git init", ResourceUsage(1, 1, 0, 1024, commands=1))
+        with accounting.component("sql"):
+            accounting.record("./gradlew assemble", ResourceUsage(10, 20, 2, 4096, commands=1))
+            with accounting.component("common-utils"):
+                accounting.record("./gradlew publishToMavenLocal", ResourceUsage(5, 5, 1, 2048, commands=1))
+            accounting.record("./gradlew test", ResourceUsage(10, 20, 2, 8192, commands=1))
+        self.assertIsNone(accounting.current_component)
+
+        self.assertEqual(accounting.total.commands, 4)
+        self.assertEqual(accounting.total.wall_time, 26)
+        self.assertEqual(accounting.total.max_rss_kb, 8192)
+        self.assertEqual(sorted(accounting.components), ["common-utils", "sql"])
+        self.assertEqual(accounting.components["sql"].commands, 2)
+        self.assertEqual(accounting.components["sql"].user_time, 40)
+
+    def test_record_threads(self) -> None:
+        accounting = ResourceAccounting()
+
+        def run() -> None:
+            accounting.record("./gradlew assemble", ResourceUsage(commands=1))
+
+        with accounting.component("sql"):
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        # commands run by other threads are not accounted to the component of this one
+        self.assertEqual(accounting.components, {})
+        self.assertEqual(accounting.total.commands, 1)
+
+    def test_record_thread_pool(self) -> None:
+        accounting = ResourceAccounting()
+
+        def run(command: str) -> None:
+            accounting.record(command, ResourceUsage(commands=1))
+
+        with accounting.component("sql"):
+            thread_pool.run(run, [("./gradlew assemble",), ("./gradlew publishToMavenLocal",)], 2)
+        run("./gradlew clean")
+
+        # the context of the component is copied to the threads of the pool
+        self.assertEqual(accounting.components["sql"].commands, 2)
+        self.assertEqual(accounting.total.commands, 3)
+
+    @patch("logging.warning")
+    def test_record_budget_warn(self, mock_warning: MagicMock) -> None:
+        accounting = ResourceAccounting(ResourceBudget({"wall": 15}))
+        with accounting.component("sql"):
+            for _ in range(3):
+                accounting.record("./gradlew assemble", ResourceUsage(10, commands=1))
+
+        mock_warning.assert_called_once_with("sql exceeded its resource budget: wall time of 20.0s exceeds 15s")
+
+    def test_record_budget_fail(self) -> None:
+        accounting = ResourceAccounting(ResourceBudget({"wall": 15}), fail=True)
+        with accounting.component("sql"):
+            accounting.record("./gradlew assemble", ResourceUsage(10, commands=1))
+            with self.assertRaises(ResourceBudgetExceededException) as ctx:
+                accounting.record("./gradlew assemble", ResourceUsage(10, commands=1))
+        self.assertEqual(str(ctx.exception), "sql exceeded its resource budget: wall time of 20.0s exceeds 15s")
+        # the usage is accounted for anyway
+        self.assertEqual(accounting.components["sql"].commands, 2)
+
+    def test_record_budget_workflow(self) -> None:
+        accounting = ResourceAccounting(ResourceBudget({"wall": 15}), fail=True)
+        # the budget is for each component
+        accounting.record("git ls-remote", ResourceUsage(20, commands=1))
+        self.assertEqual(accounting.total.commands, 1)
+
+    def test_write(self) -> None:
+        accounting = ResourceAccounting()
+        with accounting.component("sql"):
+            accounting.record("./gradlew assemble", ResourceUsage(10, 20, 2, 4096, 512, 1024, 1))
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "builds", "resources.yml")
+            accounting.write(path)
+            with open(path) as f:
+                data = yaml.safe_load(f)
+
+        self.assertEqual(data["total"], data["components"]["sql"])
+        self.assertEqual(data["components"]["sql"]["max_rss_kb"], 4096)
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+from system import subprocess_runner
+from system.resource_accounting import ResourceAccounting
+
+# allocates and zeroes 64MB
+ALLOCATE = f'{sys.executable} -c "bytearray(64 * 1024 * 1024)"'
+
+
+@patch.object(ResourceAccounting, "default")
+class TestSubprocessRunner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.accounting = ResourceAccounting()
+
+    def test_run(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        result = subprocess_runner.run("echo output && >&2 echo error", shell=True, capture_output=True, text=True)
+        self.assertEqual((result.returncode, result.stdout, result.stderr), (0, "output\n", "error\n"))
+        self.assertEqual(self.accounting.total.commands, 1)
+        self.assertGreater(self.accounting.total.wall_time, 0)
+
+    def test_run_usage(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        with self.accounting.component("sql"):
+            subprocess_runner.run(ALLOCATE, shell=True)
+        usage = self.accounting.components["sql"]
+        self.assertGreater(usage.cpu_time, 0)
+        # includes the memory of the python process started by the shell
+        self.assertGreater(usage.max_rss_kb, 64 * 1024)
+
+    def test_run_failure(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        result = subprocess_runner.run("exit 3", shell=True)
+        self.assertEqual(result.returncode, 3)
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            subprocess_runner.run("exit 3", shell=True, check=True)
+        self.assertEqual(str(ctx.exception), "Command 'exit 3' returned non-zero exit status 3.")
+        self.assertEqual(self.accounting.total.commands, 2)
+
+    def test_check_call(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        self.assertEqual(subprocess_runner.check_call("true", shell=True, stdout=subprocess.DEVNULL), 0)
+        with self.assertRaises(subprocess.CalledProcessError):
+            subprocess_runner.check_call("false", shell=True)
+        self.assertEqual(self.accounting.total.commands, 2)
+
+    def test_check_output(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        self.assertEqual(subprocess_runner.check_output(["echo", "hello"]), b"hello\n")
+        self.assertEqual(self.accounting.total.commands, 1)
+
+    def test_run_large_output(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        # more than fits in the pipe buffers, the output is read while waiting for the command
+        result = subprocess_runner.run([sys.executable, "-c", "import sys; sys.stdout.write('x' * 2**20); sys.stderr.write('y' * 2**20)"], capture_output=True)
+        self.assertEqual((len(result.stdout), len(result.stderr)), (2**20, 2**20))
+
+    def test_run_signal(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        result = subprocess_runner.run([sys.executable, "-c", "import os, signal; os.kill(os.getpid(), signal.SIGTERM)"])
+        self.assertEqual(result.returncode, -15)
+
+    def test_run_input(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        result = subprocess_runner.run(["cat"], input=b"input", capture_output=True)
+        self.assertEqual(result.stdout, b"input")
+        # more than fits in the pipe buffers, written while the output is read
+        self.assertEqual(len(subprocess_runner.check_output(["cat"], input="x" * 2**20, text=True)), 2**20)
+        # a command that does not read its input
+        self.assertEqual(subprocess_runner.run(["true"], input=b"x" * 2**20).returncode, 0)
+        with self.assertRaises(ValueError):
+            subprocess_runner.run(["cat"], input=b"input", stdin=subprocess.DEVNULL)
+
+    def test_run_timeout(self, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        self.assertEqual(subprocess_runner.run(["true"], timeout=10).returncode, 0)
+        with self.assertRaises(subprocess.TimeoutExpired) as ctx:
+            subprocess_runner.run([sys.executable, "-c", "import time; print('started', flush=True); time.sleep(60)"], capture_output=True, timeout=1)
+        self.assertEqual((ctx.exception.timeout, ctx.exception.stdout), (1, b"started\n"))
+        # the command was killed and reaped, and its resources accounted
+        self.assertEqual(self.accounting.total.commands, 2)
+        self.assertLess(self.accounting.total.wall_time, 30)
+
+    @patch("system.subprocess_runner.os")
+    def test_run_without_wait4(self, mock_os: Mock, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        del mock_os.wait4
+        result = subprocess_runner.run("echo output; exit 2", shell=True, capture_output=True, text=True)
+        self.assertEqual((result.returncode, result.stdout), (2, "output\n"))
+        self.assertEqual((self.accounting.total.commands, self.accounting.total.cpu_time), (1, 0))
+
+    @patch("system.subprocess_runner.os")
+    def test_run_without_wait4_timeout(self, mock_os: Mock, mock_default: Mock) -> None:
+        mock_default.return_value = self.accounting
+        del mock_os.wait4
+        self.assertEqual(subprocess_runner.run(["cat"], input=b"input", capture_output=True).stdout, b"input")
+        with self.assertRaises(subprocess.TimeoutExpired):
+            subprocess_runner.run(["sleep", "60"], timeout=0.5)
+        self.assertEqual(self.accounting.total.commands, 2)
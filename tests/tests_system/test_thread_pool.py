@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import contextvars
+import threading
+import time
+import unittest
+from typing import List
+
+from system import thread_pool
+
+component: contextvars.ContextVar = contextvars.ContextVar("component", default=None)
+
+
+class TestThreadPool(unittest.TestCase):
+    def test_run(self) -> None:
+        self.assertEqual(thread_pool.run(lambda a, b: a * b, [(1, 2), (3, 4), (5, 6)]), [2, 12, 30])
+
+    def test_run_empty(self) -> None:
+        self.assertEqual(thread_pool.run(lambda a: a, []), [])
+
+    def test_run_single_worker(self) -> None:
+        threads: List[int] = []
+        thread_pool.run(lambda: threads.append(threading.get_ident()), [(), ()], workers=1)
+        self.assertEqual(threads, [threading.get_ident()] * 2)
+
+    def test_run_context(self) -> None:
+        token = component.set("sql")
+        try:
+            self.assertEqual(thread_pool.run(lambda: component.get(), [(), ()]), ["sql", "sql"])
+        finally:
+            component.reset(token)
+
+    def test_run_fail_fast(self) -> None:
+        started: List[int] = []
+
+        def call(index: int) -> None:
+            started.append(index)
+            if index == 0:
+                raise ValueError("failed")
+            time.sleep(0.1)
+
+        with self.assertRaises(ValueError) as ctx:
+            thread_pool.run(call, [(index,) for index in range(20)], workers=2)
+        self.assertEqual(str(ctx.exception), "failed")
+        self.assertLess(len(started), 20)
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from system import subprocess_runner
+from system.default_instance import DefaultInstance
+from system.tracer import Tracer
+
+
+class TestTracer(unittest.TestCase):
+    def test_default(self) -> None:
+        self.assertIs(Tracer.default(), Tracer.default())
+
+    def test_span(self) -> None:
+        tracer = Tracer()
+        with tracer.span("build", component="OpenSearch") as span:
+            span.add_bytes(1024)
+            span.add_bytes(1024)
+
+        self.assertEqual(len(tracer.events), 1)
+        event = tracer.events[0]
+        self.assertEqual(event["name"], "build")
+        self.assertEqual(event["ph"], "X")
+        self.assertEqual(event["pid"], os.getpid())
+        self.assertEqual(event["tid"], threading.get_ident())
+        self.assertGreaterEqual(event["dur"], 0)
+        self.assertEqual(event["args"]["component"], "OpenSearch")
+        self.assertEqual(event["args"]["depth"], 0)
+        self.assertEqual(event["args"]["bytes"], 2048)
+        self.assertIn("cpu_ms", event["args"])
+
+    def test_span_nested(self) -> None:
+        tracer = Tracer()
+        with tracer.span("build"):
+            with tracer.span("checkout"):
+                pass
+            with tracer.span("gradle"):
+                with tracer.span("publish"):
+                    pass
+
+        depths = {event["name"]: event["args"]["depth"] for event in tracer.events}
+        self.assertEqual(depths, {"build": 0, "checkout": 1, "gradle": 1, "publish": 2})
+        self.assertEqual(tracer.depth, 0)
+
+    def test_span_exception(self) -> None:
+        tracer = Tracer()
+        with self.assertRaises(ValueError):
+            with tracer.span("build"):
+                raise ValueError("build failed")
+
+        self.assertEqual(len(tracer.events), 1)
+        self.assertEqual(tracer.depth, 0)
+
+    def test_span_threads(self) -> None:
+        tracer = Tracer()
+
+        def run() -> None:
+            with tracer.span("sign"):
+                pass
+
+        with tracer.span("sign artifacts"):
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        # spans on another thread are not nested in the spans of this one
+        self.assertEqual([event["args"]["depth"] for event in tracer.events], [0, 0])
+
+    @patch.dict(DefaultInstance.__instances__, clear=True)
+    def test_span_children(self) -> None:
+        tracer = Tracer.default()
+
+        def run() -> None:
+            subprocess_runner.check_call([sys.executable, "-c", "pass"])
+
+        with tracer.span("build"):
+            with tracer.span("execute"):
+                subprocess_runner.check_call([sys.executable, "-c", "bytearray(64 * 1024 * 1024)"])
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+        with tracer.span("idle"):
+            pass
+
+        # commands are added to the spans running on the thread that ran them, including those that the span is nested in
+        events = {event["name"]: event["args"] for event in tracer.events}
+        self.assertEqual((events["build"]["commands"], events["execute"]["commands"]), (1, 1))
+        self.assertGreater(events["execute"]["children_user_ms"] + events["execute"]["children_system_ms"], 0)
+        self.assertGreater(events["execute"]["children_max_rss_kb"], 64 * 1024)
+        self.assertEqual(events["build"]["children_max_rss_kb"], events["execute"]["children_max_rss_kb"])
+        self.assertEqual(sorted(events["idle"]), ["cpu_ms", "depth"])
+
+    def test_add_file(self) -> None:
+        tracer = Tracer()
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "artifact.zip")
+            with open(path, "wb") as f:
+                f.write(b"x" * 100)
+
+            with tracer.span("copy") as span:
+                span.add_file(path)
+                span.add_file(os.path.join(work_dir, "missing.zip"))
+                span.add_file(work_dir)
+
+        self.assertEqual(tracer.events[0]["args"]["bytes"], 100)
+
+    def test_write(self) -> None:
+        tracer = Tracer()
+        with tracer.span("assemble"):
+            with tracer.span("install min"):
+                pass
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "dist", "trace-assemble.json")
+            tracer.write(path)
+            with open(path) as f:
+                data = json.load(f)
+
+        self.assertEqual(data["displayTimeUnit"], "ms")
+        self.assertEqual([event["name"] for event in data["traceEvents"]], ["assemble", "install min"])
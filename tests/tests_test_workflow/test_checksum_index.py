@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import os
+import unittest
+from unittest.mock import patch
+
+from system.temporary_directory import TemporaryDirectory
+from test_workflow.checksum_index import ChecksumIndex
+
+
+class TestChecksumIndex(unittest.TestCase):
+    def test_sha512(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            with open(path, "wb") as f:
+                f.write(b"contents")
+            index = ChecksumIndex(work_dir.name)
+            self.assertEqual(index.sha512(path), hashlib.sha512(b"contents").hexdigest())
+            index.save()
+            self.assertTrue(os.path.isfile(os.path.join(work_dir.name, ChecksumIndex.FILENAME)))
+
+            loaded = ChecksumIndex(work_dir.name)
+            self.assertEqual(loaded.entries, index.entries)
+            # an unchanged file is not read again
+            with patch("builtins.open") as mock_open:
+                self.assertEqual(loaded.sha512(path), hashlib.sha512(b"contents").hexdigest())
+                mock_open.assert_not_called()
+
+    def test_sha512_changed(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "artifact.jar")
+            with open(path, "wb") as f:
+                f.write(b"contents")
+            index = ChecksumIndex(work_dir.name)
+            index.sha512(path)
+            with open(path, "wb") as f:
+                f.write(b"changed contents")
+            self.assertEqual(index.sha512(path), hashlib.sha512(b"changed contents").hexdigest())
+
+    def test_save_unchanged(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            ChecksumIndex(work_dir.name).save()
+            self.assertFalse(os.path.exists(os.path.join(work_dir.name, ChecksumIndex.FILENAME)))
+
+    def test_invalid(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with open(os.path.join(work_dir.name, ChecksumIndex.FILENAME), "w") as f:
+                f.write("{invalid")
+            self.assertEqual(ChecksumIndex(work_dir.name).entries, {})
@@ -1,10 +1,13 @@
+import hashlib
 import os
 import unittest
-from unittest.mock import Mock, call, patch
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, Mock, call, patch
 from urllib.error import HTTPError
 
 from manifests.build_manifest import BuildManifest
 from manifests.bundle_manifest import BundleManifest
+from system.temporary_directory import TemporaryDirectory
 from system.thread_safe_counter import ThreadSafeCounter
 from test_workflow.dependency_installer_opensearch import DependencyInstallerOpenSearch
 
@@ -16,11 +19,11 @@ class DependencyInstallerOpenSearchTests(unittest.TestCase):
     DIST_MANIFEST_REMOTE = os.path.join(DATA, "remote", "dist", "opensearch", "manifest.yml")
 
     @patch("os.makedirs")
-    @patch("shutil.copyfile")
-    @patch("urllib.request.urlretrieve")
-    def test_install_maven_dependencies_local(self, mock_request: Mock, mock_copyfile: Mock, mock_makedirs: Mock) -> None:
+    @patch("system.file_materializer.FileMaterializer.materialize")
+    @patch("system.downloader.Downloader.download")
+    def test_install_maven_dependencies_local(self, mock_download: Mock, mock_materialize: Mock, mock_makedirs: Mock) -> None:
         counter = ThreadSafeCounter()
-        mock_copyfile.side_effect = counter.thread_safe_count
+        mock_materialize.side_effect = counter.thread_safe_count
 
         dependency_installer = DependencyInstallerOpenSearch(
             self.DATA,
@@ -38,9 +41,9 @@ class DependencyInstallerOpenSearchTests(unittest.TestCase):
             ),
             exist_ok=True
         )
-        mock_request.assert_not_called()
+        mock_download.assert_not_called()
         self.assertEqual(counter.call_count, 2375)
-        mock_copyfile.assert_has_calls([
+        mock_materialize.assert_has_calls([
             call(
                 os.path.join(self.DATA, "builds", "opensearch", "maven", "org", "opensearch", "notification", "alerting-notification-1.2.0.0.jar"),
                 os.path.realpath(os.path.join(dependency_installer.maven_local_path, "org", "opensearch", "notification", "alerting-notification-1.2.0.0.jar"))
@@ -48,11 +51,11 @@ class DependencyInstallerOpenSearchTests(unittest.TestCase):
         ])
 
     @patch("os.makedirs")
-    @patch("shutil.copyfile")
-    @patch("urllib.request.urlretrieve")
-    def test_install_maven_dependencies_remote(self, mock_request: Mock, mock_copyfile: Mock, mock_makedirs: Mock) -> None:
+    @patch("system.file_materializer.FileMaterializer.materialize")
+    @patch("system.downloader.Downloader.download")
+    def test_install_maven_dependencies_remote(self, mock_download: Mock, mock_materialize: Mock, mock_makedirs: Mock) -> None:
         counter = ThreadSafeCounter()
-        mock_request.side_effect = counter.thread_safe_count
+        mock_download.side_effect = counter.thread_safe_count
         dependency_installer = DependencyInstallerOpenSearch(
             "https://ci.opensearch.org/x/y",
             BuildManifest.from_path(self.BUILD_MANIFEST),
@@ -70,22 +73,23 @@ class DependencyInstallerOpenSearchTests(unittest.TestCase):
             ),
             exist_ok=True
         )
-        mock_copyfile.assert_not_called()
-        mock_request.assert_has_calls([
+        mock_materialize.assert_not_called()
+        mock_download.assert_has_calls([
             call(
                 "https://ci.opensearch.org/x/y/builds/opensearch/maven/org/opensearch/notification/alerting-notification-1.2.0.0.jar",
-                os.path.realpath(os.path.join(dependency_installer.maven_local_path, "org", "opensearch", "notification", "alerting-notification-1.2.0.0.jar"))
+                os.path.realpath(os.path.join(dependency_installer.maven_local_path, "org", "opensearch", "notification", "alerting-notification-1.2.0.0.jar")),
+                None
             )
         ])
 
     @patch("os.makedirs")
-    @patch("shutil.copyfile")
-    @patch("urllib.request.urlretrieve")
-    def test_install_maven_dependencies_remote_failure(self, mock_request: Mock, mock_copyfile: Mock, mock_makedirs: Mock) -> None:
-        def mock_retrieve(source: str, dest: str) -> str:
+    @patch("system.file_materializer.FileMaterializer.materialize")
+    @patch("system.downloader.Downloader.download")
+    def test_install_maven_dependencies_remote_failure(self, mock_download: Mock, mock_materialize: Mock, mock_makedirs: Mock) -> None:
+        def mock_retrieve(source: str, dest: str, checksum: str = None) -> str:
             raise HTTPError(url=source, hdrs=None, fp=None, msg="Not Found", code=404)
 
-        mock_request.side_effect = mock_retrieve
+        mock_download.side_effect = mock_retrieve
 
         dependency_installer = DependencyInstallerOpenSearch(
             "https://ci.opensearch.org/x/y",
@@ -98,9 +102,9 @@ class DependencyInstallerOpenSearchTests(unittest.TestCase):
         self.assertEqual(str(ctx.exception), "HTTP Error 404: Not Found")
 
     @patch("os.makedirs")
-    @patch("shutil.copyfile")
-    @patch("urllib.request.urlretrieve")
-    def test_install_build_dependencies_local(self, mock_request: Mock, mock_copyfile: Mock, mock_makedirs: Mock) -> None:
+    @patch("system.file_materializer.FileMaterializer.materialize")
+    @patch("system.downloader.Downloader.download")
+    def test_install_build_dependencies_local(self, mock_download: Mock, mock_materialize: Mock, mock_makedirs: Mock) -> None:
         dependency_installer = DependencyInstallerOpenSearch(
             self.DATA,
             BuildManifest.from_path(self.BUILD_MANIFEST),
@@ -109,24 +113,147 @@ class DependencyInstallerOpenSearchTests(unittest.TestCase):
         dependencies = dict({"opensearch-job-scheduler": "1.1.0.0"})
         dependency_installer.install_build_dependencies(dependencies, os.path.dirname(__file__))
         mock_makedirs.assert_called_with(os.path.dirname(__file__), exist_ok=True)
-        mock_request.assert_not_called()
-        mock_copyfile.assert_called_once_with(
+        mock_download.assert_not_called()
+        mock_materialize.assert_called_once_with(
             os.path.join(self.DATA, "builds", "opensearch", "plugins", "opensearch-job-scheduler-1.1.0.0.zip"),
             os.path.realpath(os.path.join(os.path.dirname(__file__), "opensearch-job-scheduler-1.1.0.0.zip")),
         )
 
     @patch("os.makedirs")
-    @patch("shutil.copyfile")
-    @patch("urllib.request.urlretrieve")
-    def test_install_build_dependencies_remote(self, mock_request: Mock, mock_copyfile: Mock, mock_makedirs: Mock) -> None:
+    @patch("system.file_materializer.FileMaterializer.materialize")
+    @patch("system.downloader.Downloader.download")
+    def test_install_build_dependencies_remote(self, mock_download: Mock, mock_materialize: Mock, mock_makedirs: Mock) -> None:
         dependency_installer = DependencyInstallerOpenSearch(
             "https://ci.opensearch.org/x/y", BuildManifest.from_path(self.BUILD_MANIFEST), BundleManifest.from_path(self.DIST_MANIFEST_REMOTE)
         )
         dependencies = dict({"opensearch-job-scheduler": "1.1.0.0"})
         dependency_installer.install_build_dependencies(dependencies, os.path.dirname(__file__))
         mock_makedirs.assert_called_with(os.path.dirname(__file__), exist_ok=True)
-        mock_copyfile.assert_not_called()
-        mock_request.assert_called_once_with(
+        mock_materialize.assert_not_called()
+        mock_download.assert_called_once_with(
             "https://ci.opensearch.org/x/y/builds/opensearch/plugins/opensearch-job-scheduler-1.1.0.0.zip",
             os.path.realpath(os.path.join(os.path.dirname(__file__), "opensearch-job-scheduler-1.1.0.0.zip")),
+            None,
+        )
+
+    def test_jobs(self) -> None:
+        dependency_installer = DependencyInstallerOpenSearch(
+            "https://ci.opensearch.org/x/y", BuildManifest.from_path(self.BUILD_MANIFEST), BundleManifest.from_path(self.DIST_MANIFEST_REMOTE), jobs=2
+        )
+        self.assertEqual(dependency_installer.jobs, 2)
+        self.assertEqual(dependency_installer.downloader.jobs, 2)
+
+    def test_sync(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            root = os.path.join(work_dir.name, "root")
+            dest = os.path.join(work_dir.name, "repository")
+            paths = [
+                "maven/org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar",
+                "maven/org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar.sha1",
+                "maven/org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar.sha512",
+                "maven/org/opensearch/common-utils/maven-metadata.xml",
+            ]
+
+            def publish(data: bytes) -> None:
+                for path in paths:
+                    os.makedirs(os.path.dirname(os.path.join(root, "builds", "opensearch", path)), exist_ok=True)
+                    with open(os.path.join(root, "builds", "opensearch", path), "wb") as f:
+                        if path.endswith(".sha512"):
+                            f.write(f"{hashlib.sha512(data).hexdigest()}  common-utils-1.2.0.jar".encode())
+                        elif path.endswith(".sha1"):
+                            f.write(hashlib.sha1(data).hexdigest().encode())
+                        else:
+                            f.write(data)
+
+            dependency_installer = DependencyInstallerOpenSearch(
+                root,
+                BuildManifest.from_path(self.BUILD_MANIFEST),
+                BundleManifest.from_path(self.DIST_MANIFEST_LOCAL)
+            )
+            publish(b"1")
+            dependency_installer.sync(paths, "builds", dest)
+            with open(os.path.join(dest, "org", "opensearch", "common-utils", "1.2.0", "common-utils-1.2.0.jar"), "rb") as f:
+                self.assertEqual(f.read(), b"1")
+
+            # unchanged files, and the checksums of unchanged files, are not copied again
+            with patch.object(dependency_installer, "download_or_copy", wraps=dependency_installer.download_or_copy) as mock_download_or_copy:
+                dependency_installer.sync(paths, "builds", dest)
+            self.assertEqual(sorted(args[0][0] for args in mock_download_or_copy.call_args_list), [
+                os.path.join(root, "builds", "opensearch", "maven/org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar.sha512"),
+                os.path.join(root, "builds", "opensearch", "maven/org/opensearch/common-utils/maven-metadata.xml"),
+            ])
+
+            # changed files are copied again
+            publish(b"2")
+            with patch.object(dependency_installer, "download_or_copy", wraps=dependency_installer.download_or_copy) as mock_download_or_copy:
+                dependency_installer.sync(paths, "builds", dest)
+            self.assertEqual(mock_download_or_copy.call_count, 4)
+            # the checksum downloaded first verifies the file, rather than being fetched again
+            mock_download_or_copy.assert_any_call(
+                os.path.join(root, "builds", "opensearch", "maven/org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar"),
+                os.path.realpath(os.path.join(dest, "org", "opensearch", "common-utils", "1.2.0", "common-utils-1.2.0.jar")),
+                hashlib.sha512(b"2").hexdigest()
+            )
+            with open(os.path.join(dest, "org", "opensearch", "common-utils", "1.2.0", "common-utils-1.2.0.jar"), "rb") as f:
+                self.assertEqual(f.read(), b"2")
+
+    def test_sync_remote(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            dest = os.path.join(work_dir.name, "repository")
+            root_url = "https://ci.opensearch.org/x/y"
+            paths = [
+                "maven/org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar",
+                "maven/org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar.sha512",
+                "maven/org/opensearch/common-utils/maven-metadata.xml",
+            ]
+            published: Dict[str, bytes] = {
+                f"{root_url}/builds/opensearch/{paths[0]}": b"1",
+                f"{root_url}/builds/opensearch/{paths[1]}": f"{hashlib.sha512(b'1').hexdigest()}  common-utils-1.2.0.jar".encode(),
+                f"{root_url}/builds/opensearch/{paths[2]}": b"<metadata/>",
+            }
+            downloaded: List[str] = []
+
+            def download_or_copy(source: str, dest: str, checksum: str = None) -> str:
+                downloaded.append(source)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                with open(dest, "wb") as f:
+                    f.write(published[source])
+                return dest
+
+            dependency_installer = DependencyInstallerOpenSearch(
+                root_url,
+                BuildManifest.from_path(self.BUILD_MANIFEST),
+                BundleManifest.from_path(self.DIST_MANIFEST_REMOTE)
+            )
+            with patch.object(dependency_installer, "download_or_copy", side_effect=download_or_copy):
+                dependency_installer.sync(paths, "builds", dest)
+                self.assertEqual(sorted(downloaded), sorted(published))
+
+                # checksums are downloaded again, the files they verify are not
+                downloaded.clear()
+                dependency_installer.sync(paths, "builds", dest)
+                self.assertEqual(sorted(downloaded), sorted([f"{root_url}/builds/opensearch/{paths[1]}", f"{root_url}/builds/opensearch/{paths[2]}"]))
+
+                # a file republished under the same URL is downloaded again
+                published[f"{root_url}/builds/opensearch/{paths[0]}"] = b"2"
+                published[f"{root_url}/builds/opensearch/{paths[1]}"] = f"{hashlib.sha512(b'2').hexdigest()}  common-utils-1.2.0.jar".encode()
+                downloaded.clear()
+                dependency_installer.sync(paths, "builds", dest)
+                self.assertEqual(sorted(downloaded), sorted(published))
+                with open(os.path.join(dest, "org/opensearch/common-utils/1.2.0/common-utils-1.2.0.jar"), "rb") as f:
+                    self.assertEqual(f.read(), b"2")
+
+    @patch("test_workflow.dependency_installer_opensearch.ChecksumIndex")
+    def test_install_maven_dependencies_index(self, mock_index: MagicMock) -> None:
+        dependency_installer = DependencyInstallerOpenSearch(
+            "https://ci.opensearch.org/x/y",
+            BuildManifest.from_path(self.BUILD_MANIFEST),
+            BundleManifest.from_path(self.DIST_MANIFEST_REMOTE)
         )
+        indexes: List[Any] = []
+        with patch.object(dependency_installer, "sync", side_effect=lambda *args: indexes.append(args[3])) as mock_sync:
+            dependency_installer.install_maven_dependencies()
+        self.assertGreater(mock_sync.call_count, 1)
+        self.assertEqual(set(map(id, indexes)), {id(mock_index.return_value)})
+        mock_index.assert_called_once_with(dependency_installer.maven_local_path)
+        mock_index.return_value.save.assert_called_once_with()
@@ -4,7 +4,9 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import os
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 from test_workflow.integ_test.integ_test_runner_opensearch import IntegTestRunnerOpenSearch
@@ -13,6 +15,8 @@ from test_workflow.integ_test.integ_test_runner_opensearch import IntegTestRunne
 class TestIntegTestRunnerOpenSearch(unittest.TestCase):
     def setUp(self) -> None:
         self.args = MagicMock()
+        self.args.parallel = 1
+        self.args.reuse_cluster = False
         self.test_manifest = MagicMock()
 
     @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestStartPropertiesOpenSearch")
@@ -72,9 +76,108 @@ class TestIntegTestRunnerOpenSearch(unittest.TestCase):
             mock_properties_object.bundle_manifest,
             mock_properties_object.build_manifest,
             mock_path,
-            mock_test_recorder_object
+            mock_test_recorder_object,
+            None,
+            None
         )
 
+    @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestStartPropertiesOpenSearch")
+    @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestSuiteOpenSearch")
+    @patch("test_workflow.integ_test.integ_test_runner_opensearch.LocalTestClusterPool")
+    @patch("test_workflow.integ_test.integ_test_runner.TestRecorder")
+    @patch("test_workflow.integ_test.integ_test_runner.TemporaryDirectory")
+    def test_reuse_cluster(self, mock_temp: Mock, mock_test_recorder: Mock, mock_pool: Mock, mock_suite: Mock, mock_properties: Mock) -> None:
+        self.args.reuse_cluster = True
+        self.args.paths = {"opensearch": "test-path"}
+
+        mock_test_config = MagicMock()
+        mock_test_config.integ_test = MagicMock()
+        self.test_manifest.components = {"sql": mock_test_config}
+
+        mock_component = MagicMock()
+        mock_component.name = "sql"
+        mock_properties.return_value.bundle_manifest.components.select.return_value = [mock_component]
+
+        runner = IntegTestRunnerOpenSearch(self.args, self.test_manifest)
+
+        # call the test target
+        runner.run()
+
+        mock_pool.assert_called_once_with(
+            mock_properties.return_value.dependency_installer,
+            mock_properties.return_value.bundle_manifest,
+            mock_test_recorder.return_value,
+            None,
+            2,
+            self.args.keep
+        )
+        self.assertEqual(mock_suite.call_args.args[-1], mock_pool.return_value.__enter__.return_value)
+        mock_pool.return_value.__exit__.assert_called_once()
+
+    @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestStartPropertiesOpenSearch")
+    @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestSuiteOpenSearch")
+    @patch("test_workflow.integ_test.integ_test_runner.TestRecorder")
+    @patch("test_workflow.integ_test.integ_test_runner.TemporaryDirectory")
+    @patch("os.makedirs")
+    def test_parallel(self, mock_makedirs: Mock, mock_temp: Mock, mock_test_recorder: Mock, mock_suite: Mock, mock_properties: Mock) -> None:
+        self.args.parallel = 2
+        self.args.paths = {"opensearch": "test-path"}
+        self.args.test_run_id = "12345"
+
+        mock_test_config = MagicMock()
+        mock_test_config.integ_test = MagicMock()
+        self.test_manifest.components = {"sql": mock_test_config, "alerting": mock_test_config}
+
+        mock_components = []
+        for name in ["sql", "alerting"]:
+            mock_component = MagicMock()
+            mock_component.name = name
+            mock_components.append(mock_component)
+        mock_properties.return_value.bundle_manifest.components.select.return_value = mock_components
+
+        mock_suite.side_effect = lambda *args: MagicMock(execute_tests=MagicMock(return_value=f"{args[1].name}-results"))
+        mock_temp.return_value.__enter__.return_value.path = "work-dir"
+
+        runner = IntegTestRunnerOpenSearch(self.args, self.test_manifest)
+        self.assertIsNotNone(runner.port_allocator)
+
+        # call the test target
+        results = runner.run()
+
+        self.assertEqual(list(results.keys()), ["alerting", "sql"])
+        self.assertEqual(results["sql"], "sql-results")
+        self.assertEqual(results["alerting"], "alerting-results")
+        self.assertEqual(
+            sorted(call.args[5] for call in mock_suite.call_args_list),
+            [Path(os.path.join("work-dir", "alerting")), Path(os.path.join("work-dir", "sql"))]
+        )
+        self.assertTrue(all(call.args[7] == runner.port_allocator for call in mock_suite.call_args_list))
+
+    @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestStartPropertiesOpenSearch")
+    @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestSuiteOpenSearch")
+    @patch("test_workflow.integ_test.integ_test_runner.TestRecorder")
+    @patch("test_workflow.integ_test.integ_test_runner.TemporaryDirectory")
+    @patch("os.makedirs")
+    def test_parallel_failure(self, mock_makedirs: Mock, mock_temp: Mock, mock_test_recorder: Mock, mock_suite: Mock, mock_properties: Mock) -> None:
+        self.args.parallel = 2
+        self.args.paths = {"opensearch": "test-path"}
+
+        mock_test_config = MagicMock()
+        mock_test_config.integ_test = MagicMock()
+        self.test_manifest.components = {"sql": mock_test_config}
+
+        mock_component = MagicMock()
+        mock_component.name = "sql"
+        mock_properties.return_value.bundle_manifest.components.select.return_value = [mock_component]
+
+        mock_suite.return_value.execute_tests.side_effect = ValueError("sql failed")
+
+        runner = IntegTestRunnerOpenSearch(self.args, self.test_manifest)
+
+        with self.assertRaises(ValueError) as ctx:
+            runner.run()
+        self.assertEqual(str(ctx.exception), "sql failed")
+
     @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestStartPropertiesOpenSearch")
     @patch("test_workflow.integ_test.integ_test_runner_opensearch.IntegTestSuiteOpenSearch")
     def test_without_integ_test(self, mock_suite: Mock, mock_properties: Mock) -> None:
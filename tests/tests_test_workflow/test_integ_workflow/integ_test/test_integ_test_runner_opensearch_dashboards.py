@@ -13,6 +13,7 @@ from test_workflow.integ_test.integ_test_runner_opensearch_dashboards import Int
 class TestIntegTestRunnerOpenSearchDashboards(unittest.TestCase):
     def setUp(self) -> None:
         self.args = MagicMock()
+        self.args.parallel = 1
         self.test_manifest = MagicMock()
 
     @patch("test_workflow.integ_test.integ_test_runner_opensearch_dashboards.IntegTestStartPropertiesOpenSearch")
@@ -6,14 +6,16 @@
 
 import os
 import unittest
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Tuple
+from typing import Any, Generator, Tuple
 from unittest.mock import MagicMock, Mock, call, patch
 
 from git.git_repository import GitRepository
 from manifests.build_manifest import BuildManifest
 from manifests.bundle_manifest import BundleComponent, BundleManifest
 from manifests.test_manifest import TestComponent, TestManifest
+from system.port_allocator import PortAllocator
 from test_workflow.integ_test.integ_test_suite import InvalidTestConfigError, ScriptFinder
 from test_workflow.integ_test.integ_test_suite_opensearch import IntegTestSuiteOpenSearch, LocalTestCluster
 
@@ -63,6 +65,79 @@ class TestIntegSuiteOpenSearch(unittest.TestCase):
             call("localhost", 9200, False, "without-security")
         ])
 
+    @patch("os.path.exists", return_value=True)
+    @patch("test_workflow.integ_test.integ_test_suite_opensearch.LocalTestCluster")
+    @patch("test_workflow.test_recorder.test_recorder.TestRecorder")
+    def test_execute_with_cluster_pool(self, mock_test_recorder: Mock, mock_local_test_cluster: Mock, *mock: Any) -> None:
+        test_config, component = self.__get_test_config_and_bundle_component("job-scheduler")
+        mock_cluster_pool = MagicMock()
+        mock_cluster_pool.cluster.return_value.__enter__.return_value = "localhost", 9250
+        integ_test_suite = IntegTestSuiteOpenSearch(
+            MagicMock(),
+            component,
+            test_config,
+            self.bundle_manifest,
+            self.build_manifest,
+            self.work_dir,
+            mock_test_recorder,
+            None,
+            mock_cluster_pool
+        )
+
+        with patch.object(IntegTestSuiteOpenSearch, "execute_integtest_sh", return_value=0) as mock_execute_integtest_sh:
+            test_results = integ_test_suite.execute_tests()
+
+        self.assertEqual(len(test_results), 2)
+        self.assertFalse(test_results.failed)
+        mock_cluster_pool.cluster.assert_has_calls([
+            call("job-scheduler", "with-security", True, None),
+            call("job-scheduler", "without-security", False, None)
+        ], any_order=True)
+        mock_execute_integtest_sh.assert_has_calls([
+            call("localhost", 9250, True, "with-security"),
+            call("localhost", 9250, False, "without-security")
+        ])
+        mock_local_test_cluster.create.assert_not_called()
+
+    @patch("os.path.exists", return_value=True)
+    @patch.object(PortAllocator, "in_use", return_value=[9250])
+    @patch("test_workflow.integ_test.integ_test_suite_opensearch.LocalTestCluster")
+    @patch("test_workflow.test_recorder.test_recorder.TestRecorder")
+    def test_execute_with_port_conflict(self, mock_test_recorder: Mock, mock_local_test_cluster: Mock, mock_in_use: Mock, *mock: Any) -> None:
+        test_config, component = self.__get_test_config_and_bundle_component("job-scheduler")
+        port_allocator = MagicMock()
+        port_allocator.allocate.side_effect = [[9250 + n, 9350 + n] for n in range(10)]
+
+        @contextmanager
+        def create(*args: Any, http_port: int, transport_port: int) -> Generator[Tuple[str, int], None, None]:
+            # another process took the first ports before the cluster listened on them
+            if http_port == 9250:
+                raise Exception("failed to bind to 9250")
+            yield "localhost", http_port
+
+        mock_local_test_cluster.create.side_effect = create
+        integ_test_suite = IntegTestSuiteOpenSearch(
+            MagicMock(),
+            component,
+            test_config,
+            self.bundle_manifest,
+            self.build_manifest,
+            self.work_dir,
+            mock_test_recorder,
+            port_allocator
+        )
+
+        with patch.object(IntegTestSuiteOpenSearch, "execute_integtest_sh", return_value=0) as mock_execute_integtest_sh:
+            test_results = integ_test_suite.execute_tests()
+
+        self.assertFalse(test_results.failed)
+        mock_in_use.assert_called_once_with([9250, 9350])
+        mock_execute_integtest_sh.assert_has_calls([
+            call("localhost", 9251, True, "with-security"),
+            call("localhost", 9252, False, "without-security")
+        ])
+        self.assertEqual(port_allocator.release.call_args_list, [call([9250, 9350]), call([9251, 9351]), call([9252, 9352])])
+
     @patch("test_workflow.integ_test.integ_test_suite_opensearch.LocalTestCluster")
     @patch("test_workflow.test_recorder.test_recorder.TestRecorder")
     def test_execute_with_build_dependencies(self, mock_test_recorder: Mock, mock_local_test_cluster: Mock, *mock: Any) -> None:
@@ -59,7 +59,9 @@ class LocalTestClusterTests(unittest.TestCase):
             self.additional_cluster_config,
             self.security_enabled,
             self.dependency_installer,
-            os.path.join(self.work_dir, "local-test-cluster")
+            os.path.join(self.work_dir, "local-test-cluster"),
+            9200,
+            None
         )
 
         mock_service_object.start.assert_called_once()
@@ -92,7 +94,8 @@ class LocalTestClusterTests(unittest.TestCase):
             123,
             "test stdout_data",
             "test stderr_data",
-            mock_log_files
+            mock_log_files,
+            12.5
         )
 
         mock_test_result_data_object = MagicMock()
@@ -108,7 +111,8 @@ class LocalTestClusterTests(unittest.TestCase):
             123,
             "test stdout_data",
             "test stderr_data",
-            mock_log_files
+            mock_log_files,
+            12.5
         )
 
         mock_local_cluster_logs.save_test_result_data.assert_called_once_with(mock_test_result_data_object)
@@ -159,3 +163,68 @@ class LocalTestClusterTests(unittest.TestCase):
 
         self.assertEqual(cluster.endpoint, "localhost")
         self.assertEqual(cluster.port, 9200)
+
+    @patch("test_workflow.integ_test.local_test_cluster.ServiceOpenSearch")
+    def test_allocated_ports(self, mock_service: Mock) -> None:
+        cluster = LocalTestCluster(
+            self.dependency_installer,
+            self.work_dir,
+            self.component_name,
+            self.additional_cluster_config,
+            self.manifest,
+            self.security_enabled,
+            self.component_test_config,
+            MagicMock(),
+            9250,
+            9350
+        )
+
+        self.assertEqual(cluster.port, 9250)
+        self.assertEqual(mock_service.call_args.args[-2:], (9250, 9350))
+
+    @patch("test_workflow.integ_test.local_test_cluster.ServiceOpenSearch")
+    def test_terminate_without_logs(self, mock_service: Mock) -> None:
+        mock_test_recorder = MagicMock()
+        cluster = LocalTestCluster(
+            self.dependency_installer,
+            self.work_dir,
+            self.component_name,
+            self.additional_cluster_config,
+            self.manifest,
+            self.security_enabled,
+            self.component_test_config,
+            mock_test_recorder
+        )
+        mock_service.return_value.terminate.return_value = ServiceTerminationResult(0, "stdout", "stderr", {}, 12.5)
+
+        cluster.terminate(save_logs=False)
+
+        mock_service.return_value.terminate.assert_called_once()
+        mock_test_recorder.local_cluster_logs.save_test_result_data.assert_not_called()
+
+    @patch("test_workflow.integ_test.local_test_cluster.ServiceOpenSearch")
+    def test_save_logs_for(self, mock_service: Mock) -> None:
+        mock_test_recorder = MagicMock()
+        cluster = LocalTestCluster(
+            self.dependency_installer,
+            self.work_dir,
+            self.component_name,
+            self.additional_cluster_config,
+            self.manifest,
+            self.security_enabled,
+            self.component_test_config,
+            mock_test_recorder
+        )
+        mock_service.return_value.process_handler = MagicMock(stdout_data="stdout", stderr_data="stderr")
+        mock_service.return_value.log_files = {"opensearch-service-logs": "logs"}
+        mock_service.return_value.output_files = {"stdout.log": "stdout.log"}
+        mock_service.return_value.time_to_ready = 12.5
+
+        cluster.save_logs_for(self.component_name, self.component_test_config)
+        cluster.save_logs_for("alerting", "with-security")
+
+        saved = [args.args[0] for args in mock_test_recorder.local_cluster_logs.save_test_result_data.call_args_list]
+        self.assertEqual([(data.component_name, data.component_test_config) for data in saved], [("sql", "test_config"), ("alerting", "with-security")])
+        self.assertEqual(saved[1].log_files, {"opensearch-service-logs": "logs", "stdout.log": "stdout.log"})
+        # the time to ready is that of the suite that started the cluster
+        self.assertEqual([data.time_to_ready for data in saved], [12.5, None])
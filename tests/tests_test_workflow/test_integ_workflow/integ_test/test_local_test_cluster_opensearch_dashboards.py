@@ -144,14 +144,16 @@ class LocalTestClusterOpenSearchDashboardsTests(unittest.TestCase):
                 123,
                 "test stdout_data",
                 "test stderr_data",
-                mock_log_files_opensearch
+                mock_log_files_opensearch,
+                None
             ),
             call(self.component_name,
                  self.component_test_config,
                  123,
                  "test stdout_data",
                  "test stderr_data",
-                 mock_log_files)
+                 mock_log_files,
+                 None)
         ])
 
         self.assertEqual(mock_local_cluster_logs.save_test_result_data.call_count, 2)
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from typing import Any, List
+from unittest.mock import MagicMock, Mock, call, patch
+
+from system.port_allocator import PortAllocator
+from test_workflow.integ_test.local_test_cluster_pool import LocalTestClusterPool
+
+
+@patch("test_workflow.integ_test.local_test_cluster_pool.LocalTestCluster")
+class TestLocalTestClusterPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dependency_installer = MagicMock()
+        self.bundle_manifest = MagicMock()
+        self.test_recorder = MagicMock()
+        self.port_allocator = MagicMock()
+        self.port_allocator.allocate.side_effect = [[9250 + n, 9350 + n] for n in range(10)]
+
+    def __clusters(self, mock_cluster: Mock) -> List[Any]:
+        clusters = []
+
+        def create(*args: Any, http_port: int, transport_port: int) -> Any:
+            cluster = MagicMock(work_dir=os.path.join(args[1], "local-test-cluster"), port=http_port, endpoint="localhost")
+            clusters.append(cluster)
+            return cluster
+
+        mock_cluster.side_effect = create
+        return clusters
+
+    def test_reuse(self, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder, self.port_allocator) as pool:
+            with pool.cluster("sql", "with-security", True, None) as (endpoint, port):
+                self.assertEqual((endpoint, port), ("localhost", 9250))
+            with pool.cluster("alerting", "with-security", True, {}) as (endpoint, port):
+                self.assertEqual((endpoint, port), ("localhost", 9250))
+
+        self.assertEqual(len(clusters), 1)
+        mock_cluster.assert_called_once_with(
+            self.dependency_installer,
+            os.path.join(pool.work_dir.name, "1"),
+            "sql",
+            None,
+            self.bundle_manifest,
+            True,
+            "with-security",
+            self.test_recorder,
+            http_port=9250,
+            transport_port=9350
+        )
+        clusters[0].start.assert_called_once()
+        clusters[0].reset.assert_called_once()
+        clusters[0].terminate.assert_called_once()
+        self.port_allocator.release.assert_called_once_with([9250, 9350])
+        self.assertEqual((pool.clusters_started, pool.clusters_reused), (1, 1))
+        self.assertFalse(os.path.exists(pool.work_dir.name))
+
+    def test_logs_per_suite(self, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder, self.port_allocator) as pool:
+            with pool.cluster("sql", "with-security", True, None):
+                clusters[0].snapshot.assert_called_once_with()
+            with pool.cluster("alerting", "with-security", True, None):
+                pass
+
+        self.assertEqual(clusters[0].save_logs_for.call_args_list, [call("sql", "with-security"), call("alerting", "with-security")])
+        # the logs were saved for each suite already
+        clusters[0].terminate.assert_called_once_with(False)
+
+    def test_default_ports(self, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder) as pool:
+            with pool.cluster("sql", "with-security", True, None):
+                pass
+            with pool.cluster("sql", "without-security", False, None):
+                # the idle cluster listened on the default ports
+                clusters[0].terminate.assert_called_once()
+            with pool.cluster("alerting", "without-security", False, None):
+                pass
+
+        self.assertEqual(len(clusters), 2)
+        self.assertEqual(mock_cluster.call_args_list[0].args[-1], self.test_recorder)
+        clusters[1].reset.assert_called_once()
+
+    def test_keyed_by_configuration(self, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder, self.port_allocator) as pool:
+            for config, security in [("with-security", True), ("without-security", False), ("with-security", True), ("without-security", False)]:
+                with pool.cluster("sql", config, security, None):
+                    pass
+            with pool.cluster("sql", "with-security", True, {"script.context.field.max_compilations_rate": "1000/1m"}):
+                pass
+
+        self.assertEqual(len(clusters), 3)
+        self.assertEqual([cluster.reset.call_count for cluster in clusters], [1, 1, 0])
+        self.assertEqual([cluster.terminate.call_count for cluster in clusters], [1, 1, 1])
+        # at most 2 idle clusters are kept running, the least recently used is terminated first
+        self.assertEqual(self.port_allocator.release.call_args_list[0].args, ([9250, 9350],))
+
+    def test_in_use(self, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder, self.port_allocator) as pool:
+            with pool.cluster("sql", "with-security", True, None) as (_, first_port):
+                with pool.cluster("alerting", "with-security", True, None) as (_, second_port):
+                    pass
+
+        self.assertEqual(len(clusters), 2)
+        self.assertNotEqual(first_port, second_port)
+
+    def test_reset_failure(self, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder, self.port_allocator) as pool:
+            with pool.cluster("sql", "with-security", True, None):
+                pass
+            clusters[0].reset.side_effect = Exception("cluster is gone")
+            with pool.cluster("alerting", "with-security", True, None) as (_, port):
+                self.assertEqual(port, 9251)
+
+        self.assertEqual(len(clusters), 2)
+        clusters[0].terminate.assert_called_once()
+        clusters[1].terminate.assert_called_once()
+        self.assertEqual(self.port_allocator.release.call_count, 2)
+
+    def test_start_failure(self, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder, self.port_allocator) as pool:
+            mock_cluster.side_effect = None
+            mock_cluster.return_value.start.side_effect = Exception("cluster did not start")
+            with self.assertRaises(Exception) as ctx:
+                with pool.cluster("sql", "with-security", True, None):
+                    pass
+            self.assertEqual(str(ctx.exception), "cluster did not start")
+
+        self.assertEqual(clusters, [])
+        # the logs of a cluster that did not start are saved for the suite that started it
+        mock_cluster.return_value.terminate.assert_called_once_with(True)
+        self.port_allocator.release.assert_called_once_with([9250, 9350])
+
+    @patch.object(PortAllocator, "in_use", side_effect=[[9250], []])
+    def test_start_port_conflict(self, mock_in_use: Mock, mock_cluster: Mock) -> None:
+        clusters = self.__clusters(mock_cluster)
+        with LocalTestClusterPool(self.dependency_installer, self.bundle_manifest, self.test_recorder, self.port_allocator) as pool:
+            def create(*args: Any, http_port: int, transport_port: int) -> Any:
+                cluster = MagicMock(port=http_port, endpoint="localhost")
+                # another process took the first ports before the cluster listened on them
+                if http_port == 9250:
+                    cluster.start.side_effect = Exception("failed to bind to 9250")
+                clusters.append(cluster)
+                return cluster
+
+            mock_cluster.side_effect = create
+            with pool.cluster("sql", "with-security", True, None) as (endpoint, port):
+                self.assertEqual(port, 9251)
+
+        self.assertEqual(len(clusters), 2)
+        clusters[0].terminate.assert_called_once()
+        mock_in_use.assert_called_once_with([9250, 9350])
+        self.assertEqual(self.port_allocator.release.call_args_list[0].args, ([9250, 9350],))
+        self.assertEqual(pool.clusters_started, 2)
+
+    def test_key(self, mock_cluster: Mock) -> None:
+        self.assertEqual(LocalTestClusterPool.key(True, None), LocalTestClusterPool.key(True, {}))
+        self.assertEqual(LocalTestClusterPool.key(True, {"a": 1, "b": 2}), LocalTestClusterPool.key(True, {"b": 2, "a": 1}))
+        self.assertNotEqual(LocalTestClusterPool.key(True, None), LocalTestClusterPool.key(False, None))
@@ -16,6 +16,8 @@ from test_workflow.test_args import TestArgs
 
 
 class TestRunIntegTest(unittest.TestCase):
+    @patch("run_integ_test.ResourceAccounting")
+    @patch("run_integ_test.Tracer")
     @patch(
         "argparse._sys.argv",
         [
@@ -27,6 +29,7 @@ class TestRunIntegTest(unittest.TestCase):
     def test_run_integ_test(self, *mock: Any) -> None:
 
         mock_runner = MagicMock()
+        mock_runner.test_recorder.location = "test-results"
         mock_result = MagicMock()
         mock_result.failed.return_value = False
 
@@ -37,6 +40,9 @@ class TestRunIntegTest(unittest.TestCase):
 
         main()
 
+        mock[0].default.return_value.write.assert_called_once_with(os.path.join("test-results", "trace-integ-test.json"))
+        mock[1].default.return_value.write.assert_called_once_with(os.path.join("test-results", "resources.yml"))
+
         args, kwargs = mock_from_test_manifest.call_args
         self.assertEqual(len(args), 2)
         self.assertEqual(len(kwargs), 0)
@@ -233,6 +233,100 @@ class ServiceOpenSearchTests(unittest.TestCase):
         self.assertEqual(service.endpoint(), "localhost")
         self.assertEqual(service.port(), 9200)
 
+    @patch("test_workflow.integ_test.service.Process.start")
+    @patch('test_workflow.integ_test.service.Process.pid', new_callable=PropertyMock, return_value=12345)
+    @patch("builtins.open", new_callable=mock_open)
+    @patch("yaml.dump")
+    @patch("tarfile.open")
+    def test_start_allocated_ports(self, mock_tarfile_open: Mock, mock_dump: Mock, mock_file: Mock, mock_pid: Mock, mock_process: Mock) -> None:
+        service = ServiceOpenSearch(
+            self.version,
+            self.distribution,
+            self.additional_config,
+            True,
+            MagicMock(),
+            self.work_dir,
+            9250,
+            9350
+        )
+
+        # call test target function
+        service.start()
+
+        mock_dump.assert_has_calls([call(self.additional_config), call({"http.port": 9250, "transport.port": 9350})])
+        self.assertEqual(service.port(), 9250)
+        self.assertEqual(service.url(), "https://localhost:9250")
+
+    @patch("requests.delete")
+    def test_reset(self, mock_requests_delete: Mock) -> None:
+        service = ServiceOpenSearch(
+            self.version,
+            self.distribution,
+            self.additional_config,
+            False,
+            self.dependency_installer,
+            self.work_dir
+        )
+        mock_requests_delete.side_effect = [MagicMock(status_code=200), MagicMock(status_code=404), MagicMock(status_code=404), MagicMock(status_code=200)]
+
+        service.reset()
+
+        mock_requests_delete.assert_has_calls([
+            call("http://localhost:9200/*,-.*?expand_wildcards=open,closed", verify=False, auth=("admin", "admin")),
+            call("http://localhost:9200/_index_template/*", verify=False, auth=("admin", "admin")),
+            call("http://localhost:9200/_component_template/*", verify=False, auth=("admin", "admin")),
+            call("http://localhost:9200/_template/*", verify=False, auth=("admin", "admin"))
+        ])
+
+    @patch("requests.delete")
+    @patch("requests.get")
+    def test_reset_snapshot(self, mock_requests_get: Mock, mock_requests_delete: Mock) -> None:
+        service = ServiceOpenSearch(
+            self.version,
+            self.distribution,
+            self.additional_config,
+            False,
+            self.dependency_installer,
+            self.work_dir
+        )
+        mock_requests_get.side_effect = [
+            MagicMock(status_code=200, json=MagicMock(return_value={"index_templates": [{"name": "ism-history"}]})),
+            MagicMock(status_code=200, json=MagicMock(return_value={"component_templates": []})),
+            MagicMock(status_code=200, json=MagicMock(return_value={"security-auditlog": {}})),
+            MagicMock(status_code=200, json=MagicMock(return_value={"index_templates": [{"name": "test"}, {"name": "ism-history"}]})),
+            MagicMock(status_code=404),
+            MagicMock(status_code=200, json=MagicMock(return_value={"security-auditlog": {}, "legacy": {}})),
+        ]
+        mock_requests_delete.return_value.status_code = 200
+
+        service.snapshot_templates()
+        self.assertEqual(service.templates, {"/_index_template": ["ism-history"], "/_component_template": [], "/_template": ["security-auditlog"]})
+        service.reset()
+
+        # the templates that existed when the service started are kept
+        self.assertEqual(mock_requests_delete.call_args_list, [
+            call("http://localhost:9200/*,-.*?expand_wildcards=open,closed", verify=False, auth=("admin", "admin")),
+            call("http://localhost:9200/_index_template/test", verify=False, auth=("admin", "admin")),
+            call("http://localhost:9200/_template/legacy", verify=False, auth=("admin", "admin"))
+        ])
+        mock_requests_get.assert_called_with("http://localhost:9200/_template", verify=False, auth=("admin", "admin"))
+
+    @patch("requests.delete")
+    def test_reset_failure(self, mock_requests_delete: Mock) -> None:
+        service = ServiceOpenSearch(
+            self.version,
+            self.distribution,
+            self.additional_config,
+            True,
+            self.dependency_installer,
+            self.work_dir
+        )
+        mock_requests_delete.return_value.status_code = 500
+        mock_requests_delete.return_value.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+
+        with self.assertRaises(requests.HTTPError):
+            service.reset()
+
     def test_url_security_enabled(self) -> None:
         service = ServiceOpenSearch(
             self.version,
@@ -299,18 +393,16 @@ class ServiceOpenSearchTests(unittest.TestCase):
         mock_time_sleep.assert_not_called()
         mock_process_stdout_data.assert_not_called()
         mock_process_stderr_data.assert_not_called()
+        self.assertIsNotNone(service.time_to_ready)
 
-    @patch("time.sleep")
+    @patch("time.time")
+    @patch("threading.Event.wait", return_value=False)
     @patch.object(ServiceOpenSearch, "service_alive", return_value=False)
-    @patch('test_workflow.integ_test.service.Process.stdout_data', new_callable=PropertyMock, return_value="test stdout_data")
-    @patch('test_workflow.integ_test.service.Process.stderr_data', new_callable=PropertyMock, return_value="test stderr_data")
-    def test_wait_for_service_always_fail_without_exception(
-        self,
-        mock_process_stderr_data: Mock,
-        mock_process_stdout_data: Mock,
-        mock_service_alive: Mock,
-        mock_time_sleep: Mock
-    ) -> None:
+    def test_wait_for_service_always_fail_without_exception(self, mock_service_alive: Mock, mock_wait: Mock, mock_time: Mock) -> None:
+        clock = [0.0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_wait.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
         service = ServiceOpenSearch(
             self.version,
             self.distribution,
@@ -323,24 +415,22 @@ class ServiceOpenSearchTests(unittest.TestCase):
         with self.assertRaises(ClusterCreationException) as ctx:
             service.wait_for_service()
 
-        self.assertEqual(str(ctx.exception), "Cluster is not available after 10 attempts")
-
-        self.assertEqual(mock_service_alive.call_count, 10)
-        self.assertEqual(mock_time_sleep.call_count, 10)
-        mock_process_stdout_data.assert_not_called()
-        mock_process_stderr_data.assert_not_called()
-
-    @patch("time.sleep")
+        self.assertEqual(str(ctx.exception), f"Cluster is not available after 120.0s and {mock_service_alive.call_count} attempts")
+        self.assertEqual(clock[0], 120)
+        # probes back off exponentially from 0.1s to 5s
+        delays = [c.args[0] for c in mock_wait.call_args_list]
+        self.assertEqual([round(delay, 1) for delay in delays[:7]], [0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 5])
+        self.assertTrue(all(delay <= 5 for delay in delays))
+        self.assertIsNone(service.time_to_ready)
+
+    @patch.dict(os.environ, {"SERVICE_READY_TIMEOUT": "2"})
+    @patch("time.time")
+    @patch("threading.Event.wait", return_value=False)
     @patch.object(ServiceOpenSearch, "service_alive", side_effect=requests.exceptions.ConnectionError())
-    @patch('test_workflow.integ_test.service.Process.stdout_data', new_callable=PropertyMock, return_value="test stdout_data")
-    @patch('test_workflow.integ_test.service.Process.stderr_data', new_callable=PropertyMock, return_value="test stderr_data")
-    def test_wait_for_service_always_fail_with_exception(
-        self,
-        mock_process_stderr_data: Mock,
-        mock_process_stdout_data: Mock,
-        mock_service_alive: Mock,
-        mock_time_sleep: Mock
-    ) -> None:
+    def test_wait_for_service_always_fail_with_exception(self, mock_service_alive: Mock, mock_wait: Mock, mock_time: Mock) -> None:
+        clock = [0.0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_wait.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
 
         service = ServiceOpenSearch(
             self.version,
@@ -354,27 +444,20 @@ class ServiceOpenSearchTests(unittest.TestCase):
         with self.assertRaises(ClusterCreationException) as ctx:
             service.wait_for_service()
 
-        self.assertEqual(str(ctx.exception), "Cluster is not available after 10 attempts")
+        self.assertEqual(str(ctx.exception), "Cluster is not available after 2.0s and 6 attempts")
+        self.assertEqual(mock_service_alive.call_count, 6)
 
-        self.assertEqual(mock_service_alive.call_count, 10)
-        self.assertEqual(mock_time_sleep.call_count, 10)
-        self.assertEqual(mock_process_stdout_data.call_count, 10)
-        self.assertEqual(mock_process_stderr_data.call_count, 10)
-
-    @patch("time.sleep")
+    @patch("time.time")
+    @patch("threading.Event.wait", return_value=False)
     @patch.object(
         ServiceOpenSearch,
         "service_alive",
         side_effect=[requests.exceptions.ConnectionError(), requests.exceptions.ConnectionError(), True])
-    @patch('test_workflow.integ_test.service.Process.stdout_data', new_callable=PropertyMock, return_value="test stdout_data")
-    @patch('test_workflow.integ_test.service.Process.stderr_data', new_callable=PropertyMock, return_value="test stderr_data")
-    def test_wait_for_service_suceed_on_third_attempt(
-        self,
-        mock_process_stderr_data: Mock,
-        mock_process_stdout_data: Mock,
-        mock_service_alive: Mock,
-        mock_time_sleep: Mock
-    ) -> None:
+    def test_wait_for_service_suceed_on_third_attempt(self, mock_service_alive: Mock, mock_wait: Mock, mock_time: Mock) -> None:
+        clock = [0.0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_wait.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
         service = ServiceOpenSearch(
             self.version,
             self.distribution,
@@ -387,9 +470,36 @@ class ServiceOpenSearchTests(unittest.TestCase):
         service.wait_for_service()
 
         self.assertEqual(mock_service_alive.call_count, 3)
-        self.assertEqual(mock_time_sleep.call_count, 2)
-        self.assertEqual(mock_process_stdout_data.call_count, 2)
-        self.assertEqual(mock_process_stderr_data.call_count, 2)
+        self.assertEqual(mock_wait.call_count, 2)
+        self.assertAlmostEqual(service.time_to_ready, 0.3)
+
+    @patch("time.sleep")
+    @patch.object(ServiceOpenSearch, "service_alive", side_effect=[False, False, False, False, False, True])
+    def test_wait_for_service_ready_marker(self, mock_service_alive: Mock, mock_time_sleep: Mock) -> None:
+        service = ServiceOpenSearch(
+            self.version,
+            self.distribution,
+            self.additional_config,
+            True,
+            self.dependency_installer,
+            self.work_dir
+        )
+
+        lines = iter(["[INFO ][o.o.n.Node] [node] starting ...", "[INFO ][o.o.n.Node] [node] started"])
+        delays = []
+
+        def wait(seconds: float) -> bool:
+            delays.append(seconds)
+            for callback in service.process_handler.stdout_callbacks:
+                callback(next(lines, ""))
+            return service.ready.is_set()
+
+        with patch.object(service.ready, "wait", side_effect=wait):
+            service.wait_for_service()
+
+        # the service is probed right away once the node logged that it started, then the backoff starts over
+        self.assertEqual(delays, [0.1, 0.2])
+        self.assertEqual([c.args[0] for c in mock_time_sleep.call_args_list], [0.1, 0.2, 0.4])
 
     @patch.object(ServiceOpenSearch, "get_service_response")
     def test_service_alive_green_available(self, mock_get_service_response: Mock) -> None:
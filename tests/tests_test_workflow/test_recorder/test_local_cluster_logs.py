@@ -9,7 +9,11 @@ import os
 import unittest
 from unittest.mock import MagicMock
 
+import yaml
+
+from system.temporary_directory import TemporaryDirectory
 from test_workflow.test_recorder.test_recorder import LocalClusterLogs
+from test_workflow.test_recorder.test_result_data import TestResultData
 
 
 class TestLocalClusterLogs(unittest.TestCase):
@@ -36,7 +40,19 @@ class TestLocalClusterLogs(unittest.TestCase):
         }
         mock_test_result_data.component_name = "sql"
         mock_test_result_data.component_test_config = "with-security"
+        mock_test_result_data.time_to_ready = None
 
         logs.save_test_result_data(mock_test_result_data)
 
         mock_parent_class._copy_log_files.assert_called_once_with(mock_test_result_data.log_files, dest_directory)
+
+    def test_time_to_ready(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            mock_parent_class = MagicMock()
+            mock_parent_class._create_base_folder_structure.return_value = work_dir.name
+
+            logs = LocalClusterLogs(mock_parent_class)
+            logs.save_test_result_data(TestResultData("sql", "with-security", 0, "", "", {}, 12.3456))
+
+            with open(os.path.join(work_dir.name, "local-cluster-logs", "startup.yml")) as f:
+                self.assertEqual(yaml.safe_load(f), {"time_to_ready": 12.346})
@@ -134,6 +134,18 @@ class TestTestArgs(unittest.TestCase):
         test_args = TestArgs()
         self.assertEqual(test_args.test_run_id, 6)
         self.assertEqual(test_args.test_manifest_path, self.TEST_MANIFEST_PATH)
+        self.assertEqual(test_args.parallel, 1)
+        self.assertFalse(test_args.reuse_cluster)
+
+    @patch("argparse._sys.argv", [ARGS_PY, TEST_MANIFEST_PATH, "--paths", "opensearch=" + TEST_MANIFEST_PATH, "--parallel", "4"])
+    def test_parallel(self) -> None:
+        test_args = TestArgs()
+        self.assertEqual(test_args.parallel, 4)
+
+    @patch("argparse._sys.argv", [ARGS_PY, TEST_MANIFEST_PATH, "--paths", "opensearch=" + TEST_MANIFEST_PATH, "--reuse-cluster"])
+    def test_reuse_cluster(self) -> None:
+        test_args = TestArgs()
+        self.assertTrue(test_args.reuse_cluster)
 
     @patch("argparse._sys.argv", [ARGS_PY, TEST_MANIFEST_PATH, "--paths", "opensearch=" + TEST_MANIFEST_PATH, "--verbose"])
     def test_verbose(self) -> None: